@@ -0,0 +1,400 @@
+"""
+Benchmark suite for the PhysicsEngine and the GUI hot paths.
+
+Runs every PhysicsEngine method and each field/potential backend over a
+range of particle counts N, probe counts M and seeded workloads, and
+writes the timings to JSON. Methods affected by the engine's precision
+mode are timed in each mode, together with their error relative to the
+compensated result. A previous results file can be passed with --compare
+to flag regressions.
+
+Usage:
+    python benchmarks.py --output results.json
+    python benchmarks.py --sizes 10,100,1000 --compare baseline.json
+    python benchmarks.py --workloads pairs --precisions float32,double,compensated
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import tkinter as tk
+
+from electromagnetism import (
+    ElectrostaticsCalculator,
+    Particle,
+    ParticleMeshSolver,
+    PhysicsEngine,
+)
+from workload_generator import WORKLOADS, generate
+
+
+BACKENDS = ("direct", "pm", "p3m")
+PRECISIONS = PhysicsEngine.PRECISIONS
+
+
+def make_workload(kind, n, seed):
+    """Build a reproducible list of n particles for the given workload."""
+    return [
+        Particle(x, y, abs(q), "proton" if q > 0 else "electron")
+        for x, y, q in generate(kind, n, seed)
+    ]
+
+
+def make_points(m, seed):
+    """Build m reproducible probe points over the visible plane."""
+    rng = random.Random(f"points:{m}:{seed}")
+    return [(rng.uniform(-20, 20), rng.uniform(-15, 15)) for _ in range(m)]
+
+
+def time_call(func, repeat):
+    """Return (best, mean) wall time of func over repeat runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), sum(times) / len(times)
+
+
+def relative_error(values, reference):
+    """
+    Largest deviation from the reference, relative to the largest reference
+    magnitude, so points where the reference is near zero do not dominate.
+    Values may be numbers or tuples of components; None entries are skipped.
+    """
+    worst = scale = 0.0
+    for value, ref in zip(values, reference):
+        if value is None or ref is None:
+            continue
+        if not isinstance(ref, tuple):
+            value, ref = (value,), (ref,)
+        worst = max(worst, math.hypot(*(a - b for a, b in zip(value, ref))))
+        scale = max(scale, math.hypot(*ref))
+    return worst / scale if scale else worst
+
+
+class StubWidget:
+    """Accepts and ignores any widget call."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class StubCanvas(StubWidget):
+    """Canvas stand-in that hands out item IDs without drawing."""
+
+    def __init__(self):
+        self.next_id = 0
+
+    def _create(self, *args, **kwargs):
+        self.next_id += 1
+        return self.next_id
+
+    create_oval = create_text = create_line = create_rectangle = _create
+
+
+def make_headless_app():
+    """
+    Return (app, mode) for benchmarking GUI methods.
+
+    Uses a real, withdrawn Tk window when a display is available and
+    otherwise an ElectrostaticsCalculator with a stubbed canvas.
+    """
+    try:
+        app = ElectrostaticsCalculator()
+        app.root.withdraw()
+        return app, "tk"
+    except tk.TclError:
+        pass
+
+    app = ElectrostaticsCalculator.__new__(ElectrostaticsCalculator)
+    app.CANVAS_WIDTH = 800
+    app.CANVAS_HEIGHT = 600
+    app.GRID_SCALE = 20
+    app.GRID_SPACING = 40
+    app.PARTICLE_RADIUS = 8
+    app.MAX_UNDO_STACK = 50
+    app.particles = []
+    app.distributions = []
+    app.journal = None
+    app.conductors = []
+    app.undo_stack = []
+    app.redo_stack = []
+    app.canvas = StubCanvas()
+    app.undo_btn = app.redo_btn = app.status_label = StubWidget()
+    return app, "stub"
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmark cases and collects their results.
+
+    Cases whose estimated work exceeds max_work pair evaluations are
+    recorded as skipped instead of run, so large N stays tractable.
+    """
+
+    def __init__(self, sizes, points, workloads, backends, repeat, seed, max_work,
+                 precisions=("double",)):
+        self.sizes = sizes
+        self.points = points
+        self.workloads = workloads
+        self.backends = backends
+        self.repeat = repeat
+        self.seed = seed
+        self.max_work = max_work
+        self.precisions = precisions
+        self.engine = PhysicsEngine()
+        self.engines = {precision: PhysicsEngine(precision=precision) for precision in precisions}
+        self.reference = PhysicsEngine(precision="compensated")
+        self.results = []
+
+    def record(self, name, backend, workload, n, m, func, work, precision="double",
+               reference=None):
+        """
+        Time one case, or record it as skipped if it is too large.
+
+        With a reference callable, the case's result is also compared
+        against it and the relative error is stored.
+        """
+        entry = {
+            'name': name, 'backend': backend, 'workload': workload,
+            'n': n, 'm': m, 'precision': precision,
+        }
+        if work > self.max_work:
+            entry['skipped'] = f"estimated work {work:.1e} exceeds --max-work"
+        else:
+            best, mean = time_call(func, self.repeat)
+            entry['seconds'] = best
+            entry['mean_seconds'] = mean
+            if reference is not None:
+                entry['relative_error'] = relative_error(func(), reference())
+        self.results.append(entry)
+        self.report(entry)
+
+    def report(self, entry):
+        label = f"{entry['name']:<22} {entry['backend']:<7} {entry['precision']:<11} " \
+                f"{entry['workload']:<10} N={entry['n']:<8} M={entry['m']:<6}"
+        if 'skipped' in entry:
+            print(f"{label} skipped")
+        elif 'relative_error' in entry:
+            print(f"{label} {entry['seconds'] * 1000:10.3f} ms  error {entry['relative_error']:.1e}")
+        else:
+            print(f"{label} {entry['seconds'] * 1000:10.3f} ms")
+        sys.stdout.flush()
+
+    def cached_reference(self, func):
+        """Wrap a reference computation so it runs at most once."""
+        cache = []
+
+        def reference():
+            if not cache:
+                cache.append(func())
+            return cache[0]
+        return reference
+
+    def run(self):
+        for workload in self.workloads:
+            for n in self.sizes:
+                particles = make_workload(workload, n, self.seed)
+                self.run_engine(workload, particles)
+                self.run_backends(workload, particles)
+                self.run_gui(workload, particles)
+        return self.results
+
+    def run_engine(self, workload, particles):
+        """Single-point and whole-system PhysicsEngine methods."""
+        n = len(particles)
+        x, y = 0.123, -0.456
+        energy_reference = self.cached_reference(
+            lambda: self.reference.calc_potential_energy(particles)
+        )
+
+        for precision, engine in self.engines.items():
+            self.record("electric_field", "direct", workload, n, 1,
+                        lambda: engine.calc_electric_field(particles, x, y), n, precision)
+            self.record("electric_potential", "direct", workload, n, 1,
+                        lambda: engine.calc_electric_potential(particles, x, y), n, precision)
+            self.record("force_on_charge", "direct", workload, n, 1,
+                        lambda: engine.calc_force_on_charge(particles, 1e-9, x, y), n, precision)
+            self.record("potential_energy", "direct", workload, n, 0,
+                        lambda: [engine.calc_potential_energy(particles)], n * (n - 1) / 2,
+                        precision, lambda: [energy_reference()])
+
+        engine = self.engine
+        self.record("electric_flux", "direct", workload, n, 0,
+                    lambda: engine.calc_electric_flux(particles, 0, 0, 5), n)
+        self.record("dipole_moment", "direct", workload, n, 0,
+                    lambda: engine.calc_dipole_moment(particles), n)
+
+    def run_backends(self, workload, particles):
+        """Batched field and potential for every backend."""
+        n = len(particles)
+        for backend_name in self.backends:
+            if backend_name == "direct":
+                # The direct backend runs in every precision mode
+                backends = self.engines
+            else:
+                backends = {"double": ParticleMeshSolver(self.engine, p3m=(backend_name == "p3m"))}
+
+            for m in self.points:
+                points = make_points(m, self.seed)
+                # Mesh cost grows with N + M, direct cost with N * M
+                work = n * m if backend_name == "direct" else n + m
+                field_reference = potential_reference = None
+                if n * m <= self.max_work:  # The reference is always a direct sum
+                    field_reference = self.cached_reference(
+                        lambda: self.reference.calc_field_at_points(particles, points)
+                    )
+                    potential_reference = self.cached_reference(
+                        lambda: self.reference.calc_potential_at_points(particles, points)
+                    )
+                for precision, backend in backends.items():
+                    self.record("field_at_points", backend_name, workload, n, m,
+                                lambda: backend.calc_field_at_points(particles, points), work,
+                                precision, field_reference)
+                    self.record("potential_at_points", backend_name, workload, n, m,
+                                lambda: backend.calc_potential_at_points(particles, points), work,
+                                precision, potential_reference)
+
+    def run_gui(self, workload, particles):
+        """Configuration save/load and undo redraw cost."""
+        n = len(particles)
+        app, mode = make_headless_app()
+        backend = f"gui-{mode}"
+        state = {'particles': [p.to_dict() for p in particles]}
+        app.restore_state(state)
+
+        handle, filename = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        try:
+            self.record("save_configuration", backend, workload, n, 0,
+                        lambda: app.write_configuration(filename), n)
+            self.record("load_configuration", backend, workload, n, 0,
+                        lambda: app.read_configuration(filename), n)
+            self.record("restore_state", backend, workload, n, 0,
+                        lambda: app.restore_state(state), n)
+        finally:
+            os.remove(filename)
+            if mode == "tk":
+                app.root.destroy()
+
+
+def case_key(entry):
+    # Results from before precision modes were all double precision, and
+    # float32 storage was called "fast" before it was renamed
+    precision = entry.get('precision', 'double')
+    return (entry['name'], entry['backend'], entry['workload'], entry['n'], entry['m'],
+            "float32" if precision == "fast" else precision)
+
+
+def compare(results, baseline, threshold, min_seconds):
+    """
+    Compare results against a baseline run.
+
+    Returns a list of regressions: cases that are slower than the baseline
+    by more than the threshold fraction. Cases faster than min_seconds in
+    both runs are timer noise and never count as regressions.
+    """
+    base = {case_key(e): e for e in baseline['results'] if 'seconds' in e}
+    regressions = []
+
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for entry in results:
+        old = base.get(case_key(entry))
+        if old is None or 'seconds' not in entry:
+            continue
+        ratio = entry['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+        entry['baseline_seconds'] = old['seconds']
+        entry['ratio'] = ratio
+        if ratio > 1 + threshold and entry['seconds'] >= min_seconds:
+            regressions.append(entry)
+            print(f"  REGRESSION {entry['name']} {entry['backend']} {entry['precision']} {entry['workload']} "
+                  f"N={entry['n']} M={entry['m']}: {ratio:.2f}x slower")
+
+    if not regressions:
+        print("  No regressions")
+    return regressions
+
+
+def parse_list(text, convert=str):
+    return [convert(item) for item in text.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the electrostatics engine and GUI")
+    parser.add_argument("--sizes", default="10,100,1000,10000",
+                        help="comma-separated particle counts N (up to 1000000)")
+    parser.add_argument("--points", default="1,100,1000",
+                        help="comma-separated probe point counts M")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--precisions", default=",".join(PRECISIONS),
+                        help="engine precision modes to time and compare")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-work", type=float, default=2e7,
+                        help="skip cases with more pair evaluations than this")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="slowdown fraction that counts as a regression")
+    parser.add_argument("--min-seconds", type=float, default=1e-3,
+                        help="ignore regressions in cases faster than this")
+    args = parser.parse_args(argv)
+
+    precisions = parse_list(args.precisions)
+    for precision in precisions:
+        if precision not in PRECISIONS:
+            parser.error(f"unknown precision: {precision}")
+
+    runner = BenchmarkRunner(
+        sizes=parse_list(args.sizes, int),
+        points=parse_list(args.points, int),
+        workloads=parse_list(args.workloads),
+        backends=parse_list(args.backends),
+        repeat=args.repeat,
+        seed=args.seed,
+        max_work=args.max_work,
+        precisions=precisions,
+    )
+    for workload in runner.workloads:
+        if workload not in WORKLOADS:
+            parser.error(f"unknown workload: {workload}")
+    for backend in runner.backends:
+        if backend not in BACKENDS:
+            parser.error(f"unknown backend: {backend}")
+
+    results = runner.run()
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_seconds)
+
+    output = {
+        'metadata': {
+            'created': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'arguments': vars(args),
+        },
+        'results': results,
+        'regressions': [case_key(e) for e in regressions],
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
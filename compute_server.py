@@ -0,0 +1,517 @@
+"""
+Local JSON-RPC compute service for the electrostatics engine.
+
+Serves PhysicsEngine over HTTP on localhost so other tools can use it
+without the Tk application. Particle configurations are uploaded once
+under a name and kept in memory; later requests send only the name and
+their query points. The server speaks HTTP/1.1 with persistent
+connections, so clients may keep a connection open and pipeline
+requests, and it accepts JSON-RPC 2.0 batch arrays.
+
+Usage:
+    python compute_server.py serve --port 8765
+    python compute_server.py loadtest --url http://127.0.0.1:8765 --connections 4
+
+Example request:
+    {"jsonrpc": "2.0", "id": 1, "method": "potential",
+     "params": {"name": "demo", "points": [[0, 0], [1, 2]]}}
+"""
+
+import argparse
+import json
+import math
+import random
+import socket
+import sys
+import threading
+import time
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from electromagnetism import (
+    PROFILER,
+    ChargeDistribution,
+    Conductor,
+    ConductorSolver,
+    Particle,
+    ParticleMeshSolver,
+    PhysicsEngine,
+)
+
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class RPCError(Exception):
+    """An error reported to the client as a JSON-RPC error object."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def particle_from_json(data):
+    """
+    Build a Particle from either a configuration-file dict or a compact
+    [x, y, signed_charge] triple.
+    """
+    if isinstance(data, dict):
+        return Particle.from_dict(data)
+    x, y, q = data
+    return Particle(float(x), float(y), abs(float(q)), "proton" if q >= 0 else "electron")
+
+
+class ComputeService:
+    """
+    Holds named configurations and dispatches JSON-RPC methods.
+
+    Each stored configuration keeps its particles together with any
+    conductor surface charges solved at upload time, so field queries
+    reuse them without re-solving.
+    """
+
+    BACKENDS = ("direct", "pm", "p3m", "auto")
+
+    def __init__(self, engine=None):
+        self.engine = engine or PhysicsEngine()
+        self.configurations = {}
+        self.lock = threading.Lock()
+        self.methods = {
+            'upload_configuration': self.upload_configuration,
+            'drop_configuration': self.drop_configuration,
+            'list_configurations': self.list_configurations,
+            'field': self.field,
+            'potential': self.potential,
+            'force': self.force,
+            'energy': self.energy,
+            'flux': self.flux,
+            'dipole': self.dipole,
+            'stats': self.stats,
+        }
+
+    # ----- Dispatch -----
+
+    def handle_payload(self, payload):
+        """
+        Handle a decoded JSON-RPC request or batch.
+
+        Returns the response object, a list of responses for a batch, or
+        None when only notifications were sent.
+        """
+        if isinstance(payload, list):
+            if not payload:
+                return self.error_response(None, INVALID_REQUEST, "Empty batch")
+            responses = [self.handle_request(item) for item in payload]
+            responses = [r for r in responses if r is not None]
+            return responses or None
+        return self.handle_request(payload)
+
+    def handle_request(self, request):
+        """Handle a single JSON-RPC request object."""
+        if not isinstance(request, dict) or request.get('jsonrpc') != "2.0" \
+                or not isinstance(request.get('method'), str):
+            return self.error_response(None, INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
+
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+        method = self.methods.get(request['method'])
+
+        try:
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            params = request.get('params', {})
+            if isinstance(params, list):
+                result = method(*params)
+            elif isinstance(params, dict):
+                result = method(**params)
+            else:
+                raise RPCError(INVALID_PARAMS, "params must be an object or array")
+        except RPCError as e:
+            response = self.error_response(request_id, e.code, e.message)
+        except (TypeError, ValueError, KeyError) as e:
+            response = self.error_response(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            response = self.error_response(request_id, SERVER_ERROR, str(e))
+        else:
+            response = {'jsonrpc': "2.0", 'id': request_id, 'result': result}
+
+        return None if is_notification else response
+
+    def error_response(self, request_id, code, message):
+        return {'jsonrpc': "2.0", 'id': request_id, 'error': {'code': code, 'message': message}}
+
+    def get_sources(self, name):
+        with self.lock:
+            config = self.configurations.get(name)
+        if config is None:
+            raise RPCError(SERVER_ERROR, f"Unknown configuration: {name}")
+        return config['sources']
+
+    def get_backend(self, backend, source_count=0, point_count=0):
+        if backend not in self.BACKENDS:
+            raise RPCError(INVALID_PARAMS, f"Unknown backend: {backend}")
+        if backend == "auto":
+            # P3M only once it beats direct summation
+            backend = "p3m" if ParticleMeshSolver.is_preferred(source_count, point_count) else "direct"
+        if backend == "direct":
+            return self.engine
+        # Mesh solvers keep per-solve state, so each request gets its own
+        return ParticleMeshSolver(self.engine, p3m=(backend == "p3m"))
+
+    # ----- Methods -----
+
+    def upload_configuration(self, name, particles, conductors=(), distributions=()):
+        """Store (or replace) a named configuration."""
+        particle_list = [particle_from_json(p) for p in particles]
+        distribution_list = [ChargeDistribution.from_dict(d) for d in distributions]
+        conductor_list = [Conductor.from_dict(c) for c in conductors]
+        sources = particle_list + distribution_list
+
+        report = None
+        if conductor_list:
+            solver = ConductorSolver(self.engine)
+            sources = sources + solver.solve(conductor_list, sources)
+            report = solver.last_report
+
+        with self.lock:
+            self.configurations[name] = {
+                'particles': particle_list,
+                'distributions': distribution_list,
+                'conductors': conductor_list,
+                'sources': sources,
+            }
+
+        return {
+            'name': name,
+            'particle_count': len(particle_list),
+            'distribution_count': len(distribution_list),
+            'conductor_count': len(conductor_list),
+            'conductor_solve': report,
+        }
+
+    def drop_configuration(self, name):
+        with self.lock:
+            removed = self.configurations.pop(name, None)
+        return removed is not None
+
+    def list_configurations(self):
+        with self.lock:
+            return {
+                name: {
+                    'particle_count': len(config['particles']),
+                    'distribution_count': len(config['distributions']),
+                    'conductor_count': len(config['conductors']),
+                }
+                for name, config in self.configurations.items()
+            }
+
+    def field(self, name, points, backend="direct"):
+        """Electric field [e_x, e_y] at each point, or null on a charge."""
+        sources = self.get_sources(name)
+        points = self.parse_points(points)
+        results = self.get_backend(backend, len(sources), len(points)).calc_field_at_points(sources, points)
+        return [list(e) if e is not None else None for e in results]
+
+    def potential(self, name, points, backend="direct"):
+        """Electric potential at each point, or null on a charge."""
+        sources = self.get_sources(name)
+        points = self.parse_points(points)
+        return self.get_backend(backend, len(sources), len(points)).calc_potential_at_points(sources, points)
+
+    def force(self, name, test_charge, points, backend="direct"):
+        """Force [f_x, f_y] on a test charge placed at each point."""
+        fields = self.field(name, points, backend)
+        return [[test_charge * e[0], test_charge * e[1]] if e is not None else None for e in fields]
+
+    def energy(self, name):
+        """Total electrostatic potential energy of the configuration."""
+        return self.engine.calc_potential_energy(self.get_sources(name))
+
+    def flux(self, name, surfaces):
+        """Enclosed charge and flux for each [center_x, center_y, radius]."""
+        sources = self.get_sources(name)
+        results = []
+        for center_x, center_y, radius in surfaces:
+            enclosed, flux = self.engine.calc_electric_flux(sources, center_x, center_y, radius)
+            results.append({'enclosed_charge': enclosed, 'flux': flux})
+        return results
+
+    def dipole(self, name):
+        p_x, p_y, magnitude, total_charge = self.engine.calc_dipole_moment(self.get_sources(name))
+        return {'p_x': p_x, 'p_y': p_y, 'magnitude': magnitude, 'total_charge': total_charge}
+
+    def stats(self):
+        """Profiler statistics, when the server runs with profiling enabled."""
+        return {'enabled': PROFILER.enabled, 'stats': PROFILER.snapshot()}
+
+    def parse_points(self, points):
+        parsed = []
+        for point in points:
+            x, y = point
+            parsed.append((float(x), float(y)))
+        return parsed
+
+
+class RPCRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP/1.1 handler: one JSON-RPC payload per POST.
+
+    BaseHTTPRequestHandler serves requests on a connection one after
+    another, so pipelined requests are answered in order.
+    """
+
+    protocol_version = "HTTP/1.1"
+    service = None  # Set by make_server
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        if length > MAX_BODY_BYTES:
+            self.send_error(413, "Request body too large")
+            return
+
+        body = self.rfile.read(length)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            response = self.service.error_response(None, PARSE_ERROR, "Parse error")
+        else:
+            response = self.service.handle_payload(payload)
+
+        data = b"" if response is None else json.dumps(response).encode()
+        self.send_response(200 if response is not None else 204)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep the console quiet under load
+
+
+def make_server(host="127.0.0.1", port=8765, service=None):
+    """Create (but do not start) a threaded HTTP JSON-RPC server."""
+    handler = type("BoundRPCRequestHandler", (RPCRequestHandler,),
+                   {'service': service or ComputeService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+class ComputeClient:
+    """
+    Minimal client holding one persistent connection to the server.
+
+    call() sends one request and waits for its response; pipeline() writes
+    several requests before reading any response.
+    """
+
+    def __init__(self, url="http://127.0.0.1:8765", timeout=60):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self.connection = HTTPConnection(self.host, self.port, timeout=timeout)
+        self.next_id = 0
+        self.socket = None
+        self.reader = None
+
+    def make_request(self, method, **params):
+        self.next_id += 1
+        return {'jsonrpc': "2.0", 'id': self.next_id, 'method': method, 'params': params}
+
+    def call(self, method, **params):
+        """Call one method and return its result, raising RPCError on error."""
+        body = json.dumps(self.make_request(method, **params))
+        self.connection.request("POST", "/", body, {'Content-Type': 'application/json'})
+        response = json.loads(self.connection.getresponse().read())
+        if 'error' in response:
+            raise RPCError(response['error']['code'], response['error']['message'])
+        return response['result']
+
+    def pipeline(self, requests):
+        """
+        Send JSON-RPC request objects back to back on a raw keep-alive
+        socket, then read the responses in order.
+
+        Returns a list of (response, latency_seconds), where latency runs
+        from when the request was written to when its response arrived.
+        """
+        if self.socket is None:
+            self.socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            self.reader = self.socket.makefile('rb')
+
+        sent = []
+        chunks = []
+        for request in requests:
+            body = json.dumps(request).encode()
+            chunks.append(
+                b"POST / HTTP/1.1\r\nHost: " + self.host.encode() +
+                b"\r\nContent-Type: application/json\r\nContent-Length: " +
+                str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+        for chunk in chunks:
+            self.socket.sendall(chunk)
+            sent.append(time.perf_counter())
+
+        results = []
+        for start in sent:
+            status = self.reader.readline()
+            if not status:
+                raise ConnectionError("Server closed the connection")
+            length = 0
+            while True:
+                line = self.reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            body = self.reader.read(length)
+            results.append((json.loads(body) if body else None, time.perf_counter() - start))
+        return results
+
+    def close(self):
+        self.connection.close()
+        if self.socket is not None:
+            self.reader.close()
+            self.socket.close()
+            self.socket = None
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_load_test(url, connections, requests, points, particles, pipeline_depth,
+                  method, backend, seed):
+    """
+    Upload a random configuration, then drive the server from several
+    persistent connections and report latency percentiles and throughput.
+    """
+    rng = random.Random(seed)
+    setup = ComputeClient(url)
+    setup.call(
+        "upload_configuration", name="loadtest",
+        particles=[[rng.uniform(-20, 20), rng.uniform(-15, 15), rng.choice((1, -1)) * 1e-9]
+                   for _ in range(particles)],
+    )
+    setup.close()
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        client = ComputeClient(url)
+        worker_rng = random.Random(f"{seed}:{worker_id}")
+        local = []
+        local_errors = 0
+        remaining = requests
+        try:
+            while remaining > 0:
+                depth = min(pipeline_depth, remaining)
+                batch = []
+                for _ in range(depth):
+                    query = [[worker_rng.uniform(-20, 20), worker_rng.uniform(-15, 15)]
+                             for _ in range(points)]
+                    batch.append(client.make_request(method, name="loadtest",
+                                                     points=query, backend=backend))
+                for response, latency in client.pipeline(batch):
+                    local.append(latency)
+                    if response is None or 'error' in response:
+                        local_errors += 1
+                remaining -= depth
+        finally:
+            client.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += local_errors
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'connections': connections,
+        'requests': len(latencies),
+        'errors': errors[0],
+        'points_per_request': points,
+        'particles': particles,
+        'pipeline_depth': pipeline_depth,
+        'method': method,
+        'backend': backend,
+        'elapsed_seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'points_per_second': len(latencies) * points / elapsed if elapsed else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 0.50) * 1000,
+            'p90': percentile(latencies, 0.90) * 1000,
+            'p99': percentile(latencies, 0.99) * 1000,
+            'max': (latencies[-1] * 1000) if latencies else 0.0,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Electrostatics JSON-RPC compute service")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run the compute server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--profile", action="store_true", help="enable instrumentation")
+
+    load = commands.add_parser("loadtest", help="measure server latency and throughput")
+    load.add_argument("--url", default="http://127.0.0.1:8765")
+    load.add_argument("--connections", type=int, default=4)
+    load.add_argument("--requests", type=int, default=100, help="requests per connection")
+    load.add_argument("--points", type=int, default=100, help="query points per request")
+    load.add_argument("--particles", type=int, default=1000)
+    load.add_argument("--pipeline", type=int, default=1, help="requests in flight per connection")
+    load.add_argument("--method", choices=("field", "potential"), default="field")
+    load.add_argument("--backend", choices=ComputeService.BACKENDS, default="direct")
+    load.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        if args.profile:
+            PROFILER.enabled = True
+        server = make_server(args.host, args.port)
+        print(f"Serving JSON-RPC on http://{args.host}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    report = run_load_test(
+        args.url, args.connections, args.requests, args.points, args.particles,
+        args.pipeline, args.method, args.backend, args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,153 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
 import itertools
 import math
+import cmath
 import json
 import copy
+import csv
+import functools
+import operator
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
 from datetime import datetime
 
 
+class Profiler:
+    """
+    Opt-in instrumentation for engine calls, canvas operations and Tk event
+    handlers.
+
+    Functions decorated with @instrumented report their wall time and
+    particle/point counts here while enabled is True. When disabled, the
+    decorator only checks the flag and calls straight through. Set the
+    ELECTROSTATICS_PROFILE environment variable to 1, true or yes to
+    enable it at startup.
+
+    Event handlers are timed from entry to exit. This is handler time:
+    the delay between the event and the handler running is not included.
+
+    Calls are recorded from the Tk thread, the probe table worker and the
+    compute server's request threads, so the statistics are guarded by a
+    lock.
+    """
+
+    PROMETHEUS_PREFIX = "electrostatics"
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.stats = {}
+        self.started = time.time()
+        self.lock = threading.Lock()
+
+    def record(self, name, category, seconds, particles, points):
+        """Add one timed call to the statistics."""
+        with self.lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = {
+                    'category': category, 'calls': 0, 'total_seconds': 0.0,
+                    'max_seconds': 0.0, 'particles': 0, 'points': 0,
+                }
+            entry['calls'] += 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['particles'] += particles
+            entry['points'] += points
+
+    def reset(self):
+        """Discard all recorded statistics."""
+        with self.lock:
+            self.stats = {}
+            self.started = time.time()
+
+    def snapshot(self):
+        """Return the statistics as a list of dicts, slowest total first."""
+        rows = []
+        with self.lock:
+            for name, entry in self.stats.items():
+                row = dict(entry, name=name)
+                row['mean_seconds'] = entry['total_seconds'] / entry['calls']
+                rows.append(row)
+        rows.sort(key=lambda row: row['total_seconds'], reverse=True)
+        return rows
+
+    def export_json(self, filename):
+        """Write the statistics to a JSON file."""
+        with open(filename, 'w') as f:
+            json.dump({
+                'started': datetime.fromtimestamp(self.started).isoformat(),
+                'exported': datetime.now().isoformat(),
+                'stats': self.snapshot(),
+            }, f, indent=2)
+
+    def export_prometheus(self, filename):
+        """Write the statistics in the Prometheus textfile exposition format."""
+        metrics = [
+            ("calls_total", "counter", "Number of instrumented calls.", 'calls'),
+            ("seconds_total", "counter", "Wall time spent in instrumented calls.", 'total_seconds'),
+            ("seconds_max", "gauge", "Slowest single instrumented call.", 'max_seconds'),
+            ("particles_total", "counter", "Particles processed by instrumented calls.", 'particles'),
+            ("points_total", "counter", "Query points processed by instrumented calls.", 'points'),
+        ]
+        rows = self.snapshot()
+        lines = []
+        for suffix, kind, help_text, key in metrics:
+            metric = f"{self.PROMETHEUS_PREFIX}_{suffix}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for row in rows:
+                lines.append(
+                    f'{metric}{{category="{row["category"]}",name="{row["name"]}"}} {row[key]}'
+                )
+
+        # Write then rename so a collector never reads a partial file
+        temp_name = filename + ".tmp"
+        with open(temp_name, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_name, filename)
+
+
+def env_flag(name):
+    """True if the environment variable is set to 1, true or yes."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes")
+
+
+PROFILER = Profiler(enabled=env_flag("ELECTROSTATICS_PROFILE"))
+
+
+def instrumented(category, particles_arg=None, points_arg=None, points=0):
+    """
+    Decorator that reports calls to PROFILER while it is enabled.
+
+    particles_arg and points_arg are positional indices (counting self)
+    of the arguments whose length is recorded as the particle and point
+    count; points gives a fixed point count for single-point methods.
+    """
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                n = len(args[particles_arg]) if particles_arg is not None and len(args) > particles_arg else 0
+                m = len(args[points_arg]) if points_arg is not None and len(args) > points_arg else points
+                PROFILER.record(name, category, elapsed, n, m)
+
+        return wrapper
+    return decorator
+
+
 class Particle:
     """
     A class to represent a charged particle.
@@ -50,90 +192,826 @@ class Particle:
         return Particle(data['x'], data['y'], data['charge'], data['particle_type'])
 
 
+class ParticleArrayFile:
+    """
+    Compact binary particle format for large configurations.
+
+    A 12-byte header (magic b"EPA1" and a little-endian uint64 count) is
+    followed by count (x, y, signed_charge) triples of little-endian
+    float64. Files are written and read in chunks through array('d'), so
+    no Particle objects are needed on either side.
+    """
+
+    MAGIC = b"EPA1"
+    HEADER = struct.Struct("<4sQ")
+    CHUNK = 65536  # Triples per write
+
+    @classmethod
+    def is_array_file(cls, filename):
+        with open(filename, 'rb') as f:
+            return f.read(len(cls.MAGIC)) == cls.MAGIC
+
+    @classmethod
+    def write(cls, filename, triples):
+        """Stream (x, y, signed_charge) triples to a file; returns the count."""
+        count = 0
+        with open(filename, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, 0))
+            chunk = array('d')
+            for x, y, q in triples:
+                chunk.extend((x, y, q))
+                if len(chunk) >= 3 * cls.CHUNK:
+                    count += cls._write_chunk(f, chunk)
+                    chunk = array('d')
+            count += cls._write_chunk(f, chunk)
+            # The count is only known at the end
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, count))
+        return count
+
+    @staticmethod
+    def _write_chunk(f, chunk):
+        if sys.byteorder != "little":
+            chunk.byteswap()
+        chunk.tofile(f)
+        return len(chunk) // 3
+
+    @classmethod
+    def read(cls, filename):
+        """Return a flat array('d') of x, y, signed_charge values."""
+        with open(filename, 'rb') as f:
+            magic, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError("Not a particle array file")
+            data = f.read(3 * count * 8)
+        if len(data) != 3 * count * 8:
+            raise ValueError(f"Particle array file is truncated (expected {count} particles)")
+        values = array('d', data)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
+
+    @classmethod
+    def read_configuration(cls, filename):
+        """Read a file as a configuration dictionary with particle dicts."""
+        values = cls.read(filename)
+        particles = []
+        for i in range(0, len(values), 3):
+            q = values[i + 2]
+            particles.append({
+                'x': values[i], 'y': values[i + 1], 'charge': abs(q),
+                'particle_type': "proton" if q > 0 else "electron",
+            })
+        return {'particles': particles, 'distributions': [], 'conductors': []}
+
+
+class GaussLegendre:
+    """
+    Cached Gauss-Legendre node and weight tables on [-1, 1].
+    """
+
+    _tables = {}
+
+    @classmethod
+    def table(cls, order):
+        """Return (nodes, weights) for the given number of points."""
+        if order not in cls._tables:
+            nodes, weights = [], []
+            for i in range(1, order + 1):
+                x = math.cos(math.pi * (i - 0.25) / (order + 0.5))
+                for _ in range(100):
+                    p0, p1 = 1.0, x
+                    for n in range(2, order + 1):
+                        p0, p1 = p1, ((2 * n - 1) * x * p1 - (n - 1) * p0) / n
+                    dp = order * (x * p1 - p0) / (x * x - 1)
+                    dx = p1 / dp
+                    x -= dx
+                    if abs(dx) < 1e-15:
+                        break
+                nodes.append(x)
+                weights.append(2 / ((1 - x * x) * dp * dp))
+            cls._tables[order] = (nodes, weights)
+        return cls._tables[order]
+
+
+class ChargeDistribution:
+    """
+    Base class for continuous, uniformly charged objects.
+
+    The total charge is stored as a magnitude plus particle_type, like
+    Particle. Field and potential are integrated with Gauss-Legendre
+    quadrature over the shape's parameter domain. Query points far from
+    the shape reuse a cached node table; close to the shape the domain is
+    subdivided until every piece is small compared with its distance to
+    the query point. Node tables are cached per piece, so the geometry
+    must not change after construction. Quadrature nodes are
+    (x, y, fraction) tuples, where fraction is the share of the total
+    charge carried by the node.
+
+    Subclasses provide the parameter domain, how to split it, its size and
+    center, the quadrature rule on one piece, and an outline for drawing.
+    """
+
+    ORDER = 8          # Gauss-Legendre points per piece and direction
+    NEAR_RATIO = 2.0   # Subdivide while closer than this many piece sizes
+    MAX_DEPTH = 20
+    FINE_DEPTH = 5     # Uniform subdivision depth for flux, energy and moments
+    MAX_CACHED_PIECES = 20000
+
+    KINDS = {}
+
+    def __init__(self, charge, particle_type):
+        self.charge = charge
+        self.particle_type = particle_type
+        self.sign = 1 if particle_type == "proton" else -1
+        self.canvas_id = None
+        self._pieces = {}  # Per-piece node tables; the geometry is fixed
+        self._far_nodes = None
+        self._fine_nodes = None
+
+    @classmethod
+    def register(cls, subclass):
+        cls.KINDS[subclass.kind] = subclass
+        return subclass
+
+    @staticmethod
+    def from_dict(data):
+        """Create the distribution described by a dictionary."""
+        kind = data.get('kind')
+        if kind not in ChargeDistribution.KINDS:
+            raise ValueError(f"Unknown charge distribution: {kind}")
+        return ChargeDistribution.KINDS[kind].from_dict(data)
+
+    def base_dict(self):
+        return {'kind': self.kind, 'charge': self.charge, 'particle_type': self.particle_type}
+
+    # ----- Quadrature -----
+
+    def _roots(self):
+        """Top-level pieces; closed curves are split so no piece wraps around."""
+        return [self._domain()]
+
+    def _piece(self, piece):
+        """Cached (center_x, center_y, size, nodes) of a piece."""
+        entry = self._pieces.get(piece)
+        if entry is None:
+            if len(self._pieces) >= self.MAX_CACHED_PIECES:
+                self._pieces.clear()
+            center_x, center_y = self._center(piece)
+            entry = (center_x, center_y, self._size(piece), self._rule(piece, self.ORDER))
+            self._pieces[piece] = entry
+        return entry
+
+    def far_nodes(self):
+        """Nodes for query points well away from the shape (cached)."""
+        if self._far_nodes is None:
+            self._far_nodes = [node for piece in self._roots() for node in self._piece(piece)[3]]
+        return self._far_nodes
+
+    def fine_nodes(self):
+        """Nodes from a uniform subdivision, for flux and moments (cached)."""
+        if self._fine_nodes is None:
+            pieces = self._roots()
+            for _ in range(self.FINE_DEPTH):
+                pieces = [child for piece in pieces for child in self._split(piece)]
+            self._fine_nodes = [node for piece in pieces for node in self._rule(piece, self.ORDER)]
+        return self._fine_nodes
+
+    def point_charges(self, x, y):
+        """Quadrature nodes adapted to a query point at (x, y)."""
+        nodes = []
+        subdivided = False
+        stack = [(piece, 0) for piece in self._roots()]
+        while stack:
+            piece, depth = stack.pop()
+            center_x, center_y, size, piece_nodes = self._piece(piece)
+            if depth < self.MAX_DEPTH and math.hypot(x - center_x, y - center_y) < self.NEAR_RATIO * size:
+                subdivided = True
+                stack.extend((child, depth + 1) for child in self._split(piece))
+            else:
+                nodes.extend(piece_nodes)
+        return nodes if subdivided else self.far_nodes()
+
+    # ----- Physics -----
+
+    def is_singular_at(self, x, y):
+        """True if the potential diverges at (x, y); an area charge never does."""
+        return False
+
+    def unit_potential_at(self, k, x, y):
+        """Potential per unit total charge at (x, y), or None on the charge."""
+        if self.is_singular_at(x, y):
+            return None
+        v = 0
+        for px, py, fraction in self.point_charges(x, y):
+            dx = x - px
+            dy = y - py
+            r2 = dx * dx + dy * dy
+            if r2 == 0:
+                return None
+            v += fraction / math.sqrt(r2)
+        return k * v
+
+    def unit_field_at(self, k, x, y):
+        """Field (e_x, e_y) per unit total charge at (x, y), or None on the charge."""
+        if self.is_singular_at(x, y):
+            return None
+        e_x, e_y = 0, 0
+        for px, py, fraction in self.point_charges(x, y):
+            dx = x - px
+            dy = y - py
+            r2 = dx * dx + dy * dy
+            if r2 == 0:
+                return None
+            scale = fraction / (r2 * math.sqrt(r2))
+            e_x += scale * dx
+            e_y += scale * dy
+        return k * e_x, k * e_y
+
+    def potential_at(self, k, x, y):
+        """Potential at (x, y), or None if (x, y) lies on the charge."""
+        v = self.unit_potential_at(k, x, y)
+        if v is None:
+            return None
+        return self.charge * self.sign * v
+
+    def field_at(self, k, x, y):
+        """Field (e_x, e_y) at (x, y), or None if (x, y) lies on the charge."""
+        field = self.unit_field_at(k, x, y)
+        if field is None:
+            return None
+        q = self.charge * self.sign
+        return q * field[0], q * field[1]
+
+    def enclosed_fraction(self, center_x, center_y, radius):
+        """Share of the charge inside a circle."""
+        return sum(
+            fraction for px, py, fraction in self.fine_nodes()
+            if math.hypot(px - center_x, py - center_y) <= radius
+        )
+
+    def first_moment(self):
+        """Charge-weighted mean position (x, y) of the distribution."""
+        nodes = self.fine_nodes()
+        return (sum(px * f for px, _, f in nodes), sum(py * f for _, py, f in nodes))
+
+    def describe(self):
+        return f"{self.kind.capitalize()} charge at ({self.x:.2f}, {self.y:.2f})"
+
+
+class CurveCharge(ChargeDistribution):
+    """
+    A uniformly charged curve parametrized by t in [0, 1].
+
+    Subclasses implement point(t), length(t0, t1) and distance_to(x, y).
+    The potential of a line density diverges logarithmically on the curve,
+    so points within ON_CURVE_TOLERANCE lengths of it are singular.
+    """
+
+    ON_CURVE_TOLERANCE = 1e-12
+
+    def is_singular_at(self, x, y):
+        return self.distance_to(x, y) <= self.ON_CURVE_TOLERANCE * self.length(0.0, 1.0)
+
+    def _domain(self):
+        return (0.0, 1.0)
+
+    def _split(self, piece):
+        t0, t1 = piece
+        mid = (t0 + t1) / 2
+        return [(t0, mid), (mid, t1)]
+
+    def _size(self, piece):
+        return self.length(*piece)
+
+    def _center(self, piece):
+        return self.point((piece[0] + piece[1]) / 2)
+
+    def _rule(self, piece, order):
+        t0, t1 = piece
+        half = (t1 - t0) / 2
+        nodes, weights = GaussLegendre.table(order)
+        return [(*self.point(t0 + half * (u + 1)), w * half) for u, w in zip(nodes, weights)]
+
+    def outline(self, segments=64):
+        return [self.point(i / segments) for i in range(segments + 1)]
+
+
+@ChargeDistribution.register
+class LineCharge(CurveCharge):
+    """
+    A uniformly charged straight line segment.
+
+    Attributes:
+        x1, y1, x2, y2 (float): End points of the segment.
+        charge (float): Magnitude of the total charge.
+        particle_type (str): "proton" for positive, "electron" for negative.
+    """
+
+    kind = "line"
+
+    def __init__(self, x1, y1, x2, y2, charge, particle_type):
+        super().__init__(charge, particle_type)
+        if (x1, y1) == (x2, y2):
+            raise ValueError("A line charge needs two distinct end points")
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.x, self.y = (x1 + x2) / 2, (y1 + y2) / 2
+
+    def point(self, t):
+        return (self.x1 + t * (self.x2 - self.x1), self.y1 + t * (self.y2 - self.y1))
+
+    def length(self, t0, t1):
+        return (t1 - t0) * math.hypot(self.x2 - self.x1, self.y2 - self.y1)
+
+    def distance_to(self, x, y):
+        dx, dy = self.x2 - self.x1, self.y2 - self.y1
+        t = ((x - self.x1) * dx + (y - self.y1) * dy) / (dx * dx + dy * dy)
+        px, py = self.point(min(1.0, max(0.0, t)))
+        return math.hypot(x - px, y - py)
+
+    def outline(self, segments=1):
+        return [(self.x1, self.y1), (self.x2, self.y2)]
+
+    def to_dict(self):
+        data = self.base_dict()
+        data.update({'x1': self.x1, 'y1': self.y1, 'x2': self.x2, 'y2': self.y2})
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        return LineCharge(data['x1'], data['y1'], data['x2'], data['y2'],
+                          data['charge'], data['particle_type'])
+
+
+@ChargeDistribution.register
+class ArcCharge(CurveCharge):
+    """
+    A uniformly charged circular arc.
+
+    Attributes:
+        cx, cy (float): Center of the circle.
+        radius (float): Radius of the circle.
+        start_angle, end_angle (float): Arc limits in degrees, counterclockwise.
+        charge (float): Magnitude of the total charge.
+        particle_type (str): "proton" for positive, "electron" for negative.
+    """
+
+    kind = "arc"
+
+    def __init__(self, cx, cy, radius, start_angle, end_angle, charge, particle_type):
+        super().__init__(charge, particle_type)
+        if radius <= 0:
+            raise ValueError("Radius must be positive")
+        if end_angle == start_angle:
+            raise ValueError("An arc needs different start and end angles")
+        self.cx, self.cy, self.radius = cx, cy, radius
+        self.start_angle, self.end_angle = start_angle, end_angle
+        self.x, self.y = cx, cy
+
+    def _roots(self):
+        count = max(1, math.ceil(abs(self.end_angle - self.start_angle) / 90 - 1e-9))
+        return [(i / count, (i + 1) / count) for i in range(count)]
+
+    def _angle(self, t):
+        return math.radians(self.start_angle + t * (self.end_angle - self.start_angle))
+
+    def point(self, t):
+        angle = self._angle(t)
+        return (self.cx + self.radius * math.cos(angle), self.cy + self.radius * math.sin(angle))
+
+    def length(self, t0, t1):
+        return abs(self._angle(t1) - self._angle(t0)) * self.radius
+
+    def distance_to(self, x, y):
+        span = self.end_angle - self.start_angle
+        angle = math.degrees(math.atan2(y - self.cy, x - self.cx))
+        offset = (angle - self.start_angle) % 360 if span > 0 else (self.start_angle - angle) % 360
+        if offset <= abs(span):
+            return abs(math.hypot(x - self.cx, y - self.cy) - self.radius)
+        return min(math.hypot(x - ex, y - ey) for ex, ey in (self.point(0.0), self.point(1.0)))
+
+    def to_dict(self):
+        data = self.base_dict()
+        data.update({'cx': self.cx, 'cy': self.cy, 'radius': self.radius,
+                     'start_angle': self.start_angle, 'end_angle': self.end_angle})
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        return ArcCharge(data['cx'], data['cy'], data['radius'], data['start_angle'],
+                         data['end_angle'], data['charge'], data['particle_type'])
+
+
+@ChargeDistribution.register
+class RingCharge(ArcCharge):
+    """
+    A uniformly charged full circle (ring).
+    """
+
+    kind = "ring"
+
+    def __init__(self, cx, cy, radius, charge, particle_type):
+        super().__init__(cx, cy, radius, 0.0, 360.0, charge, particle_type)
+
+    def to_dict(self):
+        data = self.base_dict()
+        data.update({'cx': self.cx, 'cy': self.cy, 'radius': self.radius})
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        return RingCharge(data['cx'], data['cy'], data['radius'],
+                          data['charge'], data['particle_type'])
+
+
+@ChargeDistribution.register
+class DiskCharge(ChargeDistribution):
+    """
+    A uniformly charged disk.
+
+    The parameter domain is (s, t) in [0, 1]^2 with r = s * radius and
+    angle = 2 * pi * t; the charge fraction per ds dt is 2s.
+
+    Attributes:
+        cx, cy (float): Center of the disk.
+        radius (float): Radius of the disk.
+        charge (float): Magnitude of the total charge.
+        particle_type (str): "proton" for positive, "electron" for negative.
+    """
+
+    kind = "disk"
+    ORDER = 6
+    FINE_DEPTH = 2
+    POLAR_RATIO = 1.5  # Use rays from the query point within this many radii
+    MAX_DEPTH = 8
+    MAX_RAYS = 512
+
+    def __init__(self, cx, cy, radius, charge, particle_type):
+        super().__init__(charge, particle_type)
+        if radius <= 0:
+            raise ValueError("Radius must be positive")
+        self.cx, self.cy, self.radius = cx, cy, radius
+        self.x, self.y = cx, cy
+
+    def _domain(self):
+        return (0.0, 1.0, 0.0, 1.0)
+
+    def _roots(self):
+        return [(0.0, 1.0, i / 4, (i + 1) / 4) for i in range(4)]
+
+    def _split(self, piece):
+        s0, s1, t0, t1 = piece
+        sm, tm = (s0 + s1) / 2, (t0 + t1) / 2
+        return [(s0, sm, t0, tm), (sm, s1, t0, tm), (s0, sm, tm, t1), (sm, s1, tm, t1)]
+
+    def _point(self, s, t):
+        angle = 2 * math.pi * t
+        r = s * self.radius
+        return (self.cx + r * math.cos(angle), self.cy + r * math.sin(angle))
+
+    def _size(self, piece):
+        s0, s1, t0, t1 = piece
+        half_angle = min(math.pi, 2 * math.pi * (t1 - t0)) / 2
+        return self.radius * max(s1 - s0, 2 * s1 * math.sin(half_angle))
+
+    def _center(self, piece):
+        s0, s1, t0, t1 = piece
+        return self._point((s0 + s1) / 2, (t0 + t1) / 2)
+
+    def _rule(self, piece, order):
+        s0, s1, t0, t1 = piece
+        half_s = (s1 - s0) / 2
+        half_t = (t1 - t0) / 2
+        nodes, weights = GaussLegendre.table(order)
+        result = []
+        for us, ws in zip(nodes, weights):
+            s = s0 + half_s * (us + 1)
+            for ut, wt in zip(nodes, weights):
+                t = t0 + half_t * (ut + 1)
+                result.append((*self._point(s, t), ws * half_s * wt * half_t * 2 * s))
+        return result
+
+    def point_charges(self, x, y):
+        """
+        Quadrature nodes adapted to a query point at (x, y).
+
+        Near the disk the nodes are laid out along rays from the query point,
+        which removes the 1/r singularity through the polar Jacobian.
+        Inside, a small disk of radius rho (the distance to the rim) gets
+        symmetric nodes whose field cancels exactly, and rays run from rho
+        out to the rim. Outside, rays span the disk's angular width with a
+        sine substitution that smooths the chord length at the tangents.
+        Each ray is split geometrically so the field integrand stays smooth
+        on every piece.
+        """
+        dx = x - self.cx
+        dy = y - self.cy
+        distance = math.hypot(dx, dy)
+        rho = abs(self.radius - distance)
+        if distance >= self.POLAR_RATIO * self.radius or rho <= 1e-9 * self.radius:
+            return super().point_charges(x, y)
+
+        nodes, weights = GaussLegendre.table(self.ORDER)
+        count = min(self.MAX_RAYS, self.ORDER * math.ceil(4 * math.sqrt(self.radius / rho)))
+        rays = []  # (angle, angular weight, inner radius)
+        if distance < self.radius:
+            d_angle = 2 * math.pi / count
+            rays = [((j + 0.5) * d_angle, d_angle, rho) for j in range(count)]
+        else:
+            # Directions that hit the disk: toward the center +- half_width
+            toward = math.atan2(-dy, -dx)
+            half_width = math.asin(self.radius / distance)
+            panels = count // self.ORDER
+            for j in range(panels):
+                lo = -math.pi / 2 + j * math.pi / panels
+                half = math.pi / (2 * panels)
+                for u, w in zip(nodes, weights):
+                    psi = lo + half * (u + 1)
+                    rays.append((toward + half_width * math.sin(psi),
+                                 w * half * half_width * math.cos(psi), None))
+
+        # Charge fraction per unit area
+        density = 1 / (math.pi * self.radius * self.radius)
+        result = []
+        for angle, angular_weight, inner in rays:
+            ux, uy = math.cos(angle), math.sin(angle)
+            # Distances to the rim along this ray
+            b = ux * dx + uy * dy
+            root = math.sqrt(max(0.0, b * b - (distance * distance - self.radius ** 2)))
+            if inner is None:
+                start, rim = -b - root, -b + root
+                pieces = []
+            else:
+                start, rim = inner, -b + root
+                pieces = [(0.0, inner)]
+            while start < rim:
+                end = min(rim, 2 * start)
+                pieces.append((start, end))
+                start = end
+            for r0, r1 in pieces:
+                half = (r1 - r0) / 2
+                for u, w in zip(nodes, weights):
+                    r = r0 + half * (u + 1)
+                    result.append((x + r * ux, y + r * uy, density * r * w * half * angular_weight))
+        return result
+
+    def outline(self, segments=64):
+        return [self._point(1.0, i / segments) for i in range(segments + 1)]
+
+    def to_dict(self):
+        data = self.base_dict()
+        data.update({'cx': self.cx, 'cy': self.cy, 'radius': self.radius})
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        return DiskCharge(data['cx'], data['cy'], data['radius'],
+                          data['charge'], data['particle_type'])
+
+
+class Float32Sources:
+    """
+    Point-charge (x, y, kq) terms stored as three float32 columns.
+
+    Iterates like the list of tuples used in double precision, at 12
+    bytes per source instead of a tuple and three float objects.
+    """
+
+    def __init__(self):
+        self.x = array('f')
+        self.y = array('f')
+        self.kq = array('f')
+
+    def append(self, term):
+        x, y, kq = term
+        self.x.append(x)
+        self.y.append(y)
+        self.kq.append(kq)
+
+    def __len__(self):
+        return len(self.kq)
+
+    def __iter__(self):
+        return zip(self.x, self.y, self.kq)
+
+
 class PhysicsEngine:
     """
     Handles all physics calculations for electrostatics.
+
+    precision selects how sums over the charges are formed:
+        "double": float64 running sums (default)
+        "float32": the batched methods keep the point charges in a
+            float32 table. CPython still adds in double precision, so
+            this is no faster and only shrinks the per-call table; it
+            rounds positions to about 7 digits, so the app only offers
+            it for the overlays
+        "compensated": potential, field, force and energy sums are
+            correctly rounded with math.fsum, for configurations where
+            positive and negative terms nearly cancel
     """
-    
-    def __init__(self, k=8.99e9, epsilon_0=8.854e-12):
+
+    PRECISIONS = ("float32", "double", "compensated")
+    CALCULATION_PRECISIONS = ("double", "compensated")
+    OVERLAY_PRECISIONS = ("double", "float32")
+    PRECISION_LABELS = {
+        "float32": "float32 storage",
+        "double": "double",
+        "compensated": "compensated (fsum)",
+    }
+
+    def __init__(self, k=8.99e9, epsilon_0=8.854e-12, precision="double"):
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}")
         self.k = k  # Coulomb's constant
         self.epsilon_0 = epsilon_0  # Permittivity of free space
+        self.precision = precision
+
+    def _sum(self, terms):
+        """Add terms left to right, or correctly rounded in compensated mode."""
+        if self.precision == "compensated":
+            return math.fsum(terms)
+        total = 0
+        for term in terms:
+            total += term
+        return total
     
+    @instrumented("engine", particles_arg=1, points=1)
     def calc_electric_field(self, particles, point_x, point_y):
         """Calculate electric field at a point."""
         e_x, e_y = 0, 0
+        # Terms are only kept for math.fsum; otherwise they are summed as they go
+        x_terms, y_terms = ([], []) if self.precision == "compensated" else (None, None)
         
         for particle in particles:
-            dx = point_x - particle.x
-            dy = point_y - particle.y
-            r = math.sqrt(dx**2 + dy**2)
-            
-            if r == 0:
-                return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
-            
-            e_mag = self.k * particle.charge * particle.sign / (r**2)
-            e_x += e_mag * (dx / r)
-            e_y += e_mag * (dy / r)
+            if isinstance(particle, ChargeDistribution):
+                field = particle.field_at(self.k, point_x, point_y)
+                if field is None:
+                    return None, f"Point lies on {particle.describe().lower()}"
+                term_x, term_y = field
+            else:
+                dx = point_x - particle.x
+                dy = point_y - particle.y
+                r = math.sqrt(dx**2 + dy**2)
+                
+                if r == 0:
+                    return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
+                
+                e_mag = self.k * particle.charge * particle.sign / (r**2)
+                term_x = e_mag * (dx / r)
+                term_y = e_mag * (dy / r)
+
+            if x_terms is None:
+                e_x += term_x
+                e_y += term_y
+            else:
+                x_terms.append(term_x)
+                y_terms.append(term_y)
         
+        if x_terms is not None:
+            e_x = math.fsum(x_terms)
+            e_y = math.fsum(y_terms)
         e_total = math.sqrt(e_x**2 + e_y**2)
         angle = math.degrees(math.atan2(e_y, e_x))
         
         return (e_x, e_y, e_total, angle), None
     
+    @instrumented("engine", particles_arg=1, points=1)
     def calc_electric_potential(self, particles, point_x, point_y):
         """Calculate electric potential at a point."""
         v = 0
+        terms = [] if self.precision == "compensated" else None
         
         for particle in particles:
-            dx = point_x - particle.x
-            dy = point_y - particle.y
-            r = math.sqrt(dx**2 + dy**2)
-            
-            if r == 0:
-                return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
-            
-            v += self.k * particle.charge * particle.sign / r
+            if isinstance(particle, ChargeDistribution):
+                term = particle.potential_at(self.k, point_x, point_y)
+                if term is None:
+                    return None, f"Point lies on {particle.describe().lower()}"
+            else:
+                dx = point_x - particle.x
+                dy = point_y - particle.y
+                r = math.sqrt(dx**2 + dy**2)
+                
+                if r == 0:
+                    return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
+                
+                term = self.k * particle.charge * particle.sign / r
+
+            if terms is None:
+                v += term
+            else:
+                terms.append(term)
         
+        if terms is not None:
+            v = math.fsum(terms)
         return v, None
     
+    @instrumented("engine", particles_arg=1, points=1)
     def calc_force_on_charge(self, particles, test_charge, point_x, point_y):
         """Calculate force on a test charge."""
         f_x, f_y = 0, 0
+        x_terms, y_terms = ([], []) if self.precision == "compensated" else (None, None)
         
         for particle in particles:
-            dx = point_x - particle.x
-            dy = point_y - particle.y
-            r = math.sqrt(dx**2 + dy**2)
-            
-            if r == 0:
-                return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
-            
-            f_mag = self.k * test_charge * particle.charge * particle.sign / (r**2)
-            f_x += f_mag * (dx / r)
-            f_y += f_mag * (dy / r)
+            if isinstance(particle, ChargeDistribution):
+                field = particle.field_at(self.k, point_x, point_y)
+                if field is None:
+                    return None, f"Point lies on {particle.describe().lower()}"
+                term_x = test_charge * field[0]
+                term_y = test_charge * field[1]
+            else:
+                dx = point_x - particle.x
+                dy = point_y - particle.y
+                r = math.sqrt(dx**2 + dy**2)
+                
+                if r == 0:
+                    return None, f"Particle at ({particle.x:.2f}, {particle.y:.2f})"
+                
+                f_mag = self.k * test_charge * particle.charge * particle.sign / (r**2)
+                term_x = f_mag * (dx / r)
+                term_y = f_mag * (dy / r)
+
+            if x_terms is None:
+                f_x += term_x
+                f_y += term_y
+            else:
+                x_terms.append(term_x)
+                y_terms.append(term_y)
         
+        if x_terms is not None:
+            f_x = math.fsum(x_terms)
+            f_y = math.fsum(y_terms)
         f_total = math.sqrt(f_x**2 + f_y**2)
         angle = math.degrees(math.atan2(f_y, f_x))
         
         return (f_x, f_y, f_total, angle), None
     
+    @instrumented("engine", particles_arg=1)
     def calc_potential_energy(self, particles):
-        """Calculate total potential energy of the system."""
-        u = 0
-        
+        """
+        Calculate total potential energy of the system.
+
+        Pairs involving a charge distribution are integrated over its
+        quadrature nodes. The self-energy of each distribution is not
+        included, as it does not change when objects are moved.
+        """
+        return self._sum(self._pair_energies(particles))
+
+    def _pair_energies(self, particles):
+        """Yield the interaction energy of every pair, without storing them."""
         for p1, p2 in itertools.combinations(particles, 2):
+            if isinstance(p1, ChargeDistribution) or isinstance(p2, ChargeDistribution):
+                yield self._pair_energy(p1, p2)
+                continue
+
             dx = p2.x - p1.x
             dy = p2.y - p1.y
             r = math.sqrt(dx**2 + dy**2)
-            u += self.k * (p1.charge * p1.sign) * (p2.charge * p2.sign) / r
-        
+            yield self.k * (p1.charge * p1.sign) * (p2.charge * p2.sign) / r
+
+    def _pair_energy(self, p1, p2):
+        """Interaction energy of a pair where at least one is a distribution."""
+        coupling = self.pair_coupling(p1, p2)
+        q = p1.charge * p1.sign * p2.charge * p2.sign
+        if coupling is None:
+            return math.copysign(math.inf, q)
+        return q * coupling
+
+    def pair_coupling(self, p1, p2):
+        """
+        Interaction energy per unit charge product of a pair, or None if
+        they touch. Integrates the potential of a distribution over the
+        cached nodes of the other object.
+        """
+        if not isinstance(p2, ChargeDistribution):
+            p1, p2 = p2, p1
+        if not isinstance(p2, ChargeDistribution):
+            r = math.hypot(p2.x - p1.x, p2.y - p1.y)
+            return self.k / r if r else None
+        if isinstance(p1, ChargeDistribution):
+            nodes = p1.fine_nodes()
+        else:
+            nodes = [(p1.x, p1.y, 1.0)]
+
+        u = 0
+        for x, y, fraction in nodes:
+            potential = p2.unit_potential_at(self.k, x, y)
+            if potential is None:
+                return None
+            u += fraction * potential
         return u
     
+    @instrumented("engine", particles_arg=1)
     def calc_electric_flux(self, particles, center_x, center_y, radius):
         """Calculate electric flux through a Gaussian surface."""
         enclosed_charge = 0
         
         for particle in particles:
+            if isinstance(particle, ChargeDistribution):
+                fraction = particle.enclosed_fraction(center_x, center_y, radius)
+                enclosed_charge += fraction * particle.charge * particle.sign
+                continue
+
             dx = particle.x - center_x
             dy = particle.y - center_y
             distance = math.sqrt(dx**2 + dy**2)
@@ -144,6 +1022,7 @@ class PhysicsEngine:
         flux = enclosed_charge / self.epsilon_0
         return enclosed_charge, flux
     
+    @instrumented("engine", particles_arg=1)
     def calc_dipole_moment(self, particles):
         """Calculate electric dipole moment."""
         p_x, p_y = 0, 0
@@ -151,13 +1030,2006 @@ class PhysicsEngine:
         
         for particle in particles:
             charge = particle.charge * particle.sign
-            p_x += charge * particle.x
-            p_y += charge * particle.y
+            if isinstance(particle, ChargeDistribution):
+                x, y = particle.first_moment()
+            else:
+                x, y = particle.x, particle.y
+            p_x += charge * x
+            p_y += charge * y
             total_charge += charge
         
         p_magnitude = math.sqrt(p_x**2 + p_y**2)
         return p_x, p_y, p_magnitude, total_charge
 
+    def _split_sources(self, particles):
+        """
+        Split particles into (x, y, kq) point terms and distributions. In
+        float32 mode the point terms are packed into a Float32Sources table.
+        """
+        sources = Float32Sources() if self.precision == "float32" else []
+        distributions = []
+        for p in particles:
+            if isinstance(p, ChargeDistribution):
+                distributions.append(p)
+            else:
+                sources.append((p.x, p.y, self.k * p.charge * p.sign))
+        return sources, distributions
+
+    def _terms_at(self, sources, distributions, point_x, point_y):
+        """
+        Point terms plus distribution quadrature nodes adapted to a point.
+
+        The point terms are chained rather than copied, so a batch does not
+        rebuild the source list per point. A point on a curve charge gets a
+        single term at its own position, which the callers' r == 0 check
+        reports like a point-charge singularity.
+        """
+        if not distributions:
+            return sources
+        nodes = []
+        for d in distributions:
+            kq = self.k * d.charge * d.sign
+            if d.is_singular_at(point_x, point_y):
+                return [(point_x, point_y, kq)]
+            nodes.extend((x, y, kq * fraction) for x, y, fraction in d.point_charges(point_x, point_y))
+        return itertools.chain(sources, nodes)
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_field_at_points(self, particles, points):
+        """
+        Calculate the electric field at many points in one pass.
+
+        Returns a list of (e_x, e_y) tuples in the same order as points,
+        with None for any point that coincides with a particle.
+        """
+        sources, distributions = self._split_sources(particles)
+        if self.precision == "compensated":
+            return [
+                None if value is None else value[1:]
+                for value in self._compensated_at_points(sources, distributions, points)
+            ]
+        results = []
+
+        for point_x, point_y in points:
+            e_x, e_y = 0, 0
+            for x, y, kq in self._terms_at(sources, distributions, point_x, point_y):
+                dx = point_x - x
+                dy = point_y - y
+                r2 = dx * dx + dy * dy
+                if r2 == 0:
+                    break
+                scale = kq / (r2 * math.sqrt(r2))
+                e_x += scale * dx
+                e_y += scale * dy
+            else:
+                results.append((e_x, e_y))
+                continue
+            results.append(None)
+
+        return results
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_potential_at_points(self, particles, points):
+        """
+        Calculate the electric potential at many points in one pass.
+
+        Returns a list of potentials in the same order as points, with None
+        for any point that coincides with a particle.
+        """
+        sources, distributions = self._split_sources(particles)
+        if self.precision == "compensated":
+            return [
+                None if value is None else value[0]
+                for value in self._compensated_at_points(sources, distributions, points)
+            ]
+        results = []
+
+        for point_x, point_y in points:
+            v = 0
+            for x, y, kq in self._terms_at(sources, distributions, point_x, point_y):
+                dx = point_x - x
+                dy = point_y - y
+                r2 = dx * dx + dy * dy
+                if r2 == 0:
+                    break
+                v += kq / math.sqrt(r2)
+            else:
+                results.append(v)
+                continue
+            results.append(None)
+
+        return results
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_potential_and_field_at_points(self, particles, points):
+        """
+        Calculate potential and electric field at many points in one pass.
+
+        Returns a list of (v, e_x, e_y) tuples in the same order as points,
+        with None for any point that coincides with a particle.
+        """
+        sources, distributions = self._split_sources(particles)
+        if self.precision == "compensated":
+            return self._compensated_at_points(sources, distributions, points)
+        results = []
+
+        for point_x, point_y in points:
+            v, e_x, e_y = 0, 0, 0
+            for x, y, kq in self._terms_at(sources, distributions, point_x, point_y):
+                dx = point_x - x
+                dy = point_y - y
+                r2 = dx * dx + dy * dy
+                if r2 == 0:
+                    break
+                r = math.sqrt(r2)
+                term = kq / r
+                v += term
+                term /= r2
+                e_x += term * dx
+                e_y += term * dy
+            else:
+                results.append((v, e_x, e_y))
+                continue
+            results.append(None)
+
+        return results
+
+    def _compensated_at_points(self, sources, distributions, points):
+        """
+        (v, e_x, e_y) at each point with every sum correctly rounded by
+        math.fsum, or None where a point coincides with a particle.
+        """
+        results = []
+
+        for point_x, point_y in points:
+            v_terms, x_terms, y_terms = [], [], []
+            for x, y, kq in self._terms_at(sources, distributions, point_x, point_y):
+                dx = point_x - x
+                dy = point_y - y
+                r2 = dx * dx + dy * dy
+                if r2 == 0:
+                    break
+                r = math.sqrt(r2)
+                term = kq / r
+                v_terms.append(term)
+                term /= r2
+                x_terms.append(term * dx)
+                y_terms.append(term * dy)
+            else:
+                results.append((math.fsum(v_terms), math.fsum(x_terms), math.fsum(y_terms)))
+                continue
+            results.append(None)
+
+        return results
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_field_and_jacobian_at_points(self, particles, points):
+        """
+        Calculate the electric field and its analytic Jacobian at many points.
+
+        Returns a list of (e_x, e_y, dex_dx, dex_dy, dey_dy) tuples, with
+        None for any point that coincides with a particle. The Jacobian is
+        symmetric (dey_dx == dex_dy) and equals minus the Hessian of V.
+        Compensated mode does not apply, as Newton refinement only needs
+        the Jacobian to point the way.
+        """
+        sources, distributions = self._split_sources(particles)
+        results = []
+
+        for point_x, point_y in points:
+            e_x, e_y, j_xx, j_xy, j_yy = 0, 0, 0, 0, 0
+            for x, y, kq in self._terms_at(sources, distributions, point_x, point_y):
+                dx = point_x - x
+                dy = point_y - y
+                r2 = dx * dx + dy * dy
+                if r2 == 0:
+                    break
+                inv_r3 = kq / (r2 * math.sqrt(r2))
+                inv_r5 = 3 * inv_r3 / r2
+                e_x += inv_r3 * dx
+                e_y += inv_r3 * dy
+                j_xx += inv_r3 - inv_r5 * dx * dx
+                j_xy -= inv_r5 * dx * dy
+                j_yy += inv_r3 - inv_r5 * dy * dy
+            else:
+                results.append((e_x, e_y, j_xx, j_xy, j_yy))
+                continue
+            results.append(None)
+
+        return results
+
+
+class ParticleMeshSolver:
+    """
+    Particle-mesh (PM) backend for very large numbers of charges.
+
+    Charges are deposited onto a square mesh with cloud-in-cell ("cic") or
+    triangular-shaped-cloud ("tsc") weights, and the mesh potential is the
+    discrete convolution of that charge with the same k/r kernel used by
+    PhysicsEngine. The convolution is done with zero-padded FFTs (Hockney's
+    free-space method), so the cost is O(G log G) in the number of mesh
+    nodes instead of O(N * M) in charges times probe points. Potential and
+    field are interpolated back to the probe points with the same weights.
+
+    With p3m=True the kernel is split with a Gaussian screen: the smooth
+    erf(r/s)/r part goes through the mesh and the short-range erfc(r/s)/r
+    part is summed directly over charges in neighbouring cells, which
+    restores accuracy close to the charges. The mesh field then comes from
+    the analytic gradient of the screened kernel rather than finite
+    differences. Plain PM cannot resolve anything smaller than a few mesh
+    cells, so it is only accurate for probes well away from the charges.
+
+    The query methods mirror PhysicsEngine.calc_field_at_points and
+    calc_potential_at_points, so either object can be used as a backend.
+    The mesh has a fixed cost of several FFTs in pure Python, so it only
+    beats direct summation above about AUTO_MIN_TERMS charge-probe pairs;
+    is_preferred() applies that rule.
+    """
+
+    ASSIGNMENTS = ("cic", "tsc")
+    AUTO_MIN_TERMS = 4 * 10**6  # Measured break-even of P3M against direct summation
+
+    @classmethod
+    def is_preferred(cls, source_count, point_count):
+        """True if a 64-node P3M solve should beat direct summation."""
+        return source_count * point_count >= cls.AUTO_MIN_TERMS
+
+    def __init__(self, engine, grid_size=64, assignment="tsc", p3m=False, split_cells=2.0):
+        if assignment not in self.ASSIGNMENTS:
+            raise ValueError(f"Unknown assignment scheme: {assignment}")
+        if grid_size < 8 or grid_size & (grid_size - 1):
+            raise ValueError("grid_size must be a power of two, at least 8")
+
+        self.engine = engine
+        self.grid_size = grid_size
+        self.assignment = assignment
+        self.p3m = p3m
+        self.split_cells = split_cells  # Gaussian split radius in mesh cells
+
+        self._kernel_cache = {}
+        self._twiddle_cache = {}
+
+        # State of the last solve
+        self.origin = (0.0, 0.0)
+        self.spacing = 1.0
+        self.potential_grid = None
+        self.field_grid = None
+        self._cells = None
+        self._split = None
+        self._cutoff = None
+
+    # ----- Public API -----
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_potential_at_points(self, particles, points):
+        """Calculate the potential at many points using the mesh."""
+        self.solve(particles, points)
+        return self.potential_at_points(points)
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_field_at_points(self, particles, points):
+        """Calculate the electric field at many points using the mesh."""
+        self.solve(particles, points)
+        return self.field_at_points(points)
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def calc_potential_and_field_at_points(self, particles, points):
+        """Calculate potential and field at many points using the mesh."""
+        self.solve(particles, points)
+        return [
+            None if v is None or e is None else (v, e[0], e[1])
+            for v, e in zip(self.potential_at_points(points), self.field_at_points(points))
+        ]
+
+    @instrumented("engine", particles_arg=1, points_arg=2)
+    def solve(self, particles, points=()):
+        """
+        Deposit the charges and solve for the mesh potential.
+
+        The mesh is sized to cover every particle and every probe point, so
+        call this again (or use the calc_* methods) when the probe region
+        changes. Charge distributions are deposited through their cached
+        quadrature nodes.
+        """
+        n = self.grid_size
+        charges = self._point_charges(particles)
+        self._fit_mesh(charges, points)
+
+        charge_grid = [[0.0] * n for _ in range(n)]
+        for x, y, q in charges:
+            for i, j, w in self._stencil(x, y):
+                charge_grid[i][j] += w * q
+
+        potential_kernel, field_x_kernel, field_y_kernel = self._kernel_spectra()
+        charge_spectrum = self._charge_spectrum(charge_grid)
+        self.potential_grid = self._convolve(charge_spectrum, potential_kernel)
+        if self.p3m:
+            self.field_grid = (
+                self._convolve(charge_spectrum, field_x_kernel),
+                self._convolve(charge_spectrum, field_y_kernel),
+            )
+        else:
+            self.field_grid = self._gradient(self.potential_grid)
+
+        if self.p3m:
+            self._build_cells(charges)
+        else:
+            self._cells = None
+
+    def potential_at_points(self, points):
+        """Interpolate the solved potential to the given points."""
+        grid = self.potential_grid
+        results = []
+
+        for x, y in points:
+            v = 0.0
+            for i, j, w in self._stencil(x, y):
+                v += w * grid[i][j]
+            if self._cells is not None:
+                short = self._short_range(x, y, want_field=False)
+                if short is None:
+                    results.append(None)
+                    continue
+                v += short
+            results.append(v)
+
+        return results
+
+    def field_at_points(self, points):
+        """Interpolate the solved electric field to the given points."""
+        grid_x, grid_y = self.field_grid
+        results = []
+
+        for x, y in points:
+            e_x, e_y = 0.0, 0.0
+            for i, j, w in self._stencil(x, y):
+                e_x += w * grid_x[i][j]
+                e_y += w * grid_y[i][j]
+            if self._cells is not None:
+                short = self._short_range(x, y, want_field=True)
+                if short is None:
+                    results.append(None)
+                    continue
+                e_x += short[0]
+                e_y += short[1]
+            results.append((e_x, e_y))
+
+        return results
+
+    def accuracy_report(self, particles, points):
+        """
+        Compare the mesh solution against direct summation.
+
+        Returns a dictionary with RMS and maximum relative errors for the
+        potential and field, plus the wall time of each method.
+        """
+        start = time.perf_counter()
+        mesh_v = self.calc_potential_at_points(particles, points)
+        mesh_e = self.field_at_points(points)
+        mesh_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        direct_v = self.engine.calc_potential_at_points(particles, points)
+        direct_e = self.engine.calc_field_at_points(particles, points)
+        direct_time = time.perf_counter() - start
+
+        v_num, v_den, v_max = 0.0, 0.0, 0.0
+        e_num, e_den, e_max = 0.0, 0.0, 0.0
+        compared = 0
+
+        for mv, me, dv, de in zip(mesh_v, mesh_e, direct_v, direct_e):
+            if None in (mv, me, dv, de):
+                continue
+            compared += 1
+            v_num += (mv - dv) ** 2
+            v_den += dv ** 2
+            if dv != 0:
+                v_max = max(v_max, abs(mv - dv) / abs(dv))
+
+            err = math.hypot(me[0] - de[0], me[1] - de[1])
+            ref = math.hypot(de[0], de[1])
+            e_num += err ** 2
+            e_den += ref ** 2
+            if ref != 0:
+                e_max = max(e_max, err / ref)
+
+        return {
+            'points_compared': compared,
+            'potential_rms_rel_error': math.sqrt(v_num / v_den) if v_den else 0.0,
+            'potential_max_rel_error': v_max,
+            'field_rms_rel_error': math.sqrt(e_num / e_den) if e_den else 0.0,
+            'field_max_rel_error': e_max,
+            'mesh_time': mesh_time,
+            'direct_time': direct_time,
+        }
+
+    # ----- Mesh geometry and charge assignment -----
+
+    @staticmethod
+    def _point_charges(particles):
+        """Flatten particles and distributions into (x, y, q) tuples."""
+        charges = []
+        for p in particles:
+            q = p.charge * p.sign
+            if isinstance(p, ChargeDistribution):
+                charges.extend((x, y, q * fraction) for x, y, fraction in p.fine_nodes())
+            else:
+                charges.append((p.x, p.y, q))
+        return charges
+
+    def _fit_mesh(self, charges, points):
+        """Choose mesh origin and spacing to cover charges and points."""
+        xs = [x for x, _, _ in charges] + [x for x, _ in points]
+        ys = [y for _, y, _ in charges] + [y for _, y in points]
+        if not xs:
+            xs, ys = [0.0], [0.0]
+
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        extent = max(max_x - min_x, max_y - min_y, 1e-9)
+
+        # Keep a margin of nodes on each side for the assignment stencil
+        # and the central-difference gradient.
+        margin = 3
+        spacing = extent / (self.grid_size - 1 - 2 * margin)
+        center_x = (min_x + max_x) / 2
+        center_y = (min_y + max_y) / 2
+        half = spacing * (self.grid_size - 1) / 2
+
+        self.spacing = spacing
+        self.origin = (center_x - half, center_y - half)
+
+    def _stencil(self, x, y):
+        """Return (i, j, weight) mesh nodes for a point; i indexes x."""
+        u = (x - self.origin[0]) / self.spacing
+        v = (y - self.origin[1]) / self.spacing
+        last = self.grid_size - 1
+
+        if self.assignment == "cic":
+            i0 = min(max(int(math.floor(u)), 0), last - 1)
+            j0 = min(max(int(math.floor(v)), 0), last - 1)
+            fu, fv = u - i0, v - j0
+            return (
+                (i0, j0, (1 - fu) * (1 - fv)),
+                (i0 + 1, j0, fu * (1 - fv)),
+                (i0, j0 + 1, (1 - fu) * fv),
+                (i0 + 1, j0 + 1, fu * fv),
+            )
+
+        i0 = min(max(int(round(u)), 1), last - 1)
+        j0 = min(max(int(round(v)), 1), last - 1)
+        du, dv = u - i0, v - j0
+        wu = (0.5 * (0.5 - du) ** 2, 0.75 - du * du, 0.5 * (0.5 + du) ** 2)
+        wv = (0.5 * (0.5 - dv) ** 2, 0.75 - dv * dv, 0.5 * (0.5 + dv) ** 2)
+        return tuple(
+            (i0 + a - 1, j0 + b - 1, wu[a] * wv[b])
+            for a in range(3)
+            for b in range(3)
+        )
+
+    # ----- Poisson solve -----
+
+    def _kernel_value(self, r):
+        """Green's function of the mesh part at distance r."""
+        k = self.engine.k
+        if self.p3m:
+            s = self._split
+            if r == 0:
+                return k * 2 / (s * math.sqrt(math.pi))
+            return k * math.erf(r / s) / r
+        if r == 0:
+            # Average of 1/r over a square cell of side h
+            return k * 4 * math.log(1 + math.sqrt(2)) / self.spacing
+        return k / r
+
+    def _kernel_field(self, dx, dy):
+        """Field (-grad) of the P3M mesh kernel at offset (dx, dy)."""
+        r2 = dx * dx + dy * dy
+        if r2 == 0:
+            return 0.0, 0.0
+        s = self._split
+        r = math.sqrt(r2)
+        slope = math.erf(r / s) / r2 - 2 / (s * math.sqrt(math.pi)) * math.exp(-r2 / (s * s)) / r
+        scale = self.engine.k * slope / r
+        return scale * dx, scale * dy
+
+    def _kernel_spectra(self):
+        """
+        FFTs of the zero-padded kernels, cached per mesh spacing: the
+        potential kernel, plus the two field kernels for P3M (None for PM).
+
+        The P3M kernels are smooth, so they are divided by the squared
+        Fourier transform of the assignment window. That undoes the
+        smoothing of depositing and interpolating with the same weights.
+        Plain PM keeps the raw 1/r kernel, whose high frequencies the
+        division would amplify.
+        """
+        self._split = self.split_cells * self.spacing
+        key = (self.grid_size, self.spacing, self.p3m, self.split_cells, self.assignment, self.engine.k)
+        if key in self._kernel_cache:
+            return self._kernel_cache[key]
+
+        n = self.grid_size
+        size = 2 * n
+        h = self.spacing
+        potential, field_x, field_y = [], [], []
+        for i in range(size):
+            di = i if i <= n else i - size
+            row, row_x, row_y = [], [], []
+            for j in range(size):
+                dj = j if j <= n else j - size
+                row.append(complex(self._kernel_value(h * math.hypot(di, dj))))
+                if self.p3m:
+                    # Offsets of exactly n never occur on an n-node mesh
+                    e_x, e_y = (0.0, 0.0) if n in (abs(di), abs(dj)) else self._kernel_field(h * di, h * dj)
+                    row_x.append(complex(e_x))
+                    row_y.append(complex(e_y))
+            potential.append(row)
+            field_x.append(row_x)
+            field_y.append(row_y)
+
+        kernels = [potential, field_x, field_y] if self.p3m else [potential]
+        for kernel in kernels:
+            self._fft2(kernel, inverse=False)
+
+        if self.p3m:
+            power = 2 if self.assignment == "cic" else 3
+            window = []
+            for m in range(size):
+                a = math.pi * (m if m <= n else m - size) / size
+                window.append(1.0 if a == 0 else (math.sin(a) / a) ** power)
+            for kernel in kernels:
+                for i in range(size):
+                    row = kernel[i]
+                    for j in range(size):
+                        row[j] /= (window[i] * window[j]) ** 2
+            spectra = (potential, field_x, field_y)
+        else:
+            spectra = (potential, None, None)
+
+        self._kernel_cache = {key: spectra}  # Only the latest mesh is reused
+        return spectra
+
+    def _charge_spectrum(self, charge_grid):
+        """FFT of the charge grid, zero-padded to twice its size."""
+        n = self.grid_size
+        size = 2 * n
+        padded = [[0j] * size for _ in range(size)]
+        for i in range(n):
+            row = charge_grid[i]
+            padded_row = padded[i]
+            for j in range(n):
+                padded_row[j] = complex(row[j])
+        self._fft2(padded, inverse=False)
+        return padded
+
+    def _convolve(self, charge_spectrum, kernel):
+        """Free-space convolution of the charges with a kernel spectrum."""
+        n = self.grid_size
+        product = [
+            [value * weight for value, weight in zip(row, kernel_row)]
+            for row, kernel_row in zip(charge_spectrum, kernel)
+        ]
+        self._fft2(product, inverse=True)
+        return [[product[i][j].real for j in range(n)] for i in range(n)]
+
+    def _gradient(self, potential):
+        """Electric field E = -grad(V) on the mesh by finite differences."""
+        n = self.grid_size
+        h = self.spacing
+        grid_x = [[0.0] * n for _ in range(n)]
+        grid_y = [[0.0] * n for _ in range(n)]
+
+        for i in range(n):
+            i_lo, i_hi = max(i - 1, 0), min(i + 1, n - 1)
+            for j in range(n):
+                j_lo, j_hi = max(j - 1, 0), min(j + 1, n - 1)
+                grid_x[i][j] = -(potential[i_hi][j] - potential[i_lo][j]) / ((i_hi - i_lo) * h)
+                grid_y[i][j] = -(potential[i][j_hi] - potential[i][j_lo]) / ((j_hi - j_lo) * h)
+
+        return grid_x, grid_y
+
+    def _twiddles(self, size):
+        if size not in self._twiddle_cache:
+            self._twiddle_cache[size] = [
+                cmath.exp(-2j * math.pi * m / size) for m in range(size // 2)
+            ]
+        return self._twiddle_cache[size]
+
+    def _fft(self, data, inverse):
+        """In-place iterative radix-2 FFT of a list of complex numbers."""
+        size = len(data)
+        j = 0
+        for i in range(1, size):
+            bit = size >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                data[i], data[j] = data[j], data[i]
+
+        twiddles = self._twiddles(size)
+        length = 2
+        while length <= size:
+            half = length // 2
+            step = size // length
+            for start in range(0, size, length):
+                for m in range(half):
+                    w = twiddles[m * step]
+                    if inverse:
+                        w = w.conjugate()
+                    a = data[start + m]
+                    b = data[start + m + half] * w
+                    data[start + m] = a + b
+                    data[start + m + half] = a - b
+            length <<= 1
+
+        if inverse:
+            for i in range(size):
+                data[i] /= size
+
+    def _fft2(self, grid, inverse):
+        """In-place 2D FFT of a square list-of-lists grid."""
+        size = len(grid)
+        for row in grid:
+            self._fft(row, inverse)
+        for j in range(size):
+            column = [grid[i][j] for i in range(size)]
+            self._fft(column, inverse)
+            for i in range(size):
+                grid[i][j] = column[i]
+
+    # ----- P3M short-range correction -----
+
+    def _build_cells(self, charges):
+        """Bin charges into cells of the short-range cutoff size."""
+        self._cutoff = 3 * self._split  # erfc(3) ~ 2e-5
+        cells = {}
+        k = self.engine.k
+        for x, y, q in charges:
+            key = (int(math.floor(x / self._cutoff)), int(math.floor(y / self._cutoff)))
+            cells.setdefault(key, []).append((x, y, k * q))
+        self._cells = cells
+
+    def _short_range(self, x, y, want_field):
+        """Direct erfc-screened sum over charges within the cutoff."""
+        s = self._split
+        cutoff2 = self._cutoff ** 2
+        ci = int(math.floor(x / self._cutoff))
+        cj = int(math.floor(y / self._cutoff))
+        v, e_x, e_y = 0.0, 0.0, 0.0
+        gauss = 2 / (s * math.sqrt(math.pi))
+
+        for a in (ci - 1, ci, ci + 1):
+            for b in (cj - 1, cj, cj + 1):
+                for px, py, kq in self._cells.get((a, b), ()):
+                    dx = x - px
+                    dy = y - py
+                    r2 = dx * dx + dy * dy
+                    if r2 == 0:
+                        return None
+                    if r2 > cutoff2:
+                        continue
+                    r = math.sqrt(r2)
+                    screened = math.erfc(r / s) / r
+                    if want_field:
+                        scale = kq * (screened + gauss * math.exp(-r2 / (s * s))) / r2
+                        e_x += scale * dx
+                        e_y += scale * dy
+                    else:
+                        v += kq * screened
+
+        return (e_x, e_y) if want_field else v
+
+
+class Conductor:
+    """
+    An equipotential conductor held at a fixed potential.
+
+    Attributes:
+        shape (str): "segment", "circle" or "polygon".
+        points (list): Segment end points, the circle center, or the
+            polygon vertices, as (x, y) tuples.
+        radius (float): Circle radius (circles only).
+        potential (float): Fixed potential of the conductor in volts.
+        thickness (float): Wire radius; the potential is enforced this far
+            from the panel charges.
+        canvas_id (int): Canvas ID for the drawn outline.
+    """
+
+    SHAPES = ("segment", "circle", "polygon")
+
+    def __init__(self, shape, points, potential=0.0, radius=None, thickness=0.05):
+        if shape not in self.SHAPES:
+            raise ValueError(f"Unknown conductor shape: {shape}")
+        if shape == "segment" and len(points) != 2:
+            raise ValueError("A segment conductor needs exactly 2 points")
+        if shape == "circle" and (len(points) != 1 or not radius or radius <= 0):
+            raise ValueError("A circle conductor needs a center and a positive radius")
+        if shape == "polygon" and len(points) < 3:
+            raise ValueError("A polygon conductor needs at least 3 vertices")
+
+        self.shape = shape
+        self.points = [tuple(p) for p in points]
+        self.radius = radius
+        self.potential = potential
+        self.thickness = thickness
+        self.canvas_id = None
+
+    def to_dict(self):
+        """Convert conductor to dictionary for JSON serialization."""
+        return {
+            'shape': self.shape,
+            'points': [list(p) for p in self.points],
+            'radius': self.radius,
+            'potential': self.potential,
+            'thickness': self.thickness
+        }
+
+    @staticmethod
+    def from_dict(data):
+        """Create conductor from dictionary."""
+        return Conductor(
+            data['shape'], data['points'], data.get('potential', 0.0),
+            data.get('radius'), data.get('thickness', 0.05)
+        )
+
+    def outline(self):
+        """Return the boundary as a list of (x, y) vertices."""
+        if self.shape == "segment":
+            return list(self.points)
+        if self.shape == "polygon":
+            return list(self.points) + [self.points[0]]
+
+        cx, cy = self.points[0]
+        count = max(24, int(2 * math.pi * self.radius / 0.25))
+        return [
+            (cx + self.radius * math.cos(2 * math.pi * i / count),
+             cy + self.radius * math.sin(2 * math.pi * i / count))
+            for i in range(count + 1)
+        ]
+
+    def panels(self, panel_length=0.25):
+        """
+        Split the boundary into straight panels.
+
+        Returns a list of (mid_x, mid_y, length, normal_x, normal_y).
+        """
+        outline = self.outline()
+        panels = []
+
+        for (x1, y1), (x2, y2) in zip(outline, outline[1:]):
+            edge = math.hypot(x2 - x1, y2 - y1)
+            if edge == 0:
+                continue
+            count = max(1, int(math.ceil(edge / panel_length)))
+            tx, ty = (x2 - x1) / edge, (y2 - y1) / edge
+            for i in range(count):
+                t = (i + 0.5) / count
+                panels.append((x1 + t * (x2 - x1), y1 + t * (y2 - y1), edge / count, -ty, tx))
+
+        return panels
+
+
+class InducedCharge:
+    """
+    A panel charge induced on a conductor.
+
+    Exposes the same x, y, charge and sign attributes as Particle, so the
+    physics engine treats it as an ordinary point charge.
+    """
+
+    __slots__ = ("x", "y", "charge", "sign", "conductor")
+
+    def __init__(self, x, y, conductor):
+        self.x = x
+        self.y = y
+        self.charge = 0.0
+        self.sign = 1
+        self.conductor = conductor
+
+    def set_charge(self, q):
+        """Set the signed charge of the panel."""
+        self.charge = abs(q)
+        self.sign = 1 if q >= 0 else -1
+
+
+class ConductorSolver:
+    """
+    Boundary-element solve for the surface charge on conductors.
+
+    Each conductor boundary is split into panels carrying an unknown point
+    charge at the panel midpoint. The charges are chosen so that the
+    potential at every collocation point, one wire radius off each panel,
+    from the free particles plus all panel charges, equals the conductor
+    potential. The panel charges are solved and later evaluated with the
+    same point-charge kernel, so the field the app shows meets the
+    boundary condition at the collocation points.
+
+    The linear system is solved with restarted GMRES; every matrix-vector
+    product is a single batched potential evaluation through the backend
+    (PhysicsEngine or ParticleMeshSolver), so no dense matrix is built.
+    """
+
+    def __init__(self, engine, backend=None, panel_length=0.25, tolerance=1e-8,
+                 max_iterations=300, restart=40):
+        self.engine = engine
+        self.backend = backend or engine
+        self.panel_length = panel_length
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.restart = restart
+        self.last_report = None
+
+    @instrumented("engine", particles_arg=2)
+    def solve(self, conductors, particles):
+        """
+        Solve for the induced charges.
+
+        Returns a list of InducedCharge objects. Solve statistics are stored
+        in last_report.
+        """
+        start = time.perf_counter()
+        charges = []
+        rhs_potential = []
+
+        for conductor in conductors:
+            for mx, my, length, nx, ny in conductor.panels(self.panel_length):
+                charges.append(InducedCharge(mx, my, conductor))
+                rhs_potential.append(conductor.potential)
+        targets = self.collocation_points(conductors)
+
+        if not charges:
+            self.last_report = {'panels': 0, 'iterations': 0, 'matvecs': 0,
+                                'residual': 0.0, 'solve_time': 0.0}
+            return charges
+
+        external = self.backend.calc_potential_at_points(particles, targets)
+        if None in external:
+            raise ValueError("A particle lies on a conductor surface")
+        b = [v - ext for v, ext in zip(rhs_potential, external)]
+
+        matvecs = [0]
+
+        def matvec(q):
+            matvecs[0] += 1
+            for charge, value in zip(charges, q):
+                charge.set_charge(value)
+            return self.backend.calc_potential_at_points(charges, targets)
+
+        solution, iterations, residual = self._gmres(matvec, b)
+
+        for charge, value in zip(charges, solution):
+            charge.set_charge(value)
+
+        self.last_report = {
+            'panels': len(charges),
+            'iterations': iterations,
+            'matvecs': matvecs[0],
+            'residual': residual,
+            'solve_time': time.perf_counter() - start,
+        }
+        return charges
+
+    def collocation_points(self, conductors):
+        """Points, one wire radius off each panel midpoint, where V is enforced."""
+        targets = []
+        for conductor in conductors:
+            a = conductor.thickness
+            for mx, my, length, nx, ny in conductor.panels(self.panel_length):
+                targets.append((mx + a * nx, my + a * ny))
+        return targets
+
+    def _gmres(self, matvec, b):
+        """
+        Restarted GMRES with Givens rotations.
+
+        Returns (solution, iterations, relative residual).
+        """
+        n = len(b)
+        x = [0.0] * n
+        b_norm = math.sqrt(sum(v * v for v in b)) or 1.0
+        iterations = 0
+        relative = 1.0
+
+        while iterations < self.max_iterations:
+            ax = matvec(x)
+            r = [bi - ai for bi, ai in zip(b, ax)]
+            beta = math.sqrt(sum(v * v for v in r))
+            relative = beta / b_norm
+            if relative < self.tolerance:
+                break
+
+            basis = [[v / beta for v in r]]
+            columns = []
+            cosines, sines = [], []
+            g = [beta]
+
+            for j in range(self.restart):
+                w = matvec(basis[j])
+                iterations += 1
+
+                h = []
+                for vec in basis:
+                    coef = sum(wi * vi for wi, vi in zip(w, vec))
+                    w = [wi - coef * vi for wi, vi in zip(w, vec)]
+                    h.append(coef)
+                w_norm = math.sqrt(sum(v * v for v in w))
+                h.append(w_norm)
+
+                for i in range(j):
+                    temp = cosines[i] * h[i] + sines[i] * h[i + 1]
+                    h[i + 1] = -sines[i] * h[i] + cosines[i] * h[i + 1]
+                    h[i] = temp
+                denom = math.hypot(h[j], h[j + 1])
+                cosines.append(h[j] / denom)
+                sines.append(h[j + 1] / denom)
+                h[j] = denom
+                h[j + 1] = 0.0
+                g.append(-sines[j] * g[j])
+                g[j] = cosines[j] * g[j]
+                columns.append(h)
+
+                relative = abs(g[j + 1]) / b_norm
+                if w_norm == 0 or relative < self.tolerance or iterations >= self.max_iterations:
+                    break
+                basis.append([v / w_norm for v in w])
+
+            # Back substitution for the least-squares update
+            m = len(columns)
+            y = [0.0] * m
+            for i in range(m - 1, -1, -1):
+                total = g[i] - sum(columns[l][i] * y[l] for l in range(i + 1, m))
+                y[i] = total / columns[i][i]
+            for i in range(m):
+                vec = basis[i]
+                x = [xi + y[i] * vi for xi, vi in zip(x, vec)]
+
+            if relative < self.tolerance:
+                break
+
+        return x, iterations, relative
+
+
+class SuperpositionCache:
+    """
+    Per-source contribution (Green's function) cache over a fixed probe set.
+
+    Potential and field are linear in each source's charge, so the cache
+    stores the unit-charge potential and field of every source at every
+    probe point. Changing one charge is then a rank-1 update of the cached
+    totals, and sweeping one charge over many values is a single
+    multiply-add per value instead of a full re-summation.
+
+    Sources are indexed by their position in the list passed in, which for
+    the GUI is the order of ElectrostaticsCalculator.sources(). Charge
+    distributions can be swept and re-charged but not moved. Charges
+    induced on conductors depend on every other source, so a cache that
+    includes them cannot be swept. With track_energy=False the O(N^2)
+    system energy is neither computed nor updated (energy is None).
+
+    With keep_basis=False only the totals are stored, in O(M) memory, and
+    a source's unit contribution is recomputed when it changes. Updates
+    cost the same O(M), so overlays over many sources use this form.
+    values, if given, are the (v, e_x, e_y) totals already evaluated at
+    the points (None on a charge), which saves the initial evaluation.
+
+    The cache records each source's position and charge and the engine
+    precision it was built with. sync() compares them with a source list
+    and applies the differences as rank-1 updates.
+    """
+
+    def __init__(self, engine, sources, points, track_energy=True, keep_basis=True, values=None):
+        self.engine = engine
+        self.precision = engine.precision
+        self.points = [tuple(p) for p in points]
+        self.sources = list(sources)
+        self.positions = [(s.x, s.y) for s in self.sources]
+        self.charges = [s.charge * s.sign for s in self.sources]
+        self.keep_basis = keep_basis
+
+        m = len(self.points)
+        self.potential_basis = []
+        self.field_x_basis = []
+        self.field_y_basis = []
+
+        self.has_distributions = any(isinstance(s, ChargeDistribution) for s in self.sources)
+        self.has_induced = any(isinstance(s, InducedCharge) for s in self.sources)
+        if keep_basis:
+            self.potential = array('d', bytes(8 * m))
+            self.field_x = array('d', bytes(8 * m))
+            self.field_y = array('d', bytes(8 * m))
+            for index, q in enumerate(self.charges):
+                g_v, g_x, g_y = self._unit_contribution(index)
+                self.potential_basis.append(g_v)
+                self.field_x_basis.append(g_x)
+                self.field_y_basis.append(g_y)
+                self._accumulate(g_v, g_x, g_y, q)
+        else:
+            if values is None:
+                values = engine.calc_potential_and_field_at_points(self.sources, self.points)
+            self.potential, self.field_x, self.field_y = array('d'), array('d'), array('d')
+            for value in values:
+                v, e_x, e_y = (math.nan, math.nan, math.nan) if value is None else value
+                self.potential.append(v)
+                self.field_x.append(e_x)
+                self.field_y.append(e_y)
+
+        self.track_energy = track_energy
+        self.energy = engine.calc_potential_energy(self.sources) if track_energy else None
+
+    def _unit_contribution(self, index):
+        """
+        Potential and field of source index with unit charge at every
+        probe, with the source at its cached position.
+        """
+        source = self.sources[index]
+        k = self.engine.k
+        g_v, g_x, g_y = array('d'), array('d'), array('d')
+
+        if isinstance(source, ChargeDistribution):
+            for point_x, point_y in self.points:
+                v = source.unit_potential_at(k, point_x, point_y)
+                field = source.unit_field_at(k, point_x, point_y)
+                if v is None or field is None:
+                    g_v.append(math.nan)
+                    g_x.append(math.nan)
+                    g_y.append(math.nan)
+                    continue
+                g_v.append(v)
+                g_x.append(field[0])
+                g_y.append(field[1])
+            return g_v, g_x, g_y
+
+        x, y = self.positions[index]
+        for point_x, point_y in self.points:
+            dx = point_x - x
+            dy = point_y - y
+            r2 = dx * dx + dy * dy
+            if r2 == 0:
+                # Undefined at the charge itself; NaN propagates through sums
+                g_v.append(math.nan)
+                g_x.append(math.nan)
+                g_y.append(math.nan)
+                continue
+            r = math.sqrt(r2)
+            g_v.append(k / r)
+            g_x.append(k * dx / (r2 * r))
+            g_y.append(k * dy / (r2 * r))
+
+        return g_v, g_x, g_y
+
+    def _column(self, index):
+        """Stored or recomputed unit contribution of source index."""
+        if self.keep_basis:
+            return self.potential_basis[index], self.field_x_basis[index], self.field_y_basis[index]
+        return self._unit_contribution(index)
+
+    def _accumulate(self, g_v, g_x, g_y, scale):
+        """Add scale times a basis column to the cached totals."""
+        potential, field_x, field_y = self.potential, self.field_x, self.field_y
+        for i in range(len(potential)):
+            potential[i] += scale * g_v[i]
+            field_x[i] += scale * g_x[i]
+            field_y[i] += scale * g_y[i]
+
+    def _source_potential(self, index):
+        """
+        Potential at source index due to every other source (averaged over
+        the source when it is a distribution), with every source at its
+        cached position. Returns None if another source touches it, in
+        which case the energy is infinite.
+        """
+        source = self.sources[index]
+        if self.has_distributions:
+            v = 0
+            for other, q in zip(self.sources, self.charges):
+                if other is source:
+                    continue
+                coupling = self.engine.pair_coupling(source, other)
+                if coupling is None:
+                    return None
+                v += q * coupling
+            return v
+
+        x, y = self.positions[index]
+        v = 0
+        for j, ((other_x, other_y), q) in enumerate(zip(self.positions, self.charges)):
+            if j == index:
+                continue
+            dx = other_x - x
+            dy = other_y - y
+            r2 = dx * dx + dy * dy
+            if r2 == 0:
+                return None
+            v += q / math.sqrt(r2)
+        return self.engine.k * v
+
+    def values(self):
+        """
+        Return (potentials, fields) at the probe points.
+
+        Fields are (e_x, e_y) tuples; points that coincide with a source
+        are None, matching PhysicsEngine.calc_*_at_points.
+        """
+        potentials, fields = [], []
+        for v, e_x, e_y in zip(self.potential, self.field_x, self.field_y):
+            if math.isnan(v):
+                potentials.append(None)
+                fields.append(None)
+            else:
+                potentials.append(v)
+                fields.append((e_x, e_y))
+        return potentials, fields
+
+    def set_charge(self, index, charge):
+        """Rank-1 update after source index changes to the signed charge."""
+        delta = charge - self.charges[index]
+        if delta == 0:
+            return
+        self._accumulate(*self._column(index), delta)
+        self.charges[index] = charge
+        if self.track_energy:
+            phi = self._source_potential(index)
+            if phi is None:
+                self.energy = self.engine.calc_potential_energy(self.sources)
+            else:
+                self.energy += delta * phi
+
+    def move_source(self, index, x, y):
+        """
+        Move source index to (x, y) and update the cache incrementally by
+        subtracting its old contribution and adding the new one.
+        """
+        source = self.sources[index]
+        if isinstance(source, ChargeDistribution):
+            raise ValueError("Charge distributions cannot be moved in the cache")
+        q = self.charges[index]
+        g_v, g_x, g_y = self._column(index)
+        # Probes the source used to sit on hold NaN and must be re-summed
+        stale = [i for i, g in enumerate(g_v) if math.isnan(g)]
+
+        phi_before = self._source_potential(index) if self.track_energy else None
+        self._accumulate(g_v, g_x, g_y, -q)
+
+        source.x, source.y = x, y
+        self.positions[index] = (x, y)
+        g_v, g_x, g_y = self._unit_contribution(index)
+        if self.keep_basis:
+            self.potential_basis[index] = g_v
+            self.field_x_basis[index] = g_x
+            self.field_y_basis[index] = g_y
+        self._accumulate(g_v, g_x, g_y, q)
+
+        if self.track_energy:
+            phi_after = self._source_potential(index)
+            if phi_before is None or phi_after is None:
+                self.energy = self.engine.calc_potential_energy(self.sources)
+            else:
+                self.energy += q * (phi_after - phi_before)
+
+        self._resum_points(stale)
+
+    def _resum_points(self, indices):
+        """Recompute the cached totals at the given probes from scratch."""
+        if not indices:
+            return
+        if self.keep_basis:
+            values = []
+            for i in indices:
+                v, e_x, e_y = 0.0, 0.0, 0.0
+                for q, g_v, g_x, g_y in zip(self.charges, self.potential_basis,
+                                            self.field_x_basis, self.field_y_basis):
+                    v += q * g_v[i]
+                    e_x += q * g_x[i]
+                    e_y += q * g_y[i]
+                values.append((v, e_x, e_y))
+        else:
+            values = self.engine.calc_potential_and_field_at_points(
+                self.sources, [self.points[i] for i in indices]
+            )
+        for i, value in zip(indices, values):
+            v, e_x, e_y = (math.nan, math.nan, math.nan) if value is None else value
+            self.potential[i] = v
+            self.field_x[i] = e_x
+            self.field_y[i] = e_y
+
+    def sync(self, sources, max_changes=None):
+        """
+        Bring the cache up to date with sources through rank-1 updates.
+
+        Returns False, leaving the cache unchanged, when the sources are
+        not the same objects in the same order, the engine precision has
+        changed, a distribution has moved, or more than max_changes
+        sources differ. The caller should then build a new cache.
+        """
+        sources = list(sources)
+        if self.engine.precision != self.precision or len(sources) != len(self.sources) \
+                or any(map(operator.is_not, sources, self.sources)):
+            return False
+
+        positions = [(s.x, s.y) for s in sources]
+        charges = [s.charge * s.sign for s in sources]
+        if positions == self.positions and charges == self.charges:
+            return True
+        moved = [i for i, (a, b) in enumerate(zip(positions, self.positions)) if a != b]
+        recharged = [i for i, (a, b) in enumerate(zip(charges, self.charges)) if a != b]
+        if any(isinstance(sources[i], ChargeDistribution) for i in moved):
+            return False
+
+        changes = len(set(moved) | set(recharged))
+        if max_changes is not None and changes > max_changes:
+            return False
+
+        for index in recharged:
+            source = self.sources[index]
+            self.set_charge(index, source.charge * source.sign)
+        for index in moved:
+            source = self.sources[index]
+            self.move_source(index, source.x, source.y)
+        if self.track_energy and self.has_distributions:
+            # Distribution couplings read the live positions, which had already moved
+            self.energy = self.engine.calc_potential_energy(self.sources)
+        # A probe left undefined by one update may be covered by another
+        self._resum_points([i for i, v in enumerate(self.potential) if math.isnan(v)])
+        return True
+
+    def sweep(self, index, charges):
+        """
+        Evaluate the probes and system energy as source index takes each of
+        the given signed charges, without changing the cached state.
+
+        Returns a dictionary with 'charges', 'potential' and 'field' (one
+        list over the probe points per swept charge) and 'energy'.
+        """
+        if self.has_induced:
+            raise ValueError("Induced conductor charges must be re-solved for each swept charge")
+
+        q0 = self.charges[index]
+        g_v, g_x, g_y = self._column(index)
+
+        # Everything except the swept source, computed once
+        rest_v = [v - q0 * g for v, g in zip(self.potential, g_v)]
+        rest_x = [e - q0 * g for e, g in zip(self.field_x, g_x)]
+        rest_y = [e - q0 * g for e, g in zip(self.field_y, g_y)]
+        phi = None
+        if self.track_energy:
+            phi = self._source_potential(index)
+            if phi is None:
+                # The swept source touches another, so resolve each pair as the engine does
+                swept = self.sources[index]
+                others = [s for s in self.sources if s is not swept]
+                rest_u = self.engine.calc_potential_energy(others)
+                couplings = [(self.engine.pair_coupling(swept, other), other.charge * other.sign)
+                             for other in others]
+            else:
+                rest_u = self.energy - q0 * phi
+
+        result = {'charges': list(charges), 'potential': [], 'field': [], 'energy': []}
+        for q in charges:
+            potentials, fields = [], []
+            for v, e_x, e_y, gv, gx, gy in zip(rest_v, rest_x, rest_y, g_v, g_x, g_y):
+                v = v + q * gv
+                if math.isnan(v):
+                    potentials.append(None)
+                    fields.append(None)
+                else:
+                    potentials.append(v)
+                    fields.append((e_x + q * gx, e_y + q * gy))
+            result['potential'].append(potentials)
+            result['field'].append(fields)
+            if not self.track_energy:
+                result['energy'].append(None)
+            elif phi is None:
+                result['energy'].append(rest_u + sum(
+                    math.copysign(math.inf, q * q_other) if coupling is None else q * q_other * coupling
+                    for coupling, q_other in couplings
+                ))
+            else:
+                result['energy'].append(rest_u + q * phi)
+
+        return result
+
+
+class QuadtreeCell:
+    """
+    A square cell of a FieldQuadtree.
+
+    Attributes:
+        i (int): Lattice index of the lower-left corner along x.
+        j (int): Lattice index of the lower-left corner along y.
+        span (int): Side length in lattice units (a power of two).
+        level (int): Refinement level, 0 for the coarse grid.
+        children (list): The four sub-cells, or None for a leaf.
+    """
+
+    __slots__ = ("i", "j", "span", "level", "children")
+
+    def __init__(self, i, j, span, level):
+        self.i = i
+        self.j = j
+        self.span = span
+        self.level = level
+        self.children = None
+
+    def corner_keys(self):
+        """Lattice keys of the corners: (0,0), (1,0), (0,1), (1,1)."""
+        i, j, s = self.i, self.j, self.span
+        return ((i, j), (i + s, j), (i, j + s), (i + s, j + s))
+
+    def center_key(self):
+        half = self.span // 2
+        return (self.i + half, self.j + half)
+
+    def split(self):
+        half = self.span // 2
+        level = self.level + 1
+        self.children = [
+            QuadtreeCell(self.i, self.j, half, level),
+            QuadtreeCell(self.i + half, self.j, half, level),
+            QuadtreeCell(self.i, self.j + half, half, level),
+            QuadtreeCell(self.i + half, self.j + half, half, level),
+        ]
+        return self.children
+
+
+class FieldQuadtree:
+    """
+    Sparse quadtree of potential and field samples.
+
+    Sample points lie on a lattice of the finest spacing; values maps a
+    lattice key (i, j) to (v, e_x, e_y), or None where a sample landed on
+    a charge. Leaves can be drawn as a heatmap, traced for contours, or
+    interpolated at any point with lookup().
+    """
+
+    def __init__(self, origin, spacing, root_span, roots, values, evaluations, calls,
+                 budget_reached=False):
+        self.origin = origin
+        self.spacing = spacing
+        self.root_span = root_span
+        self.roots = roots
+        self.values = values
+        self.evaluations = evaluations
+        self.calls = calls
+        self.budget_reached = budget_reached
+
+        self.columns = 1 + max(cell.i for cell in roots.values()) // root_span
+        self.rows = 1 + max(cell.j for cell in roots.values()) // root_span
+
+    def point(self, key):
+        """Plane coordinates of a lattice key."""
+        return (self.origin[0] + key[0] * self.spacing, self.origin[1] + key[1] * self.spacing)
+
+    def cell_bounds(self, cell):
+        """Return (x0, y0, x1, y1) of a cell in plane coordinates."""
+        x0, y0 = self.point((cell.i, cell.j))
+        size = cell.span * self.spacing
+        return x0, y0, x0 + size, y0 + size
+
+    def leaves(self):
+        """Yield every leaf cell."""
+        stack = list(self.roots.values())
+        while stack:
+            cell = stack.pop()
+            if cell.children:
+                stack.extend(cell.children)
+            else:
+                yield cell
+
+    def cell_value(self, cell):
+        """Mean (v, e_x, e_y) over a cell's defined corners, or None."""
+        samples = [self.values.get(k) for k in cell.corner_keys()]
+        samples = [s for s in samples if s is not None]
+        if not samples:
+            return None
+        count = len(samples)
+        return tuple(sum(s[c] for s in samples) / count for c in range(3))
+
+    def lookup(self, x, y):
+        """
+        Bilinearly interpolate (v, e_x, e_y) at a point from its leaf, or
+        return None outside the tree or next to a charge.
+        """
+        u = (x - self.origin[0]) / self.spacing
+        w = (y - self.origin[1]) / self.spacing
+        cell = self.roots.get((int(math.floor(u / self.root_span)), int(math.floor(w / self.root_span))))
+        if cell is None:
+            return None
+
+        while cell.children:
+            half = cell.span // 2
+            right = u >= cell.i + half
+            top = w >= cell.j + half
+            cell = cell.children[right + 2 * top]
+
+        samples = [self.values.get(k) for k in cell.corner_keys()]
+        if None in samples:
+            return None
+        fu = (u - cell.i) / cell.span
+        fw = (w - cell.j) / cell.span
+        weights = ((1 - fu) * (1 - fw), fu * (1 - fw), (1 - fu) * fw, fu * fw)
+        return tuple(sum(wt * s[c] for wt, s in zip(weights, samples)) for c in range(3))
+
+    def contour_segments(self, level):
+        """
+        Trace the equipotential V = level through the leaves (marching
+        squares). Returns a list of ((x1, y1), (x2, y2)) segments.
+        """
+        segments = []
+        for cell in self.leaves():
+            keys = cell.corner_keys()
+            samples = [self.values.get(k) for k in keys]
+            if None in samples:
+                continue
+            # Walk the corners anticlockwise: (0,0), (1,0), (1,1), (0,1)
+            ring = [(keys[a], samples[a][0]) for a in (0, 1, 3, 2)]
+            crossings = []
+            for (k1, v1), (k2, v2) in zip(ring, ring[1:] + ring[:1]):
+                if (v1 < level) != (v2 < level):
+                    t = (level - v1) / (v2 - v1)
+                    p1, p2 = self.point(k1), self.point(k2)
+                    crossings.append((p1[0] + t * (p2[0] - p1[0]), p1[1] + t * (p2[1] - p1[1])))
+            for a in range(0, len(crossings) - 1, 2):
+                segments.append((crossings[a], crossings[a + 1]))
+        return segments
+
+    @property
+    def uniform_evaluations(self):
+        """
+        Samples a uniform grid would need to match the finest leaf. Cells
+        refined to the level cap count against a grid at that level, not
+        against the lattice the cap would allow.
+        """
+        finest = min(cell.span for cell in self.leaves())
+        return (self.columns * self.root_span // finest + 1) * (self.rows * self.root_span // finest + 1)
+
+    @property
+    def savings(self):
+        """Fraction of uniform-grid evaluations that were avoided."""
+        return 1 - self.evaluations / self.uniform_evaluations
+
+
+class AdaptiveFieldSampler:
+    """
+    Samples potential and field on an adaptive quadtree.
+
+    Sampling starts from a coarse grid over the requested bounds. A cell is
+    subdivided when the value of V or |E| at its center disagrees with the
+    average of its corners by more than the relative tolerance, or when a
+    sample is undefined, down to max_level refinements. All new samples of
+    a refinement level are evaluated in one batched backend call.
+
+    max_terms, if given, caps sources x samples. The coarse grid is halved
+    (down to 4 cells across) until it fits the cap; after that the cells
+    with the largest errors are refined first and refinement stops once
+    the next cell would exceed the cap.
+    """
+
+    def __init__(self, backend, tolerance=0.05, max_level=5, coarse_cells=16, max_terms=None):
+        self.backend = backend
+        self.tolerance = tolerance
+        self.max_level = max_level
+        self.coarse_cells = coarse_cells
+        self.max_terms = max_terms
+
+    def sample(self, particles, bounds):
+        """Sample the field of the particles over (x0, y0, x1, y1)."""
+        x0, y0, x1, y1 = bounds
+        budget = None if self.max_terms is None else self.max_terms // max(1, len(particles))
+        coarse_cells = self.coarse_cells
+        while True:
+            root_size = (x1 - x0) / coarse_cells
+            rows = max(1, int(math.ceil((y1 - y0) / root_size - 1e-9)))
+            coarse_samples = (coarse_cells + 1) * (rows + 1) + coarse_cells * rows
+            if budget is None or coarse_samples <= budget or coarse_cells <= 4:
+                break
+            coarse_cells //= 2
+        root_span = 2 ** self.max_level
+        spacing = root_size / root_span
+
+        roots = {}
+        for ci in range(coarse_cells):
+            for cj in range(rows):
+                roots[(ci, cj)] = QuadtreeCell(ci * root_span, cj * root_span, root_span, 0)
+
+        values = {}
+        evaluations = 0
+        calls = 0
+        budget_reached = False
+        v_floor = e_floor = 0.0
+        cells = list(roots.values())
+
+        for level in range(self.max_level + 1):
+            needed = set()
+            for cell in cells:
+                needed.update(self._sample_keys(cell))
+            keys = sorted(k for k in needed if k not in values)
+
+            if keys:
+                points = [(x0 + i * spacing, y0 + j * spacing) for i, j in keys]
+                values.update(zip(keys, self.backend.calc_potential_and_field_at_points(particles, points)))
+                evaluations += len(keys)
+                calls += 1
+
+            if level == 0:
+                v_floor, e_floor = self._floors(values)
+            if level == self.max_level:
+                break
+
+            candidates = []
+            for cell in cells:
+                error = self._error(cell, values, v_floor, e_floor)
+                if error > 1:
+                    candidates.append((error, cell))
+
+            next_cells = []
+            if budget is None:
+                for _, cell in candidates:
+                    next_cells.extend(cell.split())
+            else:
+                candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+                planned = set()
+                for _, cell in candidates:
+                    half = cell.span // 2
+                    children = [QuadtreeCell(i, j, half, cell.level + 1)
+                                for i in (cell.i, cell.i + half) for j in (cell.j, cell.j + half)]
+                    new = {k for child in children for k in self._sample_keys(child)
+                           if k not in values and k not in planned}
+                    if evaluations + len(planned) + len(new) > budget:
+                        budget_reached = True
+                        break
+                    planned.update(new)
+                    next_cells.extend(cell.split())
+            cells = next_cells
+            if not cells:
+                break
+
+        return FieldQuadtree((x0, y0), spacing, root_span, roots, values, evaluations, calls, budget_reached)
+
+    @staticmethod
+    def _sample_keys(cell):
+        """Lattice keys a cell needs: its corners, and its center unless it is a finest cell."""
+        keys = list(cell.corner_keys())
+        if cell.span > 1:
+            keys.append(cell.center_key())
+        return keys
+
+    def _floors(self, values):
+        """Median |V| and |E| of the coarse samples, used as error floors."""
+        vs = sorted(abs(s[0]) for s in values.values() if s is not None)
+        es = sorted(math.hypot(s[1], s[2]) for s in values.values() if s is not None)
+        if not vs:
+            return 0.0, 0.0
+        return vs[len(vs) // 2], es[len(es) // 2]
+
+    def _error(self, cell, values, v_floor, e_floor):
+        """
+        Interpolation error at the cell center relative to the tolerance;
+        above 1 the cell needs refinement, and it is infinite when a
+        sample is undefined.
+        """
+        center = values[cell.center_key()]
+        corners = [values[k] for k in cell.corner_keys()]
+        if center is None or None in corners:
+            return math.inf
+
+        v_interp = sum(c[0] for c in corners) / 4
+        e_interp = sum(math.hypot(c[1], c[2]) for c in corners) / 4
+        v_center = center[0]
+        e_center = math.hypot(center[1], center[2])
+
+        v_error = abs(v_center - v_interp) / (self.tolerance * max(abs(v_center), v_floor) or math.inf)
+        e_error = abs(e_center - e_interp) / (self.tolerance * max(e_center, e_floor) or math.inf)
+        return max(v_error, e_error)
+
+
+class NullPointFinder:
+    """
+    Locates the points where the net electric field vanishes.
+
+    A batched scan over a grid finds cells where both Ex and Ey change sign
+    between corners. Each candidate is then refined with Newton's method
+    using the analytic field Jacobian, all candidates together in one
+    batched evaluation per iteration. The Hessian of V (minus the
+    Jacobian) classifies each point as a saddle, minimum or maximum of
+    the potential within the plane.
+    """
+
+    def __init__(self, engine, resolution=80, max_iterations=40, tolerance=1e-10):
+        self.engine = engine
+        self.resolution = resolution
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance  # Newton step size relative to a scan cell
+
+    def find(self, particles, bounds):
+        """
+        Return the null points inside (x0, y0, x1, y1) as a list of dicts
+        with 'x', 'y', 'kind', 'potential', 'field' and 'hessian'.
+        """
+        x0, y0, x1, y1 = bounds
+        cell = (x1 - x0) / self.resolution
+        columns = self.resolution
+        rows = max(1, int(math.ceil((y1 - y0) / cell)))
+
+        grid_points = [(x0 + i * cell, y0 + j * cell)
+                       for j in range(rows + 1) for i in range(columns + 1)]
+        fields = self.engine.calc_field_at_points(particles, grid_points)
+
+        def field_at(i, j):
+            return fields[j * (columns + 1) + i]
+
+        seeds = []
+        for j in range(rows):
+            for i in range(columns):
+                corners = (field_at(i, j), field_at(i + 1, j), field_at(i, j + 1), field_at(i + 1, j + 1))
+                if None in corners:
+                    continue
+                ex_signs = {c[0] > 0 for c in corners}
+                ey_signs = {c[1] > 0 for c in corners}
+                if len(ex_signs) == 2 and len(ey_signs) == 2:
+                    seeds.append((x0 + (i + 0.5) * cell, y0 + (j + 0.5) * cell))
+
+        roots = self._newton(particles, seeds, cell, bounds)
+        return self._classify(particles, self._deduplicate(roots, cell))
+
+    def _newton(self, particles, seeds, cell, bounds):
+        """Refine all seeds together; returns the converged positions."""
+        x0, y0, x1, y1 = bounds
+        active = list(seeds)
+        converged = []
+
+        for _ in range(self.max_iterations):
+            if not active:
+                break
+            results = self.engine.calc_field_and_jacobian_at_points(particles, active)
+            still_active = []
+
+            for (x, y), result in zip(active, results):
+                if result is None:
+                    continue
+                e_x, e_y, j_xx, j_xy, j_yy = result
+                det = j_xx * j_yy - j_xy * j_xy
+                if det == 0:
+                    continue
+                step_x = (j_yy * e_x - j_xy * e_y) / det
+                step_y = (j_xx * e_y - j_xy * e_x) / det
+
+                # Damp steps so a seed cannot jump across the plane
+                length = math.hypot(step_x, step_y)
+                if length > cell:
+                    step_x *= cell / length
+                    step_y *= cell / length
+                x -= step_x
+                y -= step_y
+
+                if not (x0 <= x <= x1 and y0 <= y <= y1):
+                    continue
+                if length < self.tolerance * cell:
+                    converged.append((x, y))
+                else:
+                    still_active.append((x, y))
+
+            active = still_active
+
+        return converged
+
+    def _deduplicate(self, roots, cell):
+        unique = []
+        for x, y in roots:
+            if all(math.hypot(x - ux, y - uy) > 0.01 * cell for ux, uy in unique):
+                unique.append((x, y))
+        return unique
+
+    def _classify(self, particles, roots):
+        if not roots:
+            return []
+
+        results = self.engine.calc_field_and_jacobian_at_points(particles, roots)
+        potentials = self.engine.calc_potential_at_points(particles, roots)
+        null_points = []
+
+        for (x, y), result, v in zip(roots, results, potentials):
+            e_x, e_y, j_xx, j_xy, j_yy = result
+            h_xx, h_xy, h_yy = -j_xx, -j_xy, -j_yy
+            det = h_xx * h_yy - h_xy * h_xy
+            if det < 0:
+                kind = "saddle"
+            elif h_xx + h_yy > 0:
+                kind = "minimum"
+            else:
+                kind = "maximum"
+            null_points.append({
+                'x': x, 'y': y, 'kind': kind, 'potential': v,
+                'field': (e_x, e_y), 'hessian': ((h_xx, h_xy), (h_xy, h_yy)),
+            })
+
+        return null_points
+
+
+class ProbeTable:
+    """
+    Results of a batched evaluation over a list of probe points.
+
+    Rows are (x, y, v, e_x, e_y, e_magnitude, angle) tuples, with None
+    values for points that coincide with a charge. Sorting only reorders
+    an index list, and the GUI formats one page of rows at a time, so
+    tables with 10^5 rows stay responsive.
+    """
+
+    COLUMNS = ("x", "y", "V (V)", "Ex (N/C)", "Ey (N/C)", "|E| (N/C)", "Angle (deg)")
+    PAGE_SIZE = 200
+
+    def __init__(self, points, results):
+        rows = []
+        for (x, y), result in zip(points, results):
+            if result is None:
+                rows.append((x, y, None, None, None, None, None))
+                continue
+            v, e_x, e_y = result
+            rows.append((x, y, v, e_x, e_y, math.hypot(e_x, e_y),
+                         math.degrees(math.atan2(e_y, e_x))))
+        self.rows = rows
+        self.order = list(range(len(rows)))
+        self.sort_column = None
+        self.descending = False
+
+    def sort(self, column, descending=False):
+        """Sort by a column index; undefined values always go last."""
+        values = [row[column] for row in self.rows]
+        defined = [i for i, value in enumerate(values) if value is not None]
+        undefined = [i for i, value in enumerate(values) if value is None]
+        defined.sort(key=values.__getitem__, reverse=descending)
+        self.order = defined + undefined
+        self.sort_column = column
+        self.descending = descending
+
+    def page_count(self):
+        return max(1, math.ceil(len(self.rows) / self.PAGE_SIZE))
+
+    def page(self, index):
+        """Return (row number, row) pairs on the given page, in sort order."""
+        start = index * self.PAGE_SIZE
+        return [(i + 1, self.rows[i]) for i in self.order[start:start + self.PAGE_SIZE]]
+
+    @staticmethod
+    def format_row(number, row):
+        x, y, v = row[0], row[1], row[2]
+        if v is None:
+            return f"{number:>7} {x:>11.4g} {y:>11.4g}   undefined (point on a charge)"
+        return f"{number:>7} {x:>11.4g} {y:>11.4g}" + "".join(f" {value:>12.4e}" for value in row[2:])
+
+    def write_csv(self, filename):
+        """Write the rows, in the current sort order, to a CSV file."""
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            for i in self.order:
+                writer.writerow(["" if value is None else repr(value) for value in self.rows[i]])
+
+    @staticmethod
+    def parse_points(text):
+        """
+        Parse one point per line ("x,y", "x y", "x<TAB>y" or "x;y"), as pasted
+        from a spreadsheet or read from a CSV file. Extra columns, such as
+        those in an exported probe table, are ignored, and a non-numeric
+        first line is treated as a header. Raises ValueError for malformed
+        lines.
+        """
+        points = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            fields = line.replace(",", " ").replace(";", " ").split()
+            if not fields:
+                continue
+            try:
+                if len(fields) < 2:
+                    raise ValueError
+                points.append((float(fields[0]), float(fields[1])))
+            except ValueError:
+                if number == 1:
+                    continue  # Header row
+                raise ValueError(f"Line {number}: expected 'x,y' but got '{line.strip()}'")
+        return points
+
+    @staticmethod
+    def _steps(start, end, count):
+        if count < 2:
+            return [start] * count
+        return [start + (end - start) * i / (count - 1) for i in range(count)]
+
+    @staticmethod
+    def line_sweep(x0, y0, x1, y1, count):
+        """count evenly spaced points from (x0, y0) to (x1, y1) inclusive."""
+        return list(zip(ProbeTable._steps(x0, x1, count), ProbeTable._steps(y0, y1, count)))
+
+    @staticmethod
+    def grid_sweep(x0, y0, x1, y1, columns, rows):
+        """A columns x rows grid spanning the rectangle, row by row."""
+        xs = ProbeTable._steps(x0, x1, columns)
+        return [(x, y) for y in ProbeTable._steps(y0, y1, rows) for x in xs]
+
+
+class EditJournal:
+    """
+    Append-only autosave journal for crash recovery.
+
+    Every edit is appended to the journal file as one compact JSON array
+    per line. Every CHECKPOINT_INTERVAL records (or once the journal grows
+    past CHECKPOINT_BYTES) the full configuration, obtained from the
+    snapshot callable, is written to a checkpoint file and the journal is
+    started afresh. Recovery loads the checkpoint and replays only the
+    records written since.
+
+    The checkpoint and the journal both carry a generation number. A
+    checkpoint is written (atomically) before the journal is truncated,
+    so after a crash between the two steps the journal has an older
+    generation and is skipped instead of being applied twice. A torn
+    final line from a crash mid-write is ignored.
+
+    Each record is appended after its edit has been applied, so a
+    checkpoint triggered by the append already contains the edit. Changes
+    that replace the whole configuration (loading a file, undo, redo)
+    call checkpoint() directly rather than journaling the configuration.
+
+    Records:
+        ["begin", generation]
+        ["add", particle_dict]
+        ["remove", index]
+        ["charge", index, charge]
+        ["move", index, x, y]
+        ["add_distribution", distribution_dict]
+        ["add_conductor", conductor_dict]
+        ["clear"]
+        ["load", configuration]  (written by older versions)
+    """
+
+    CHECKPOINT_INTERVAL = 500
+    CHECKPOINT_BYTES = 1 << 20
+
+    def __init__(self, path, snapshot):
+        self.path = path
+        self.checkpoint_path = path + ".checkpoint"
+        self.snapshot = snapshot
+        self.generation = 0
+        self.records = 0
+        self.size = 0
+        self._file = None
+
+    def has_session(self):
+        """True if a previous session left a checkpoint or journal records."""
+        return os.path.exists(self.checkpoint_path) or len(self._read_records()) > 1
+
+    def append(self, record):
+        """Append one record, compacting into a checkpoint when due."""
+        if self._file is None:
+            self._start(self.generation)
+        line = self._encode(record) + "\n"
+        self._file.write(line)
+        self._file.flush()
+        self.records += 1
+        self.size += len(line)
+        if self.records >= self.CHECKPOINT_INTERVAL or self.size >= self.CHECKPOINT_BYTES:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Write the current configuration and start an empty journal."""
+        generation = self.generation + 1
+        temp_name = self.checkpoint_path + ".tmp"
+        with open(temp_name, 'w') as f:
+            json.dump({
+                'generation': generation,
+                'created': datetime.now().isoformat(),
+                'configuration': self.snapshot(),
+            }, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, self.checkpoint_path)
+        self._start(generation)
+
+    def recover(self):
+        """
+        Rebuild the last journaled configuration.
+
+        Returns (configuration, replayed_records). Once the configuration
+        has been applied, call checkpoint() so the replayed records are
+        kept before the journal is started afresh.
+        """
+        configuration = {'particles': [], 'distributions': [], 'conductors': []}
+        generation = 0
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.load(f)
+            generation = checkpoint['generation']
+            configuration = checkpoint['configuration']
+
+        replayed = 0
+        records = self._read_records()
+        if records and records[0] == ["begin", generation]:
+            for record in records[1:]:
+                self.apply(configuration, record)
+                replayed += 1
+
+        self.generation = generation
+        self.records = 0
+        self.size = 0
+        return configuration, replayed
+
+    def discard(self):
+        """Delete the journal and checkpoint, e.g. on a clean exit."""
+        self.close()
+        for name in (self.path, self.checkpoint_path):
+            try:
+                os.remove(name)
+            except FileNotFoundError:
+                pass
+        self.generation = 0
+        self.records = 0
+        self.size = 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def apply(configuration, record):
+        """Apply one journal record to a configuration dictionary."""
+        op = record[0]
+        particles = configuration['particles']
+        if op == "add":
+            particles.append(record[1])
+        elif op == "remove":
+            del particles[record[1]]
+        elif op == "charge":
+            particles[record[1]]['charge'] = record[2]
+        elif op == "move":
+            particles[record[1]]['x'] = record[2]
+            particles[record[1]]['y'] = record[3]
+        elif op == "add_distribution":
+            configuration.setdefault('distributions', []).append(record[1])
+        elif op == "add_conductor":
+            configuration.setdefault('conductors', []).append(record[1])
+        elif op == "clear":
+            configuration.update({'particles': [], 'distributions': [], 'conductors': []})
+        elif op == "load":
+            configuration.clear()
+            configuration.update(record[1])
+        else:
+            raise ValueError(f"Unknown journal record: {op}")
+
+    def _start(self, generation):
+        """Truncate the journal and write its header."""
+        self.close()
+        self.generation = generation
+        self._file = open(self.path, 'w')
+        line = self._encode(["begin", generation]) + "\n"
+        self._file.write(line)
+        self._file.flush()
+        self.records = 0
+        self.size = len(line)
+
+    def _read_records(self):
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for line in lines:
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # Torn write at the end of a crashed session
+        return records
+
+    @staticmethod
+    def _encode(record):
+        return json.dumps(record, separators=(',', ':'))
+
 
 class ElectrostaticsCalculator:
     """
@@ -176,6 +3048,11 @@ class ElectrostaticsCalculator:
         self.GRID_SCALE = 20  # Pixels per unit in coordinate system
         self.GRID_SPACING = 40  # Spacing between grid lines in pixels
         self.PARTICLE_RADIUS = 8  # Radius for drawing particles
+        self.DRAG_INTERVAL_MS = 16  # Minimum time between drag updates (~60 Hz)
+        self.QUIVER_SPACING = 32  # Minimum spacing between field arrows in pixels
+        self.MAX_QUIVER_ARROWS = 600  # Upper bound on field arrow canvas items
+        self.MAX_DRAG_RESAMPLE_TERMS = 2 * 10 ** 6  # Sources x samples the field map may resample mid-drag
+        self.OVERLAY_INTERVAL_MS = 100  # Minimum time between overlay refreshes while dragging
         
         self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
 
@@ -186,6 +3063,7 @@ class ElectrostaticsCalculator:
         # Charge validation bounds
         self.MIN_CHARGE = 1e-12  # Minimum charge in Coulombs (1 picocoulomb)
         self.MAX_CHARGE = 1e-3   # Maximum charge in Coulombs (1 millicoulomb)
+        self.MAX_PROBE_POINTS = 10 ** 6  # Largest generated probe sweep
 
         self.particles = []
         self.current_mode = None  # 'add_proton', 'add_electron', or None
@@ -197,6 +3075,38 @@ class ElectrostaticsCalculator:
         
         # Physics engine
         self.physics_engine = PhysicsEngine(self.k, self.epsilon_0)
+        # Separate engine for the rendered overlays, which may use float32 storage
+        self.overlay_engine = PhysicsEngine(self.k, self.epsilon_0)
+
+        # Continuous charge distributions (line, arc, ring and disk charges)
+        self.distributions = []
+
+        # Autosave journal, opened by run() for interactive sessions
+        self.journal = None
+
+        # Conductors and their solved surface charges
+        self.conductors = []
+        self.induced_charges = []
+        self.conductor_solver = ConductorSolver(self.physics_engine)
+        self._conductor_key = None
+
+        # User probe points and their superposition cache
+        self.probe_points = []
+        self.probe_cache = None
+
+        # Adaptive field map overlay (heatmap, contours and hover readout)
+        self.FIELD_MAP_MAX_TERMS = 2 * 10 ** 6  # Sources x samples per field map resample
+        self.field_sampler = AdaptiveFieldSampler(self.overlay_engine, max_terms=self.FIELD_MAP_MAX_TERMS)
+        self.field_map = None
+        self.field_map_visible = False
+        self.field_map_cache = None  # SuperpositionCache over the field map samples
+        self.field_map_keys = []  # Lattice keys in the order of the cache's points
+        self.null_finder = NullPointFinder(self.physics_engine)
+
+        # Field arrow overlay; line items are pooled and reused between redraws
+        self.quiver_visible = False
+        self.quiver_items = []
+        self.quiver_cache = None  # Totals-only SuperpositionCache over the arrow lattice
 
         self.setup_main_interface()
 
@@ -237,6 +3147,12 @@ class ElectrostaticsCalculator:
         )
         self.calculate_btn.pack(side=tk.LEFT, padx=5)
 
+        distribution_btn = tk.Button(button_frame, text="Add Distribution", command=self.add_distribution)
+        distribution_btn.pack(side=tk.LEFT, padx=5)
+
+        conductor_btn = tk.Button(button_frame, text="Add Conductor", command=self.add_conductor)
+        conductor_btn.pack(side=tk.LEFT, padx=5)
+
         clear_btn = tk.Button(button_frame, text="Clear All", command=self.clear_all)
         clear_btn.pack(side=tk.LEFT, padx=5)
         
@@ -256,6 +3172,15 @@ class ElectrostaticsCalculator:
         self.redo_btn = tk.Button(button_frame2, text="Redo", command=self.redo, state=tk.DISABLED)
         self.redo_btn.pack(side=tk.LEFT, padx=5)
 
+        stats_btn = tk.Button(button_frame2, text="Profiling", command=self.open_profiling_window)
+        stats_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.field_map_btn = tk.Button(button_frame2, text="Show Field Map", command=self.toggle_field_map)
+        self.field_map_btn.pack(side=tk.LEFT, padx=5)
+
+        self.quiver_btn = tk.Button(button_frame2, text="Show Field Arrows", command=self.toggle_quiver)
+        self.quiver_btn.pack(side=tk.LEFT, padx=5)
+
         self.canvas = tk.Canvas(
             main_frame, width=self.CANVAS_WIDTH, height=self.CANVAS_HEIGHT, 
             bg="white", relief=tk.SUNKEN, bd=2
@@ -269,15 +3194,27 @@ class ElectrostaticsCalculator:
         self.canvas.bind("<Button-1>", self.canvas_click)
         self.canvas.bind("<Button-3>", self.canvas_right_click)  # Right-click
         self.canvas.bind("<Double-Button-1>", self.canvas_double_click)  # Double-click
+        self.canvas.bind("<B1-Motion>", self.canvas_drag)  # Drag to move
+        self.canvas.bind("<ButtonRelease-1>", self.canvas_release)
+        self.canvas.bind("<Motion>", self.canvas_motion)  # Field map hover readout
 
         self.context_menu = tk.Menu(self.root, tearoff=0)
         self.context_menu.add_command(label="Delete Particle", command=self.delete_selected_particle)
         self.context_menu.add_command(label="Edit Charge", command=self.edit_selected_particle)
         self.selected_particle = None
 
+        # Drag-to-move state
+        self.drag_particle = None
+        self.drag_moved = False
+        self.drag_target = None  # Latest pointer position not yet applied
+        self.drag_after_id = None
+        self.drag_energy_delta = 0
+        self.drag_potential = None  # Potential of the other sources at the dragged particle
+        self.overlay_after_id = None  # Pending overlay refresh during a drag
+
         self.status_label = tk.Label(
             main_frame,
-            text="Add particles | Right-click to delete | Double-click to edit charge",
+            text="Add particles | Drag to move | Right-click to delete | Double-click to edit charge",
             relief=tk.SUNKEN,
             anchor=tk.W,
         )
@@ -285,6 +3222,7 @@ class ElectrostaticsCalculator:
 
         self.draw_grid()
 
+    @instrumented("canvas")
     def draw_grid(self):
         """Draw cartesian coordinate system"""
         self.canvas.delete("grid")
@@ -390,94 +3328,743 @@ class ElectrostaticsCalculator:
                 f"Charge is too large. Maximum allowed: {self.MAX_CHARGE:.2e} C\n"
                 f"You entered: {charge:.2e} C"
             )
-            return None
-        
-        return charge
+            return None
+        
+        return charge
+
+    @instrumented("event")
+    def canvas_click(self, event):
+        """
+        Handle canvas click events to add particles or start dragging one
+        """
+        if self.current_mode is None:
+            self.drag_particle = self.find_particle_at_position(event.x, event.y)
+            self.drag_moved = False
+            self.drag_energy_delta = 0
+            self.drag_potential = None
+            return
+
+        if self.current_mode in ["add_proton", "add_electron"]:
+            x, y = self.canvas_to_coords(event.x, event.y)
+            
+            particle_type = "proton" if self.current_mode == "add_proton" else "electron"
+            sign_symbol = "+" if particle_type == "proton" else "-"
+            
+            # Show info about sign convention on first particle
+            if len(self.particles) == 0:
+                messagebox.showinfo(
+                    "Sign Convention",
+                    f"Note: You are adding a {particle_type}.\n\n"
+                    f"The sign ({sign_symbol}) is automatically determined by particle type.\n"
+                    f"Please enter only the magnitude (absolute value) of the charge.\n\n"
+                    f"Valid range: {self.MIN_CHARGE:.2e} C to {self.MAX_CHARGE:.2e} C"
+                )
+
+            charge = simpledialog.askfloat(
+                "Charge Input",
+                f"Enter charge magnitude for {particle_type} at ({x:.1f}, {y:.1f}):\n"
+                f"(Sign {sign_symbol} is automatic, enter positive value only)\n\n"
+                f"Range: {self.MIN_CHARGE:.2e} to {self.MAX_CHARGE:.2e} C",
+                initialvalue=1e-9,
+                minvalue=0,
+            )
+
+            # Validate the charge
+            validated_charge = self.validate_charge(charge, particle_type)
+            
+            if validated_charge is not None:
+                self.save_state()  # Save state before adding particle
+                particle = Particle(x, y, validated_charge, particle_type)
+                self.particles.append(particle)
+                self.draw_particle(particle)
+                self.journal_record("add", particle.to_dict())
+                self.status_label.config(
+                    text=f"Particle added. Total particles: {len(self.particles)}"
+                )
+                self.refresh_overlays()
+
+            self.current_mode = None
+            self.canvas.config(cursor="")
+
+    @instrumented("canvas")
+    def draw_particle(self, particle):
+        """
+        Draw a particle on the canvas based on its coordinates and type.
+        Stores canvas IDs in the particle object.
+        """
+        canvas_x, canvas_y = self.coords_to_canvas(particle.x, particle.y)
+        color = "blue" if particle.particle_type == "proton" else "red"
+
+        particle.oval_id = self.canvas.create_oval(
+            canvas_x - self.PARTICLE_RADIUS,
+            canvas_y - self.PARTICLE_RADIUS,
+            canvas_x + self.PARTICLE_RADIUS,
+            canvas_y + self.PARTICLE_RADIUS,
+            fill=color,
+            outline="black",
+            width=2,
+            tags="particle",
+        )
+
+        sign = "+" if particle.particle_type == "proton" else "-"
+        particle.text_id = self.canvas.create_text(
+            canvas_x,
+            canvas_y - 20,
+            text=f"{sign}{particle.charge}",
+            font=("Arial", 10, "bold"),
+            tags="particle",
+        )
+
+    def parse_points(self, text):
+        """
+        Parse "x1,y1; x2,y2; ..." into a list of (x, y) tuples.
+        Raises ValueError for malformed input.
+        """
+        points = []
+        for pair in text.split(";"):
+            if not pair.strip():
+                continue
+            parts = pair.split(",")
+            if len(parts) != 2:
+                raise ValueError(f"Expected 'x,y' but got '{pair.strip()}'")
+            points.append((float(parts[0]), float(parts[1])))
+        return points
+
+    def add_distribution(self):
+        """
+        Prompt for a continuous charge distribution and add it to the plane.
+        """
+        kind = simpledialog.askstring(
+            "Add Distribution", "Distribution shape (line, arc, ring or disk):",
+            initialvalue="line"
+        )
+        if kind is None:
+            return
+        kind = kind.strip().lower()
+
+        prompts = {
+            "line": "Enter the two end points as 'x1,y1; x2,y2':",
+            "arc": "Enter the center as 'x,y':",
+            "ring": "Enter the center as 'x,y':",
+            "disk": "Enter the center as 'x,y':",
+        }
+        if kind not in prompts:
+            messagebox.showerror("Invalid Shape", "Shape must be line, arc, ring or disk.")
+            return
+
+        text = simpledialog.askstring("Add Distribution", prompts[kind])
+        if text is None:
+            return
+
+        try:
+            points = self.parse_points(text)
+        except ValueError as e:
+            messagebox.showerror("Invalid Distribution", str(e))
+            return
+        if len(points) != (2 if kind == "line" else 1):
+            expected = "two end points" if kind == "line" else "one center point"
+            messagebox.showerror("Invalid Distribution", f"A {kind} charge needs {expected}.")
+            return
+
+        geometry = []
+        if kind != "line":
+            radius = simpledialog.askfloat("Add Distribution", "Enter the radius:", minvalue=0)
+            if radius is None:
+                return
+            geometry.append(radius)
+        if kind == "arc":
+            for prompt, initial in (("start", 0.0), ("end", 180.0)):
+                angle = simpledialog.askfloat(
+                    "Add Distribution", f"Enter the {prompt} angle (degrees):", initialvalue=initial
+                )
+                if angle is None:
+                    return
+                geometry.append(angle)
+
+        polarity = simpledialog.askstring(
+            "Add Distribution", "Charge sign (positive or negative):", initialvalue="positive"
+        )
+        if polarity is None:
+            return
+        if polarity.strip().lower() not in ("positive", "negative", "+", "-"):
+            messagebox.showerror("Invalid Sign", "Sign must be positive or negative.")
+            return
+        particle_type = "proton" if polarity.strip().lower() in ("positive", "+") else "electron"
+
+        charge = simpledialog.askfloat(
+            "Charge Input",
+            f"Enter the total charge magnitude of the {kind} charge:\n"
+            f"Range: {self.MIN_CHARGE:.2e} to {self.MAX_CHARGE:.2e} C",
+            initialvalue=1e-9,
+            minvalue=0,
+        )
+        charge = self.validate_charge(charge, particle_type)
+        if charge is None:
+            return
+
+        coordinates = [value for point in points for value in point]
+        classes = {"line": LineCharge, "arc": ArcCharge, "ring": RingCharge, "disk": DiskCharge}
+        try:
+            distribution = classes[kind](*coordinates, *geometry, charge, particle_type)
+        except ValueError as e:
+            messagebox.showerror("Invalid Distribution", str(e))
+            return
+
+        self.save_state()
+        self.distributions.append(distribution)
+        self.draw_distribution(distribution)
+        self.journal_record("add_distribution", distribution.to_dict())
+        self.status_label.config(
+            text=f"{kind.capitalize()} charge added. Total distributions: {len(self.distributions)}"
+        )
+        self.refresh_overlays()
+
+    @instrumented("canvas")
+    def draw_distribution(self, distribution):
+        """
+        Draw a charge distribution on the canvas.
+        """
+        color = "blue" if distribution.particle_type == "proton" else "red"
+        coords = []
+        for x, y in distribution.outline():
+            coords.extend(self.coords_to_canvas(x, y))
+
+        if isinstance(distribution, DiskCharge):
+            distribution.canvas_id = self.canvas.create_polygon(
+                *coords, fill=color, stipple="gray25", outline=color, width=2, tags="distribution"
+            )
+        else:
+            distribution.canvas_id = self.canvas.create_line(
+                *coords, fill=color, width=3, tags="distribution"
+            )
+
+    def add_conductor(self):
+        """
+        Prompt for a conductor shape and add it to the plane.
+        """
+        shape = simpledialog.askstring(
+            "Add Conductor", "Conductor shape (segment, circle or polygon):",
+            initialvalue="segment"
+        )
+        if shape is None:
+            return
+        shape = shape.strip().lower()
+
+        prompts = {
+            "segment": "Enter the two end points as 'x1,y1; x2,y2':",
+            "circle": "Enter the center as 'x,y':",
+            "polygon": "Enter at least three vertices as 'x1,y1; x2,y2; x3,y3':",
+        }
+        if shape not in prompts:
+            messagebox.showerror("Invalid Shape", "Shape must be segment, circle or polygon.")
+            return
+
+        text = simpledialog.askstring("Add Conductor", prompts[shape])
+        if text is None:
+            return
+
+        radius = None
+        if shape == "circle":
+            radius = simpledialog.askfloat("Add Conductor", "Enter the circle radius:", minvalue=0)
+            if radius is None:
+                return
+
+        potential = simpledialog.askfloat(
+            "Add Conductor", "Enter the conductor potential (V):", initialvalue=0.0
+        )
+        if potential is None:
+            return
+
+        try:
+            conductor = Conductor(shape, self.parse_points(text), potential, radius)
+        except ValueError as e:
+            messagebox.showerror("Invalid Conductor", str(e))
+            return
+
+        self.save_state()
+        self.conductors.append(conductor)
+        self.draw_conductor(conductor)
+        self.journal_record("add_conductor", conductor.to_dict())
+        self.status_label.config(
+            text=f"Conductor added at {potential:.2f} V. Total conductors: {len(self.conductors)}"
+        )
+        self.refresh_overlays()
+
+    @instrumented("canvas")
+    def draw_conductor(self, conductor):
+        """
+        Draw a conductor outline on the canvas.
+        """
+        coords = []
+        for x, y in conductor.outline():
+            coords.extend(self.coords_to_canvas(x, y))
+
+        conductor.canvas_id = self.canvas.create_line(
+            *coords, fill="gray30", width=4, capstyle=tk.ROUND, tags="conductor"
+        )
+
+    def sources(self):
+        """
+        Return every charge that contributes to the field: the particles, the
+        charge distributions and the surface charge induced on conductors,
+        re-solved when the configuration has changed since the last solve.
+        """
+        free = self.particles + self.distributions if self.distributions else self.particles
+        if not self.conductors:
+            return free
+
+        key = (
+            tuple((p.x, p.y, p.charge, p.sign) for p in self.particles),
+            tuple(json.dumps(d.to_dict(), sort_keys=True) for d in self.distributions),
+            tuple(json.dumps(c.to_dict(), sort_keys=True) for c in self.conductors),
+        )
+        if key != self._conductor_key:
+            self.induced_charges = self.conductor_solver.solve(self.conductors, free)
+            self._conductor_key = key
+            report = self.conductor_solver.last_report
+            self.status_label.config(
+                text=f"Conductors solved: {report['panels']} panels, "
+                f"{report['iterations']} GMRES iterations, {report['solve_time'] * 1000:.1f} ms"
+            )
+
+        return free + self.induced_charges
+
+    def get_probe_cache(self, points):
+        """
+        Return a SuperpositionCache over the given probe points, reusing the
+        current one when the probes are unchanged and it can be brought up
+        to date with the sources.
+        """
+        sources = self.sources()
+        points = [tuple(p) for p in points]
+        cache = self.probe_cache
+
+        if cache is None or cache.points != points or not cache.sync(sources):
+            self.probe_cache = SuperpositionCache(self.physics_engine, sources, points)
+
+        return self.probe_cache
+
+    @instrumented("event")
+    def canvas_drag(self, event):
+        """
+        Handle pointer motion while dragging a particle.
+
+        Motion events are coalesced: only the latest pointer position is
+        kept and applied at most once per DRAG_INTERVAL_MS.
+        """
+        if self.drag_particle is None:
+            return
+
+        if not self.drag_moved:
+            self.save_state()  # One undo entry for the whole drag
+            self.drag_moved = True
+
+        self.drag_target = (event.x, event.y)
+        if self.drag_after_id is None:
+            self.drag_after_id = self.root.after(self.DRAG_INTERVAL_MS, self.apply_drag)
+
+    @instrumented("event")
+    def apply_drag(self):
+        """
+        Move the dragged particle to the latest pointer position, updating
+        only its own canvas items and applying incremental deltas to the
+        probe cache and the energy readout.
+        """
+        self.drag_after_id = None
+        particle = self.drag_particle
+        if particle is None or self.drag_target is None:
+            return
+
+        x, y = self.canvas_to_coords(*self.drag_target)
+        self.drag_target = None
+        if (x, y) == (particle.x, particle.y):
+            return
+
+        for other in self.particles:
+            if other.x == x and other.y == y:
+                return  # Would land on top of another particle
+
+        cache = self.probe_cache
+        if cache is not None and (self.conductors or not cache.sync(self.sources())):
+            self.probe_cache = cache = None  # Stale: the sources changed since it was built
+        if cache is not None and particle in cache.sources:
+            # The cache tracks the system energy, so its change is the delta
+            energy_before = cache.energy
+            cache.move_source(cache.sources.index(particle), x, y)
+            self.drag_energy_delta += cache.energy - energy_before
+            self.drag_potential = None
+        else:
+            # The other sources stay put during a drag, so the potential at
+            # the previous position is remembered and each step evaluates
+            # only the new one
+            others = [p for p in self.particles if p is not particle] + self.distributions
+            v_old = self.drag_potential
+            if v_old is None:
+                v_old, v_new = self.physics_engine.calc_potential_at_points(
+                    others, [(particle.x, particle.y), (x, y)]
+                )
+            else:
+                v_new, = self.physics_engine.calc_potential_at_points(others, [(x, y)])
+            if v_old is not None and v_new is not None:
+                self.drag_energy_delta += particle.charge * particle.sign * (v_new - v_old)
+            self.drag_potential = v_new
+            particle.x, particle.y = x, y
+
+        canvas_x, canvas_y = self.coords_to_canvas(x, y)
+        self.canvas.coords(
+            particle.oval_id,
+            canvas_x - self.PARTICLE_RADIUS,
+            canvas_y - self.PARTICLE_RADIUS,
+            canvas_x + self.PARTICLE_RADIUS,
+            canvas_y + self.PARTICLE_RADIUS,
+        )
+        self.canvas.coords(particle.text_id, canvas_x, canvas_y - 20)
+        self.drag_overlays(particle)
+
+        self.status_label.config(
+            text=f"Moving particle to ({x:.2f}, {y:.2f}) | "
+            f"ΔU = {self.drag_energy_delta:.2e} J"
+        )
+
+    def drag_overlays(self, particle):
+        """
+        Keep the overlays current while a particle is dragged. Arrows are
+        updated on every step through the arrow cache, in O(arrows); the
+        field map and anything that needs a full recomputation are
+        refreshed at most once per OVERLAY_INTERVAL_MS.
+        """
+        cache = self.quiver_cache
+        if self.quiver_visible and cache is not None and not self.conductors \
+                and cache.sync(self.sources(), max_changes=1):
+            positions, spacing = self.quiver_lattice()
+            self.draw_quiver(positions, cache.values()[1], spacing)
+            needs_refresh = self.field_map_visible
+        else:
+            needs_refresh = self.field_map_visible or self.quiver_visible
+
+        if needs_refresh and self.overlay_after_id is None:
+            self.overlay_after_id = self.root.after(self.OVERLAY_INTERVAL_MS, self.refresh_drag_overlays)
+
+    def refresh_drag_overlays(self):
+        """Throttled overlay refresh scheduled by drag_overlays."""
+        self.overlay_after_id = None
+        if self.drag_particle is not None:
+            self.refresh_overlays(incremental=True)
+
+    @instrumented("event")
+    def canvas_release(self, event):
+        """
+        Finish a drag, applying any motion that is still pending.
+        """
+        if self.drag_particle is None:
+            return
+
+        if self.drag_after_id is not None:
+            self.root.after_cancel(self.drag_after_id)
+            self.drag_after_id = None
+        self.apply_drag()
+        if self.overlay_after_id is not None:
+            self.root.after_cancel(self.overlay_after_id)
+            self.overlay_after_id = None
+
+        particle = self.drag_particle
+        if self.drag_moved:
+            if particle in self.particles:
+                self.journal_record("move", self.particles.index(particle), particle.x, particle.y)
+            self.status_label.config(
+                text=f"Particle moved to ({particle.x:.2f}, {particle.y:.2f}) | "
+                f"ΔU = {self.drag_energy_delta:.2e} J"
+            )
+            self.refresh_overlays()
+        self.drag_particle = None
+        self.drag_moved = False
+
+    def toggle_field_map(self):
+        """
+        Show or hide the adaptive field map overlay.
+        """
+        self.field_map_visible = not self.field_map_visible
+        self.field_map_btn.config(
+            text="Hide Field Map" if self.field_map_visible else "Show Field Map"
+        )
+        self.refresh_overlays()
+
+        if self.field_map_visible and self.field_map is not None:
+            tree = self.field_map
+            comparison = "fewer" if tree.savings >= 0 else "more"
+            self.status_label.config(
+                text=f"Field map: {tree.evaluations} evaluations in {tree.calls} batched calls, "
+                f"{abs(tree.savings):.1%} {comparison} than a uniform grid of the same finest "
+                f"resolution ({tree.uniform_evaluations})"
+                + ("; refinement stopped at the evaluation budget" if tree.budget_reached else "")
+            )
+
+    def refresh_overlays(self, incremental=False):
+        """
+        Recompute and redraw the active overlays after the configuration
+        changes.
+
+        With incremental=True the field map keeps its sample points and
+        only their values are brought up to date through the field map
+        cache, which is O(samples) per changed source. A full refresh
+        resamples the quadtree for the new configuration.
+        """
+        self.canvas.delete("heatmap")
+        self.canvas.delete("null_point")  # Stale once the configuration changes
+        self.update_quiver()
+
+        if not self.field_map_visible or not (self.particles or self.distributions or self.conductors):
+            self.field_map = None
+            self.field_map_cache = None
+            return
+
+        try:
+            sources = self.sources()
+        except ValueError as e:
+            self.field_map = None
+            self.field_map_cache = None
+            self.status_label.config(text=f"Field map unavailable: {e}")
+            return
+
+        tree, cache = self.field_map, self.field_map_cache
+        if incremental and tree is not None:
+            if cache is not None and cache.sync(sources):
+                potentials, fields = cache.values()
+                tree.values = {
+                    key: None if v is None else (v, field[0], field[1])
+                    for key, v, field in zip(self.field_map_keys, potentials, fields)
+                }
+                self.draw_field_map(tree)
+                return
+            if self.drag_particle is not None \
+                    and tree.evaluations * len(sources) > self.MAX_DRAG_RESAMPLE_TERMS:
+                self.draw_field_map(tree)  # Too slow to resample mid-drag; release resamples
+                return
+
+        x0, y1 = self.canvas_to_coords(0, 0)
+        x1, y0 = self.canvas_to_coords(self.CANVAS_WIDTH, self.CANVAS_HEIGHT)
+        tree = self.field_sampler.sample(sources, (x0, y0, x1, y1))
+        self.field_map = tree
+        self.field_map_keys = list(tree.values)
+        self.field_map_cache = SuperpositionCache(
+            self.overlay_engine, sources, [tree.point(key) for key in self.field_map_keys],
+            track_energy=False, keep_basis=False,
+            values=[tree.values[key] for key in self.field_map_keys],
+        )
+        self.draw_field_map(tree)
+
+    @instrumented("canvas")
+    def draw_field_map(self, tree):
+        """
+        Draw the quadtree leaves as a potential heatmap with equipotential
+        contours, underneath the grid and particles.
+        """
+        leaves = []
+        for cell in tree.leaves():
+            value = tree.cell_value(cell)
+            if value is not None:
+                leaves.append((cell, value[0]))
+        if not leaves:
+            return
+
+        # Color scale from the 90th percentile of |V| so a few cells next
+        # to charges do not wash out the rest of the map
+        magnitudes = sorted(abs(v) for _, v in leaves)
+        scale = magnitudes[int(0.9 * (len(magnitudes) - 1))] or 1.0
+
+        for cell, v in leaves:
+            x0, y0, x1, y1 = tree.cell_bounds(cell)
+            cx0, cy0 = self.coords_to_canvas(x0, y0)
+            cx1, cy1 = self.coords_to_canvas(x1, y1)
+            color = self.potential_color(v, scale)
+            self.canvas.create_rectangle(
+                cx0, cy1, cx1, cy0, fill=color, outline=color, tags="heatmap"
+            )
+
+        for level in (-scale, -scale / 4, 0.0, scale / 4, scale):
+            for (xa, ya), (xb, yb) in tree.contour_segments(level):
+                self.canvas.create_line(
+                    *self.coords_to_canvas(xa, ya), *self.coords_to_canvas(xb, yb),
+                    fill="gray40", tags="heatmap"
+                )
+
+        self.canvas.tag_lower("heatmap")
+
+    def toggle_quiver(self):
+        """
+        Show or hide the field arrow overlay.
+        """
+        self.quiver_visible = not self.quiver_visible
+        self.quiver_btn.config(
+            text="Hide Field Arrows" if self.quiver_visible else "Show Field Arrows"
+        )
+        start = time.perf_counter()
+        count = self.update_quiver()
+        if self.quiver_visible:
+            self.status_label.config(
+                text=f"Field arrows: {count} points in one batched evaluation "
+                f"({(time.perf_counter() - start) * 1000:.1f} ms)"
+            )
+
+    def quiver_lattice(self):
+        """
+        Return the canvas positions of the field arrows.
+
+        The lattice is laid out in screen space, so its density in plane
+        coordinates follows GRID_SCALE while the arrow count stays below
+        MAX_QUIVER_ARROWS.
+        """
+        width, height = self.CANVAS_WIDTH, self.CANVAS_HEIGHT
+        spacing = max(self.QUIVER_SPACING, math.sqrt(width * height / self.MAX_QUIVER_ARROWS))
+        columns = max(1, int(width // spacing))
+        rows = max(1, int(height // spacing))
+        while columns * rows > self.MAX_QUIVER_ARROWS:
+            spacing *= 1.05
+            columns = max(1, int(width // spacing))
+            rows = max(1, int(height // spacing))
+
+        # Center the lattice on the canvas
+        left = (width - (columns - 1) * spacing) / 2
+        top = (height - (rows - 1) * spacing) / 2
+        positions = [
+            (left + col * spacing, top + row * spacing)
+            for row in range(rows)
+            for col in range(columns)
+        ]
+        return positions, spacing
+
+    def update_quiver(self):
+        """
+        Recompute the field arrows in one batched evaluation and move the
+        pooled line items into place. Returns the number of arrows shown.
+        """
+        if not self.quiver_visible or not (self.particles or self.distributions or self.conductors):
+            self.hide_quiver()
+            return 0
+
+        try:
+            sources = self.sources()
+        except ValueError as e:
+            self.hide_quiver()
+            self.status_label.config(text=f"Field arrows unavailable: {e}")
+            return 0
+
+        positions, spacing = self.quiver_lattice()
+        points = [self.canvas_to_coords(cx, cy) for cx, cy in positions]
+        return self.draw_quiver(positions, self.quiver_fields(sources, points), spacing)
+
+    def hide_quiver(self):
+        """Hide every pooled arrow and drop the cached lattice field."""
+        for item in self.quiver_items:
+            self.canvas.itemconfig(item, state=tk.HIDDEN)
+        self.quiver_cache = None
+
+    def quiver_fields(self, sources, points):
+        """
+        Field at the arrow lattice, kept in a totals-only SuperpositionCache
+        so a drag or charge edit updates it in O(arrows) per changed source.
+        The cache is rebuilt when it cannot be synced with the sources.
+        """
+        cache = self.quiver_cache
+        if cache is None or cache.points != points or not cache.sync(sources):
+            cache = SuperpositionCache(
+                self.overlay_engine, sources, points, track_energy=False, keep_basis=False
+            )
+            self.quiver_cache = cache
+        return cache.values()[1]
 
-    def canvas_click(self, event):
+    @instrumented("canvas")
+    def draw_quiver(self, positions, fields, spacing):
         """
-        Handle canvas click events to add particles
+        Point each arrow along E, with length and shade following
+        log10 |E|, reusing existing canvas items where possible.
         """
-        if self.current_mode in ["add_proton", "add_electron"]:
-            x, y = self.canvas_to_coords(event.x, event.y)
-            
-            particle_type = "proton" if self.current_mode == "add_proton" else "electron"
-            sign_symbol = "+" if particle_type == "proton" else "-"
-            
-            # Show info about sign convention on first particle
-            if len(self.particles) == 0:
-                messagebox.showinfo(
-                    "Sign Convention",
-                    f"Note: You are adding a {particle_type}.\n\n"
-                    f"The sign ({sign_symbol}) is automatically determined by particle type.\n"
-                    f"Please enter only the magnitude (absolute value) of the charge.\n\n"
-                    f"Valid range: {self.MIN_CHARGE:.2e} C to {self.MAX_CHARGE:.2e} C"
-                )
+        logs = [
+            math.log10(math.hypot(*field)) if field is not None and field != (0, 0) else None
+            for field in fields
+        ]
 
-            charge = simpledialog.askfloat(
-                "Charge Input",
-                f"Enter charge magnitude for {particle_type} at ({x:.1f}, {y:.1f}):\n"
-                f"(Sign {sign_symbol} is automatic, enter positive value only)\n\n"
-                f"Range: {self.MIN_CHARGE:.2e} to {self.MAX_CHARGE:.2e} C",
-                initialvalue=1e-9,
-                minvalue=0,
-            )
+        # Shade between the 5th and 95th percentiles so arrows next to
+        # charges do not flatten the rest of the scale
+        finite = sorted(v for v in logs if v is not None) or [0.0]
+        low = finite[int(0.05 * (len(finite) - 1))]
+        high = finite[int(0.95 * (len(finite) - 1))]
+        span = high - low if high > low else 1.0
 
-            # Validate the charge
-            validated_charge = self.validate_charge(charge, particle_type)
-            
-            if validated_charge is not None:
-                self.save_state()  # Save state before adding particle
-                particle = Particle(x, y, validated_charge, particle_type)
-                self.particles.append(particle)
-                self.draw_particle(particle)
-                self.status_label.config(
-                    text=f"Particle added. Total particles: {len(self.particles)}"
-                )
+        created = False
+        while len(self.quiver_items) < len(positions):
+            self.quiver_items.append(self.canvas.create_line(
+                0, 0, 0, 0, arrow=tk.LAST, arrowshape=(6, 7, 3), tags="quiver"
+            ))
+            created = True
+        if created:
+            self.canvas.tag_raise("quiver", "grid")  # Above the grid, below the charges
 
-            self.current_mode = None
-            self.canvas.config(cursor="")
+        shown = 0
+        for item, (cx, cy), field, log_e in zip(self.quiver_items, positions, fields, logs):
+            if log_e is None:
+                self.canvas.itemconfig(item, state=tk.HIDDEN)
+                continue
+            t = max(0.0, min(1.0, (log_e - low) / span))
+            e_x, e_y = field
+            magnitude = math.hypot(e_x, e_y)
+            half = 0.5 * spacing * (0.3 + 0.6 * t)
+            dx, dy = half * e_x / magnitude, -half * e_y / magnitude  # Canvas y points down
+            shade = int(190 * (1 - t))
+            self.canvas.coords(item, cx - dx, cy - dy, cx + dx, cy + dy)
+            self.canvas.itemconfig(item, state=tk.NORMAL, fill=f"#{shade:02x}{shade:02x}{shade:02x}")
+            shown += 1
 
-    def draw_particle(self, particle):
+        for item in self.quiver_items[len(positions):]:
+            self.canvas.itemconfig(item, state=tk.HIDDEN)
+        return shown
+
+    def potential_color(self, v, scale):
+        """Blue for positive, red for negative potential, white at zero."""
+        t = max(-1.0, min(1.0, v / scale))
+        fade = int(255 * (1 - abs(t)))
+        if t >= 0:
+            return f"#{fade:02x}{fade:02x}ff"
+        return f"#ff{fade:02x}{fade:02x}"
+
+    @instrumented("event")
+    def canvas_motion(self, event):
         """
-        Draw a particle on the canvas based on its coordinates and type.
-        Stores canvas IDs in the particle object.
+        Show the potential and field under the pointer from the field map.
         """
-        canvas_x, canvas_y = self.coords_to_canvas(particle.x, particle.y)
-        color = "blue" if particle.particle_type == "proton" else "red"
-
-        particle.oval_id = self.canvas.create_oval(
-            canvas_x - self.PARTICLE_RADIUS,
-            canvas_y - self.PARTICLE_RADIUS,
-            canvas_x + self.PARTICLE_RADIUS,
-            canvas_y + self.PARTICLE_RADIUS,
-            fill=color,
-            outline="black",
-            width=2,
-            tags="particle",
-        )
+        if self.field_map is None:
+            return
 
-        sign = "+" if particle.particle_type == "proton" else "-"
-        particle.text_id = self.canvas.create_text(
-            canvas_x,
-            canvas_y - 20,
-            text=f"{sign}{particle.charge}",
-            font=("Arial", 10, "bold"),
-            tags="particle",
+        x, y = self.canvas_to_coords(event.x, event.y)
+        value = self.field_map.lookup(x, y)
+        if value is None:
+            return
+        v, e_x, e_y = value
+        self.status_label.config(
+            text=f"({x:.2f}, {y:.2f}): V = {v:.2e} V, |E| = {math.hypot(e_x, e_y):.2e} N/C"
         )
 
     def clear_all(self):
         """
         Clear all particles and reset the canvas
         """
-        if self.particles:  # Only save state if there are particles to clear
+        # Only save state if there is something to clear
+        if self.particles or self.distributions or self.conductors:
             self.save_state()
         self.particles = []
+        self.distributions = []
+        self.conductors = []
+        self.induced_charges = []
+        self._conductor_key = None
         self.selected_particle = None
         self.canvas.delete("all")
+        self.quiver_items = []
         self.draw_grid()
+        self.journal_record("clear")
         self.status_label.config(text="All particles cleared")
+        self.refresh_overlays()
 
+    @instrumented("event")
     def canvas_right_click(self, event):
         """
         Handle right-click on canvas to show context menu for particle operations.
@@ -490,6 +4077,7 @@ class ElectrostaticsCalculator:
         else:
             self.selected_particle = None
 
+    @instrumented("event")
     def canvas_double_click(self, event):
         """
         Handle double-click on canvas to edit particle charge.
@@ -527,8 +4115,18 @@ class ElectrostaticsCalculator:
             return
 
         self.save_state()  # Save state before deleting
+
+        particle = self.selected_particle
+        if particle in self.particles:
+            # Record after mutating: the append may checkpoint the configuration
+            index = self.particles.index(particle)
+            self.particles.remove(particle)
+            self.journal_record("remove", index)
+        self.canvas.delete(particle.oval_id)
+        self.canvas.delete(particle.text_id)
         
         self.status_label.config(text=f"Particle deleted. Total particles: {len(self.particles)}")
+        self.refresh_overlays()
         self.selected_particle = None
 
     def edit_selected_particle(self):
@@ -557,6 +4155,15 @@ class ElectrostaticsCalculator:
         if validated_charge is not None and validated_charge != particle.charge:
             self.save_state()  # Save state before editing
             particle.charge = validated_charge
+            if particle in self.particles:
+                self.journal_record("charge", self.particles.index(particle), particle.charge)
+
+            # Charges enter linearly, so cached probe values only need a
+            # rank-1 update. Conductors re-solve instead, since their
+            # induced charge depends on every particle.
+            cache = self.probe_cache
+            if cache is not None and (self.conductors or not cache.sync(self.sources())):
+                self.probe_cache = None
             
             if particle.text_id:
                 self.canvas.delete(particle.text_id)
@@ -572,17 +4179,14 @@ class ElectrostaticsCalculator:
             )
             
             self.status_label.config(text=f"Particle charge updated to {sign}{particle.charge:.2e} C")
+            self.refresh_overlays(incremental=True)  # Sample points stay valid for a new charge
         
         self.selected_particle = None
 
     def save_state(self):
         """Save the current state for undo functionality."""
-        # Create a deep copy of particles (without canvas IDs)
-        state = []
-        for p in self.particles:
-            state.append(p.to_dict())
-        
-        self.undo_stack.append(state)
+        # Plain dicts of particles, distributions and conductors (no canvas IDs)
+        self.undo_stack.append(self.configuration())
         
         # Limit undo stack size
         if len(self.undo_stack) > self.MAX_UNDO_STACK:
@@ -599,15 +4203,16 @@ class ElectrostaticsCalculator:
             return
         
         # Save current state to redo stack
-        current_state = [p.to_dict() for p in self.particles]
-        self.redo_stack.append(current_state)
+        self.redo_stack.append(self.configuration())
         
         # Restore previous state
         previous_state = self.undo_stack.pop()
         self.restore_state(previous_state)
+        self.journal_checkpoint()
         
         self.update_undo_redo_buttons()
         self.status_label.config(text="Undo successful")
+        self.refresh_overlays()
     
     def redo(self):
         """Redo the last undone action."""
@@ -615,36 +4220,100 @@ class ElectrostaticsCalculator:
             return
         
         # Save current state to undo stack
-        current_state = [p.to_dict() for p in self.particles]
-        self.undo_stack.append(current_state)
+        self.undo_stack.append(self.configuration())
         
         # Restore redo state
         redo_state = self.redo_stack.pop()
         self.restore_state(redo_state)
+        self.journal_checkpoint()
         
         self.update_undo_redo_buttons()
         self.status_label.config(text="Redo successful")
+        self.refresh_overlays()
     
+    @instrumented("canvas")
     def restore_state(self, state):
-        """Restore particles from a saved state."""
-        # Clear current particles
-        self.particles.clear()
-        self.canvas.delete("particle")
-        
-        # Restore particles from state
-        for particle_data in state:
-            particle = Particle.from_dict(particle_data)
-            self.particles.append(particle)
-            self.draw_particle(particle)
+        """Restore particles, distributions and conductors from a saved state."""
+        self.selected_particle = None
+        self.apply_configuration(state)
     
     def update_undo_redo_buttons(self):
         """Update undo/redo button states."""
         self.undo_btn.config(state=tk.NORMAL if self.undo_stack else tk.DISABLED)
         self.redo_btn.config(state=tk.NORMAL if self.redo_stack else tk.DISABLED)
     
+    def configuration(self):
+        """Return the particles, distributions and conductors as plain dicts."""
+        return {
+            'particles': [p.to_dict() for p in self.particles],
+            'distributions': [d.to_dict() for d in self.distributions],
+            'conductors': [c.to_dict() for c in self.conductors]
+        }
+
+    def write_configuration(self, filename):
+        """Write the current configuration to a JSON file."""
+        config = {
+            'metadata': {
+                'created': datetime.now().isoformat(),
+                'particle_count': len(self.particles),
+                'version': '1.2'
+            },
+            **self.configuration()
+        }
+
+        with open(filename, 'w') as f:
+            json.dump(config, f, indent=2)
+
+    def read_configuration(self, filename):
+        """
+        Replace the current configuration with one read from a JSON file or
+        a particle array file (see ParticleArrayFile).
+        """
+        if ParticleArrayFile.is_array_file(filename):
+            config = ParticleArrayFile.read_configuration(filename)
+        else:
+            with open(filename, 'r') as f:
+                config = json.load(f)
+
+        # Validate configuration
+        if 'particles' not in config:
+            raise ValueError("Invalid configuration file: missing 'particles' key")
+
+        # Save current state before loading
+        if self.particles or self.distributions or self.conductors:
+            self.save_state()
+
+        self.apply_configuration(config)
+        self.journal_checkpoint()
+
+    def apply_configuration(self, config):
+        """Replace the particles, distributions and conductors on the plane."""
+        # Clear current particles
+        self.particles.clear()
+        self.canvas.delete("particle")
+
+        # Load particles
+        for particle_data in config['particles']:
+            particle = Particle.from_dict(particle_data)
+            self.particles.append(particle)
+            self.draw_particle(particle)
+
+        # Load distributions and conductors (absent in version 1.0 files)
+        self.distributions = [
+            ChargeDistribution.from_dict(d) for d in config.get('distributions', [])
+        ]
+        self.canvas.delete("distribution")
+        for distribution in self.distributions:
+            self.draw_distribution(distribution)
+
+        self.conductors = [Conductor.from_dict(c) for c in config.get('conductors', [])]
+        self.canvas.delete("conductor")
+        for conductor in self.conductors:
+            self.draw_conductor(conductor)
+
     def save_configuration(self):
         """Save current particle configuration to a JSON file."""
-        if not self.particles:
+        if not self.particles and not self.distributions and not self.conductors:
             messagebox.showinfo("No Data", "No particles to save.")
             return
         
@@ -658,17 +4327,7 @@ class ElectrostaticsCalculator:
             return
         
         try:
-            config = {
-                'metadata': {
-                    'created': datetime.now().isoformat(),
-                    'particle_count': len(self.particles),
-                    'version': '1.0'
-                },
-                'particles': [p.to_dict() for p in self.particles]
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(config, f, indent=2)
+            self.write_configuration(filename)
             
             self.status_label.config(text=f"Configuration saved to {filename}")
             messagebox.showinfo("Save Successful", f"Saved {len(self.particles)} particles to:\\n{filename}")
@@ -678,7 +4337,7 @@ class ElectrostaticsCalculator:
     def load_configuration(self):
         """Load particle configuration from a JSON file."""
         filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=[("JSON files", "*.json"), ("Particle arrays", "*.epa"), ("All files", "*.*")],
             title="Load Particle Configuration"
         )
         
@@ -686,26 +4345,8 @@ class ElectrostaticsCalculator:
             return
         
         try:
-            with open(filename, 'r') as f:
-                config = json.load(f)
-            
-            # Validate configuration
-            if 'particles' not in config:
-                raise ValueError("Invalid configuration file: missing 'particles' key")
-            
-            # Save current state before loading
-            if self.particles:
-                self.save_state()
-            
-            # Clear current particles
-            self.particles.clear()
-            self.canvas.delete("particle")
-            
-            # Load particles
-            for particle_data in config['particles']:
-                particle = Particle.from_dict(particle_data)
-                self.particles.append(particle)
-                self.draw_particle(particle)
+            self.read_configuration(filename)
+            self.refresh_overlays()
             
             self.status_label.config(text=f"Configuration loaded from {filename}")
             messagebox.showinfo(
@@ -717,11 +4358,109 @@ class ElectrostaticsCalculator:
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load configuration:\\n{str(e)}")
 
+    def open_profiling_window(self):
+        """
+        Open a window showing instrumentation statistics with controls to
+        enable, reset and export them.
+        """
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("Profiling")
+        stats_window.geometry("900x450")
+
+        enabled_var = tk.BooleanVar(value=PROFILER.enabled)
+
+        def toggle():
+            PROFILER.enabled = enabled_var.get()
+            refresh()
+
+        control_frame = tk.Frame(stats_window)
+        control_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        tk.Checkbutton(
+            control_frame, text="Enable instrumentation", variable=enabled_var, command=toggle
+        ).pack(side=tk.LEFT, padx=5)
+
+        stats_frame = tk.LabelFrame(stats_window, text="Statistics", padx=10, pady=10)
+        stats_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        stats_text = tk.Text(stats_frame, wrap=tk.NONE, font=("Courier", 9))
+        stats_text.pack(fill=tk.BOTH, expand=True)
+
+        def refresh():
+            stats_text.config(state=tk.NORMAL)
+            stats_text.delete("1.0", tk.END)
+            stats_text.insert(tk.END, self.format_profile_stats(PROFILER.snapshot()))
+            stats_text.config(state=tk.DISABLED)
+
+        def auto_refresh():
+            if stats_window.winfo_exists():
+                refresh()
+                stats_window.after(1000, auto_refresh)
+
+        def reset():
+            PROFILER.reset()
+            refresh()
+
+        def export(kind):
+            if kind == "json":
+                filename = filedialog.asksaveasfilename(
+                    defaultextension=".json",
+                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                    title="Export Profiling Statistics"
+                )
+            else:
+                filename = filedialog.asksaveasfilename(
+                    defaultextension=".prom",
+                    filetypes=[("Prometheus textfile", "*.prom"), ("All files", "*.*")],
+                    title="Export Prometheus Textfile"
+                )
+            if not filename:
+                return
+            try:
+                if kind == "json":
+                    PROFILER.export_json(filename)
+                else:
+                    PROFILER.export_prometheus(filename)
+                self.status_label.config(text=f"Profiling statistics exported to {filename}")
+            except OSError as e:
+                messagebox.showerror("Export Error", f"Failed to export statistics:\n{str(e)}")
+
+        tk.Button(control_frame, text="Reset", command=reset).pack(side=tk.LEFT, padx=5)
+        tk.Button(control_frame, text="Export JSON", command=lambda: export("json")).pack(
+            side=tk.LEFT, padx=5
+        )
+        tk.Button(control_frame, text="Export Prometheus", command=lambda: export("prometheus")).pack(
+            side=tk.LEFT, padx=5
+        )
+        tk.Button(stats_window, text="Close", command=stats_window.destroy).pack(pady=(0, 10))
+
+        auto_refresh()
+
+    def format_profile_stats(self, rows):
+        """Format Profiler.snapshot() rows as a fixed-width table."""
+        if not rows:
+            state = "enabled" if PROFILER.enabled else "disabled"
+            return f"No calls recorded yet (instrumentation is {state})."
+
+        lines = [
+            f"{'Name':<46} {'Category':<8} {'Calls':>7} {'Total ms':>10} "
+            f"{'Mean ms':>9} {'Max ms':>9} {'Particles':>11} {'Points':>9}"
+        ]
+        for row in rows:
+            lines.append(
+                f"{row['name'][:46]:<46} {row['category']:<8} {row['calls']:>7} "
+                f"{row['total_seconds'] * 1000:>10.2f} {row['mean_seconds'] * 1000:>9.3f} "
+                f"{row['max_seconds'] * 1000:>9.3f} {row['particles']:>11} {row['points']:>9}"
+            )
+        if any(row['category'] == "event" for row in rows):
+            lines.append("\nEvent rows are handler time, excluding the wait in the Tk event queue.")
+        return "\n".join(lines)
+
     def open_calculation_window(self):
         """
         Open a modal window for calculations
         """
-        if not self.particles:
+        if not self.particles and not self.distributions and not self.conductors:
             messagebox.showwarning(
                 "No Particles", 
                 "No particles have been added yet.\n\n"
@@ -756,6 +4495,11 @@ class ElectrostaticsCalculator:
                 f"Particle {i+1}: {p.particle_type.capitalize()} at "
                 f"({p.x:.2f}, {p.y:.2f}), Charge: {sign}{p.charge}\n",
             )
+        for i, d in enumerate(self.distributions):
+            sign = "+" if d.particle_type == "proton" else "-"
+            particles_text.insert(
+                tk.END, f"Distribution {i+1}: {d.describe()}, Charge: {sign}{d.charge}\n"
+            )
         particles_text.config(state=tk.DISABLED)
 
         calc_frame = tk.LabelFrame(
@@ -771,6 +4515,9 @@ class ElectrostaticsCalculator:
             ("Electric Flux", self.calc_electric_flux),
             ("Gauss's Law", self.calc_gauss_law),
             ("Dipole Moment of the System", self.calc_dipole_moment),
+            ("Conductor Induced Charges", self.calc_conductor_charges),
+            ("Charge Sweep", self.calc_charge_sweep),
+            ("Zero-Field Points", self.calc_null_points),
         ]
 
         for text, command in calculations:
@@ -781,16 +4528,288 @@ class ElectrostaticsCalculator:
             )
             btn.pack(fill=tk.X, pady=2)
 
+        tk.Button(
+            calc_frame,
+            text="Probe Table (many points)",
+            command=lambda: self.open_probe_table(calc_window),
+        ).pack(fill=tk.X, pady=2)
+
         nav_frame = tk.Frame(calc_window)
         nav_frame.pack(fill=tk.X, padx=10, pady=10)
 
         tk.Button(nav_frame, text="Back to Plane", command=calc_window.destroy).pack(
             side=tk.LEFT, padx=5
         )
+
+        # Calculations and overlays have separate engines; only overlays offer float32
+        labels = PhysicsEngine.PRECISION_LABELS
+        precision_var = tk.StringVar(value=labels[self.physics_engine.precision])
+        tk.Label(nav_frame, text="Precision:").pack(side=tk.LEFT, padx=(15, 2))
+        tk.OptionMenu(
+            nav_frame, precision_var, *(labels[p] for p in PhysicsEngine.CALCULATION_PRECISIONS),
+            command=lambda label: self.set_precision(
+                next(p for p in PhysicsEngine.CALCULATION_PRECISIONS if labels[p] == label)
+            ),
+        ).pack(side=tk.LEFT)
+        overlay_var = tk.StringVar(value=labels[self.overlay_engine.precision])
+        tk.Label(nav_frame, text="Overlays:").pack(side=tk.LEFT, padx=(15, 2))
+        tk.OptionMenu(
+            nav_frame, overlay_var, *(labels[p] for p in PhysicsEngine.OVERLAY_PRECISIONS),
+            command=lambda label: self.set_overlay_precision(
+                next(p for p in PhysicsEngine.OVERLAY_PRECISIONS if labels[p] == label)
+            ),
+        ).pack(side=tk.LEFT)
         tk.Button(nav_frame, text="Close Program", command=self.root.quit).pack(
             side=tk.RIGHT, padx=5
         )
 
+    def open_probe_table(self, parent_window):
+        """
+        Open a panel that evaluates potential and field at many points at
+        once: pasted or imported point lists, or line and grid sweeps.
+        The evaluation is one batched engine call on a background thread,
+        and the results are shown in a sortable, paged table.
+        """
+        table_window = tk.Toplevel(parent_window)
+        table_window.title("Probe Table")
+        table_window.geometry("950x650")
+
+        state = {'table': None, 'page': 0}
+
+        input_frame = tk.LabelFrame(
+            table_window, text="Probe Points (one 'x,y' per line)", padx=10, pady=10
+        )
+        input_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        points_text = tk.Text(input_frame, height=6, width=60)
+        points_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        input_buttons = tk.Frame(input_frame)
+        input_buttons.pack(side=tk.LEFT, padx=(10, 0))
+
+        results_frame = tk.LabelFrame(table_window, text="Results", padx=10, pady=10)
+        results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        sort_frame = tk.Frame(results_frame)
+        sort_frame.pack(fill=tk.X)
+        tk.Label(sort_frame, text="Sort by:").pack(side=tk.LEFT)
+
+        results_text = tk.Text(results_frame, wrap=tk.NONE, font=("Courier", 9))
+        results_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        page_frame = tk.Frame(results_frame)
+        page_frame.pack(fill=tk.X, pady=(5, 0))
+        page_label = tk.Label(page_frame, text="No results")
+
+        status = tk.Label(table_window, text="Enter points, then click Evaluate", anchor=tk.W)
+        status.pack(fill=tk.X, padx=10)
+
+        def set_points(points):
+            points_text.delete("1.0", tk.END)
+            points_text.insert(tk.END, "\n".join(f"{x:.10g},{y:.10g}" for x, y in points))
+            status.config(text=f"{len(points)} points ready")
+
+        def render():
+            table = state['table']
+            header = f"{'#':>7} {'x':>11} {'y':>11}" + "".join(
+                f" {name:>12}" for name in ProbeTable.COLUMNS[2:]
+            )
+            lines = [header]
+            lines.extend(ProbeTable.format_row(number, row) for number, row in table.page(state['page']))
+            results_text.config(state=tk.NORMAL)
+            results_text.delete("1.0", tk.END)
+            results_text.insert(tk.END, "\n".join(lines))
+            results_text.config(state=tk.DISABLED)
+            page_label.config(
+                text=f"Page {state['page'] + 1} of {table.page_count()} ({len(table.rows)} rows)"
+            )
+
+        def turn_page(step):
+            table = state['table']
+            if table is None:
+                return
+            state['page'] = min(max(state['page'] + step, 0), table.page_count() - 1)
+            render()
+
+        def sort_by(column):
+            table = state['table']
+            if table is None:
+                return
+            # Clicking the current sort column again reverses the order
+            descending = table.sort_column == column and not table.descending
+            table.sort(column, descending)
+            state['page'] = 0
+            render()
+
+        def import_points():
+            filename = filedialog.askopenfilename(
+                filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt"), ("All files", "*.*")],
+                title="Import Probe Points"
+            )
+            if not filename:
+                return
+            try:
+                with open(filename, 'r') as f:
+                    set_points(ProbeTable.parse_points(f.read()))
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Import Error", f"Failed to import points:\n{str(e)}")
+
+        def ask_corners(title, prompt):
+            text = simpledialog.askstring(title, prompt, parent=table_window)
+            if text is None:
+                return None
+            try:
+                corners = self.parse_points(text)
+            except ValueError as e:
+                messagebox.showerror("Invalid Points", str(e))
+                return None
+            if len(corners) != 2:
+                messagebox.showerror("Invalid Points", "Enter exactly two points.")
+                return None
+            return corners
+
+        def line_sweep():
+            corners = ask_corners("Line Sweep", "Enter the start and end as 'x0,y0; x1,y1':")
+            if corners is None:
+                return
+            count = simpledialog.askinteger(
+                "Line Sweep", "Number of points:", initialvalue=200, minvalue=1,
+                maxvalue=self.MAX_PROBE_POINTS, parent=table_window
+            )
+            if count is not None:
+                (x0, y0), (x1, y1) = corners
+                set_points(ProbeTable.line_sweep(x0, y0, x1, y1, count))
+
+        def grid_sweep():
+            corners = ask_corners("Grid Sweep", "Enter two opposite corners as 'x0,y0; x1,y1':")
+            if corners is None:
+                return
+            columns = simpledialog.askinteger(
+                "Grid Sweep", "Number of columns:", initialvalue=20, minvalue=1, parent=table_window
+            )
+            rows = simpledialog.askinteger(
+                "Grid Sweep", "Number of rows:", initialvalue=20, minvalue=1, parent=table_window
+            )
+            if columns is None or rows is None:
+                return
+            if columns * rows > self.MAX_PROBE_POINTS:
+                messagebox.showerror(
+                    "Too Many Points", f"A grid sweep is limited to {self.MAX_PROBE_POINTS} points."
+                )
+                return
+            (x0, y0), (x1, y1) = corners
+            set_points(ProbeTable.grid_sweep(x0, y0, x1, y1, columns, rows))
+
+        def evaluate():
+            try:
+                points = ProbeTable.parse_points(points_text.get("1.0", tk.END))
+            except ValueError as e:
+                messagebox.showerror("Invalid Points", str(e))
+                return
+            if not points:
+                messagebox.showinfo("No Points", "Enter, import or generate probe points first.")
+                return
+
+            # Resolve conductors on the Tk thread; the worker only reads
+            try:
+                sources = list(self.sources())
+            except ValueError as e:
+                status.config(text=f"Evaluation unavailable: {e}")
+                return
+            outcome = {}
+
+            def work():
+                try:
+                    results = self.physics_engine.calc_potential_and_field_at_points(sources, points)
+                    outcome['table'] = ProbeTable(points, results)
+                except Exception as e:
+                    outcome['error'] = e
+
+            def poll():
+                if not table_window.winfo_exists():
+                    return
+                if worker.is_alive():
+                    table_window.after(20, poll)
+                    return
+                evaluate_btn.config(state=tk.NORMAL)
+                if 'error' in outcome:
+                    status.config(text="Evaluation failed")
+                    messagebox.showerror("Calculation Error", str(outcome['error']))
+                    return
+                state['table'] = outcome['table']
+                state['page'] = 0
+                render()
+                status.config(
+                    text=f"Evaluated {len(points)} points in {time.perf_counter() - started:.2f} s"
+                )
+
+            started = time.perf_counter()
+            evaluate_btn.config(state=tk.DISABLED)
+            status.config(text=f"Evaluating {len(points)} points...")
+            worker = threading.Thread(target=work, daemon=True)
+            worker.start()
+            poll()
+
+        def export_csv():
+            table = state['table']
+            if table is None:
+                messagebox.showinfo("No Results", "Evaluate some points before exporting.")
+                return
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                title="Export Probe Table"
+            )
+            if not filename:
+                return
+            try:
+                table.write_csv(filename)
+                status.config(text=f"Exported {len(table.rows)} rows to {filename}")
+            except OSError as e:
+                messagebox.showerror("Export Error", f"Failed to export table:\n{str(e)}")
+
+        for text, command in (
+            ("Import...", import_points),
+            ("Line Sweep...", line_sweep),
+            ("Grid Sweep...", grid_sweep),
+        ):
+            tk.Button(input_buttons, text=text, width=14, command=command).pack(pady=2)
+        evaluate_btn = tk.Button(
+            input_buttons, text="Evaluate", width=14, command=evaluate, bg="green", fg="white"
+        )
+        evaluate_btn.pack(pady=2)
+
+        for column, name in enumerate(ProbeTable.COLUMNS):
+            tk.Button(sort_frame, text=name, command=lambda c=column: sort_by(c)).pack(
+                side=tk.LEFT, padx=2
+            )
+
+        tk.Button(page_frame, text="< Prev", command=lambda: turn_page(-1)).pack(side=tk.LEFT)
+        page_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(page_frame, text="Next >", command=lambda: turn_page(1)).pack(side=tk.LEFT)
+        tk.Button(page_frame, text="Export CSV...", command=export_csv).pack(side=tk.RIGHT)
+
+        tk.Button(table_window, text="Close", command=table_window.destroy).pack(pady=(0, 10))
+
+    def set_precision(self, precision):
+        """
+        Switch the precision of the calculations. Caches record the
+        precision they were built with, so the probe cache is rebuilt
+        on its next use.
+        """
+        if precision not in PhysicsEngine.CALCULATION_PRECISIONS:
+            raise ValueError(f"Not a calculation precision: {precision}")
+        self.physics_engine.precision = precision
+        self.status_label.config(text=f"Precision: {PhysicsEngine.PRECISION_LABELS[precision]}")
+
+    def set_overlay_precision(self, precision):
+        """Switch the precision of the field map and arrows and redraw them."""
+        if precision not in PhysicsEngine.OVERLAY_PRECISIONS:
+            raise ValueError(f"Not an overlay precision: {precision}")
+        self.overlay_engine.precision = precision
+        self.status_label.config(text=f"Overlay precision: {PhysicsEngine.PRECISION_LABELS[precision]}")
+        self.refresh_overlays()
+
     def perform_calculation(self, calc_function, parent_window):
         """
         Perform the selected calculation and display the result in a new window.
@@ -851,7 +4870,7 @@ class ElectrostaticsCalculator:
         if point_x is None or point_y is None:
             return "Calculation cancelled."
 
-        result, error_location = self.physics_engine.calc_electric_field(self.particles, point_x, point_y)
+        result, error_location = self.physics_engine.calc_electric_field(self.sources(), point_x, point_y)
         
         if result is None:
             return (
@@ -882,7 +4901,7 @@ class ElectrostaticsCalculator:
         if point_x is None or point_y is None:
             return "Calculation cancelled."
 
-        v, error_location = self.physics_engine.calc_electric_potential(self.particles, point_x, point_y)
+        v, error_location = self.physics_engine.calc_electric_potential(self.sources(), point_x, point_y)
         
         if v is None:
             return (
@@ -905,7 +4924,7 @@ class ElectrostaticsCalculator:
         if None in [test_charge, point_x, point_y]:
             return "Calculation cancelled."
 
-        result, error_location = self.physics_engine.calc_force_on_charge(self.particles, test_charge, point_x, point_y)
+        result, error_location = self.physics_engine.calc_force_on_charge(self.sources(), test_charge, point_x, point_y)
         
         if result is None:
             return (
@@ -928,17 +4947,18 @@ class ElectrostaticsCalculator:
 
     def calc_potential_energy(self):
         """Calculate the potential energy of the system of particles."""
-        if len(self.particles) < 2:
+        count = len(self.particles) + len(self.distributions)
+        if count < 2:
             return (
                 "Insufficient particles for potential energy calculation.\n\n"
-                "This calculation requires at least 2 particles.\n"
-                f"Current particle count: {len(self.particles)}\n\n"
+                "This calculation requires at least 2 particles or distributions.\n"
+                f"Current count: {count}\n\n"
                 "Recovery Steps:\n"
                 "1. Add more particles using the 'Add Positive/Negative Particle' buttons\n"
                 "2. Return to this calculation when you have 2 or more particles"
             )
 
-        u = self.physics_engine.calc_potential_energy(self.particles)
+        u = self.physics_engine.calc_potential_energy(self.sources())
 
         return f"Potential Energy of the System:\n\n" f"U = {u:.2e} J"
 
@@ -951,7 +4971,7 @@ class ElectrostaticsCalculator:
         if None in [radius, center_x, center_y]:
             return "Calculation cancelled."
 
-        enclosed_charge, flux = self.physics_engine.calc_electric_flux(self.particles, center_x, center_y, radius)
+        enclosed_charge, flux = self.physics_engine.calc_electric_flux(self.sources(), center_x, center_y, radius)
 
         return (
             f"Electric Flux through Gaussian surface:\n\n"
@@ -970,17 +4990,18 @@ class ElectrostaticsCalculator:
 
     def calc_dipole_moment(self):
         """Calculate the electric dipole moment of the system."""
-        if len(self.particles) < 2:
+        count = len(self.particles) + len(self.distributions)
+        if count < 2:
             return (
                 "Insufficient particles for dipole moment calculation.\n\n"
-                "This calculation requires at least 2 particles.\n"
-                f"Current particle count: {len(self.particles)}\n\n"
+                "This calculation requires at least 2 particles or distributions.\n"
+                f"Current count: {count}\n\n"
                 "Recovery Steps:\n"
                 "1. Add more particles using the 'Add Positive/Negative Particle' buttons\n"
                 "2. Return to this calculation when you have 2 or more particles"
             )
 
-        p_x, p_y, p_magnitude, total_charge = self.physics_engine.calc_dipole_moment(self.particles)
+        p_x, p_y, p_magnitude, total_charge = self.physics_engine.calc_dipole_moment(self.sources())
 
         if total_charge != 0:
             center_note = f"Note: System has net charge of {total_charge:.2e} C"
@@ -995,12 +5016,239 @@ class ElectrostaticsCalculator:
             f"{center_note}"
         )
 
+    def calc_conductor_charges(self):
+        """Solve for and report the charge induced on each conductor."""
+        if not self.conductors:
+            return (
+                "No conductors have been added.\n\n"
+                "Recovery Steps:\n"
+                "1. Click 'Add Conductor' and choose a segment, circle or polygon\n"
+                "2. Return to this calculation to see the induced charge"
+            )
+
+        try:
+            self.sources()
+        except ValueError as e:
+            return f"Conductor solve failed:\n\n{e}"
+
+        totals = {}
+        for charge in self.induced_charges:
+            totals.setdefault(id(charge.conductor), 0.0)
+            totals[id(charge.conductor)] += charge.charge * charge.sign
+
+        lines = ["Charge Induced on Conductors:\n"]
+        for i, conductor in enumerate(self.conductors):
+            lines.append(
+                f"Conductor {i+1} ({conductor.shape}, {conductor.potential:.2f} V): "
+                f"Q = {totals.get(id(conductor), 0.0):.2e} C"
+            )
+
+        report = self.conductor_solver.last_report
+        lines.append(
+            f"\nSolve: {report['panels']} panels, {report['iterations']} GMRES iterations, "
+            f"{report['matvecs']} mat-vec products\n"
+            f"Relative residual: {report['residual']:.1e}\n"
+            f"Solve time: {report['solve_time'] * 1000:.1f} ms"
+        )
+        return "\n".join(lines)
+
+    def calc_charge_sweep(self):
+        """
+        Sweep one particle's charge and report potential, field and system
+        energy at the user's probe points for each value.
+        """
+        count = len(self.particles)
+        if count == 0:
+            return "Charge sweep requires at least one particle."
+
+        index = simpledialog.askinteger(
+            "Input", f"Enter the particle number to sweep (1-{count}):",
+            minvalue=1, maxvalue=count
+        )
+        if index is None:
+            return "Calculation cancelled."
+        particle = self.particles[index - 1]
+
+        start = simpledialog.askfloat("Input", "Enter the starting charge magnitude (C):",
+                                      initialvalue=particle.charge, minvalue=0)
+        end = simpledialog.askfloat("Input", "Enter the ending charge magnitude (C):",
+                                    initialvalue=particle.charge * 10, minvalue=0)
+        steps = simpledialog.askinteger("Input", "Enter the number of steps:",
+                                        initialvalue=10, minvalue=2, maxvalue=1000)
+        default_points = "; ".join(f"{x},{y}" for x, y in self.probe_points) or "0,0"
+        text = simpledialog.askstring("Input", "Enter probe points as 'x1,y1; x2,y2':",
+                                      initialvalue=default_points)
+
+        if None in [start, end, steps, text]:
+            return "Calculation cancelled."
+
+        self.probe_points = self.parse_points(text)
+        if not self.probe_points:
+            raise ValueError("At least one probe point is required")
+
+        magnitudes = [start + (end - start) * i / (steps - 1) for i in range(steps)]
+        if self.conductors:
+            sweep = self.sweep_with_conductors(particle, magnitudes, self.probe_points)
+        else:
+            cache = self.get_probe_cache(self.probe_points)
+            source_index = cache.sources.index(particle)
+            sweep = cache.sweep(source_index, [q * particle.sign for q in magnitudes])
+
+        sign = "+" if particle.particle_type == "proton" else "-"
+        lines = [f"Charge Sweep of Particle {index} ({particle.x:.2f}, {particle.y:.2f}):\n"]
+        for i, q in enumerate(magnitudes):
+            lines.append(f"q = {sign}{q:.2e} C    U = {sweep['energy'][i]:.2e} J")
+            for (x, y), v, e in zip(self.probe_points, sweep['potential'][i], sweep['field'][i]):
+                if v is None:
+                    lines.append(f"    ({x}, {y}): coincides with a particle")
+                else:
+                    lines.append(
+                        f"    ({x}, {y}): V = {v:.2e} V, |E| = {math.hypot(*e):.2e} N/C"
+                    )
+        return "\n".join(lines)
+
+    def sweep_with_conductors(self, particle, magnitudes, points):
+        """
+        Charge sweep that re-solves the conductors at every step, since the
+        induced charges change with the swept charge. Returns the same
+        dictionary as SuperpositionCache.sweep.
+        """
+        original = particle.charge
+        result = {'charges': [q * particle.sign for q in magnitudes],
+                  'potential': [], 'field': [], 'energy': []}
+        try:
+            for q in magnitudes:
+                particle.charge = q
+                sources = self.sources()
+                values = self.physics_engine.calc_potential_and_field_at_points(sources, points)
+                result['potential'].append([None if value is None else value[0] for value in values])
+                result['field'].append([None if value is None else value[1:] for value in values])
+                result['energy'].append(self.physics_engine.calc_potential_energy(sources))
+        finally:
+            particle.charge = original
+        return result
+
+    def calc_null_points(self):
+        """
+        Find where the net electric field vanishes on the visible plane and
+        mark those points on the canvas.
+        """
+        x0, y1 = self.canvas_to_coords(0, 0)
+        x1, y0 = self.canvas_to_coords(self.CANVAS_WIDTH, self.CANVAS_HEIGHT)
+
+        start = time.perf_counter()
+        null_points = self.null_finder.find(self.sources(), (x0, y0, x1, y1))
+        elapsed = time.perf_counter() - start
+
+        self.draw_null_points(null_points)
+
+        if not null_points:
+            return (
+                "No zero-field points found on the visible plane.\n\n"
+                "The net field may vanish outside the visible area, or only\n"
+                "at infinity (for example, a single isolated charge)."
+            )
+
+        lines = [f"Zero-Field Points ({len(null_points)} found in {elapsed * 1000:.0f} ms):\n"]
+        for i, point in enumerate(null_points):
+            lines.append(
+                f"{i+1}. ({point['x']:.4f}, {point['y']:.4f}): {point['kind']} of V, "
+                f"V = {point['potential']:.2e} V"
+            )
+        lines.append("\nSaddle points are marked with X, minima and maxima with diamonds.")
+        return "\n".join(lines)
+
+    @instrumented("canvas")
+    def draw_null_points(self, null_points):
+        """Mark zero-field points on the canvas."""
+        self.canvas.delete("null_point")
+        size = 6
+
+        for point in null_points:
+            cx, cy = self.coords_to_canvas(point['x'], point['y'])
+            if point['kind'] == "saddle":
+                self.canvas.create_line(cx - size, cy - size, cx + size, cy + size,
+                                        fill="darkgreen", width=2, tags="null_point")
+                self.canvas.create_line(cx - size, cy + size, cx + size, cy - size,
+                                        fill="darkgreen", width=2, tags="null_point")
+            else:
+                color = "purple" if point['kind'] == "minimum" else "orange"
+                self.canvas.create_polygon(cx, cy - size, cx + size, cy, cx, cy + size, cx - size, cy,
+                                           fill=color, outline="black", tags="null_point")
+
+    def journal_record(self, *record):
+        """
+        Append an edit to the autosave journal, if one is open. Call it
+        after the edit is applied, since the append may checkpoint the
+        current configuration.
+        """
+        if self.journal is None:
+            return
+        try:
+            self.journal.append(list(record))
+        except OSError as e:
+            self.journal_failed(e)
+
+    def journal_checkpoint(self):
+        """
+        Checkpoint the journal after a change that replaces the whole
+        configuration (loading, undo, redo), instead of journaling it.
+        """
+        if self.journal is None:
+            return
+        try:
+            self.journal.checkpoint()
+        except OSError as e:
+            self.journal_failed(e)
+
+    def journal_failed(self, error):
+        self.journal = None
+        messagebox.showwarning("Autosave Disabled", f"Could not write the autosave journal:\n{str(error)}")
+
+    def open_journal(self, path=None):
+        """
+        Start autosaving to the edit journal, first offering to recover a
+        session that did not exit cleanly.
+        """
+        path = path or os.environ.get("ELECTROSTATICS_JOURNAL") or os.path.join(
+            os.path.expanduser("~"), ".electrostatics_journal"
+        )
+        journal = EditJournal(path, self.configuration)
+
+        try:
+            if journal.has_session() and messagebox.askyesno(
+                "Recover Session",
+                "The previous session did not exit cleanly.\n\n"
+                "Restore the particles from its autosave journal?"
+            ):
+                start = time.perf_counter()
+                config, replayed = journal.recover()
+                self.apply_configuration(config)
+                self.refresh_overlays()
+                journal.checkpoint()
+                self.status_label.config(
+                    text=f"Recovered {len(self.particles)} particles "
+                    f"({replayed} journal records) in {time.perf_counter() - start:.2f} s"
+                )
+            else:
+                journal.discard()
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            messagebox.showerror("Recovery Error", f"Could not recover the previous session:\n{str(e)}")
+            journal.discard()
+
+        self.journal = journal
+
     def run(self):
         """Run the main application loop."""
         # Ensure proper grid drawing after window is displayed
         self.root.after(100, self.draw_grid)
+        self.open_journal()
         self.root.mainloop()
 
+        # Clean exit: nothing to recover next time
+        if self.journal is not None:
+            self.journal.discard()
+
 
 if __name__ == "__main__":
     app = ElectrostaticsCalculator()
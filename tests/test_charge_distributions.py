@@ -0,0 +1,100 @@
+import math
+import unittest
+
+from electromagnetism import (
+    ArcCharge,
+    DiskCharge,
+    LineCharge,
+    Particle,
+    PhysicsEngine,
+    RingCharge,
+)
+
+
+class QuadratureAccuracyTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        self.k = self.engine.k
+        self.q = 2e-9
+
+    def test_ring_center(self):
+        ring = RingCharge(1, -2, 3, self.q, "proton")
+        (e_x, e_y, _, _), _ = self.engine.calc_electric_field([ring], 1, -2)
+        v, _ = self.engine.calc_electric_potential([ring], 1, -2)
+
+        self.assertAlmostEqual(v, self.k * self.q / 3, delta=1e-12 * v)
+        self.assertLess(math.hypot(e_x, e_y), 1e-9 * self.k * self.q / 9)
+
+    def test_line_closed_form(self):
+        # Potential of a segment of length 2a at distance d from its midpoint
+        a, d = 2.0, 0.01
+        line = LineCharge(-a, 0, a, 0, self.q, "proton")
+        v, _ = self.engine.calc_electric_potential([line], 0, d)
+        expected = self.k * self.q / (2 * a) * 2 * math.asinh(a / d)
+        self.assertAlmostEqual(v, expected, delta=1e-9 * expected)
+
+        field = self.engine.calc_field_at_points([line], [(0, d)])[0]
+        expected_e = self.k * self.q / (2 * a) * 2 * a / (d * math.hypot(a, d))
+        self.assertAlmostEqual(field[1], expected_e, delta=1e-9 * expected_e)
+        self.assertAlmostEqual(field[0], 0, delta=1e-9 * expected_e)
+
+    def test_disk_matches_point_charge_far_away(self):
+        disk = DiskCharge(0, 0, 1, self.q, "electron")
+        v, _ = self.engine.calc_electric_potential([disk], 0, 100)
+        # Quadrupole correction of a uniform disk on its plane is -R^2 / (8 r^3)
+        expected = -self.k * self.q / 100 * (1 + 1 / (8 * 100**2))
+        self.assertAlmostEqual(v, expected, delta=1e-8 * abs(expected))
+
+    def test_disk_center_potential(self):
+        # V = k q * 2 pi R / (pi R^2) at the center of a uniform disk
+        disk = DiskCharge(0, 0, 2, self.q, "proton")
+        v, _ = self.engine.calc_electric_potential([disk], 0, 0)
+        expected = self.k * self.q * 2 / 2
+        self.assertAlmostEqual(v, expected, delta=1e-6 * expected)
+
+    def test_batched_matches_single_point(self):
+        sources = [LineCharge(-1, 0, 1, 0, self.q, "proton"), Particle(0, 2, self.q, "electron")]
+        points = [(0, 0.5), (3, 1), (-0.5, -0.001)]
+        batched = self.engine.calc_potential_and_field_at_points(sources, points)
+        for (x, y), (v, e_x, e_y) in zip(points, batched):
+            expected_v, _ = self.engine.calc_electric_potential(sources, x, y)
+            (expected_x, expected_y, _, _), _ = self.engine.calc_electric_field(sources, x, y)
+            self.assertAlmostEqual(v, expected_v, delta=1e-12 * abs(expected_v))
+            self.assertAlmostEqual(e_x, expected_x, delta=1e-12 * math.hypot(e_x, e_y))
+            self.assertAlmostEqual(e_y, expected_y, delta=1e-12 * math.hypot(e_x, e_y))
+
+
+class SingularPointTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        self.line = LineCharge(-1, 0, 1, 0, 1e-9, "proton")
+
+    def test_point_on_line_has_no_potential(self):
+        v, error = self.engine.calc_electric_potential([self.line], 0.3, 0)
+        self.assertIsNone(v)
+        self.assertIn("line charge", error)
+        field, error = self.engine.calc_electric_field([self.line], 0.3, 0)
+        self.assertIsNone(field)
+
+    def test_batched_methods_return_none_on_line(self):
+        points = [(0.3, 0), (1, 0), (0.3, 1e-3), (2, 0)]
+        for method in (self.engine.calc_potential_at_points,
+                       self.engine.calc_field_at_points,
+                       self.engine.calc_potential_and_field_at_points,
+                       self.engine.calc_field_and_jacobian_at_points):
+            results = method([self.line], points)
+            self.assertIsNone(results[0], method.__name__)
+            self.assertIsNone(results[1], method.__name__)
+            self.assertIsNotNone(results[2], method.__name__)
+            self.assertIsNotNone(results[3], method.__name__)
+
+    def test_point_on_arc(self):
+        arc = ArcCharge(0, 0, 2, 0, 90, 1e-9, "proton")
+        on_arc = (2 * math.cos(math.radians(30)), 2 * math.sin(math.radians(30)))
+        self.assertIsNone(self.engine.calc_potential_at_points([arc], [on_arc])[0])
+        # Same radius but outside the angular span
+        self.assertIsNotNone(self.engine.calc_potential_at_points([arc], [(0, -2)])[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from compute_server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    SERVER_ERROR,
+    ComputeClient,
+    RPCError,
+    make_server,
+)
+from electromagnetism import Particle, PhysicsEngine
+
+
+class ComputeServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = make_server(port=0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        host, port = cls.server.server_address[:2]
+        cls.url = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+
+    def setUp(self):
+        self.client = ComputeClient(self.url, timeout=10)
+        self.addCleanup(self.client.close)
+        self.particles = [[-1, 0, 1e-9], [1, 0, -2e-9]]
+        self.client.call("upload_configuration", name="pair", particles=self.particles)
+
+    def test_potential_matches_engine(self):
+        points = [[0, 1], [2, 2], [-1, 0]]
+        result = self.client.call("potential", name="pair", points=points)
+
+        sources = [Particle(-1, 0, 1e-9, "proton"), Particle(1, 0, 2e-9, "electron")]
+        expected = PhysicsEngine().calc_potential_at_points(sources, [tuple(p) for p in points])
+        self.assertEqual(result[2], None)  # On a charge
+        for value, ref in zip(result[:2], expected[:2]):
+            self.assertAlmostEqual(value, ref, delta=1e-12 * abs(ref))
+
+    def test_errors_carry_json_rpc_codes(self):
+        with self.assertRaises(RPCError) as caught:
+            self.client.call("potential", name="missing", points=[[0, 0]])
+        self.assertEqual(caught.exception.code, SERVER_ERROR)
+
+        with self.assertRaises(RPCError) as caught:
+            self.client.call("no_such_method")
+        self.assertEqual(caught.exception.code, METHOD_NOT_FOUND)
+
+        with self.assertRaises(RPCError) as caught:
+            self.client.call("field", name="pair", points=[[0, 1]], backend="fmm")
+        self.assertEqual(caught.exception.code, INVALID_PARAMS)
+
+    def test_pipelined_batch(self):
+        batch = [
+            {'jsonrpc': "2.0", 'id': 1, 'method': "energy", 'params': {'name': "pair"}},
+            {'jsonrpc': "2.0", 'id': 2, 'method': "field", 'params': {'name': "pair", 'points': [[0, 1]]}},
+            {'jsonrpc': "2.0", 'method': "list_configurations"},  # Notification
+        ]
+        single = {'jsonrpc': "2.0", 'id': 3, 'method': "dipole", 'params': {'name': "pair"}}
+        (batch_response, _), (single_response, _) = self.client.pipeline([batch, single])
+
+        self.assertEqual([r['id'] for r in batch_response], [1, 2])
+        energy = -8.99e9 * 2e-18 / 2
+        self.assertAlmostEqual(batch_response[0]['result'], energy, delta=1e-12 * abs(energy))
+        self.assertEqual(len(batch_response[1]['result']), 1)
+        self.assertEqual(single_response['id'], 3)
+        self.assertAlmostEqual(single_response['result']['total_charge'], -1e-9, delta=1e-21)
+
+
+if __name__ == "__main__":
+    unittest.main()
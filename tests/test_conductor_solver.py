@@ -0,0 +1,40 @@
+import unittest
+
+from electromagnetism import Conductor, ConductorSolver, Particle, PhysicsEngine
+
+
+class ConductorSolverTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        self.solver = ConductorSolver(self.engine)
+        self.conductors = [
+            Conductor("circle", [(0, 0)], 100.0, radius=2),
+            Conductor("segment", [(4, -3), (4, 3)], -50.0),
+        ]
+        self.particles = [Particle(-4, 0, 1e-9, "proton")]
+
+    def test_gmres_converges(self):
+        self.solver.solve(self.conductors, self.particles)
+        report = self.solver.last_report
+        self.assertLess(report['residual'], self.solver.tolerance)
+        self.assertEqual(report['panels'], len(self.solver.collocation_points(self.conductors)))
+
+    def test_evaluated_field_meets_boundary_condition(self):
+        charges = self.solver.solve(self.conductors, self.particles)
+        targets = self.solver.collocation_points(self.conductors)
+        potentials = self.engine.calc_potential_at_points(self.particles + charges, targets)
+
+        expected = []
+        for conductor in self.conductors:
+            expected += [conductor.potential] * len(conductor.panels(self.solver.panel_length))
+        for v, target in zip(potentials, expected):
+            self.assertAlmostEqual(v, target, delta=1e-5 * abs(target))
+
+    def test_particle_on_surface_is_rejected(self):
+        target = self.solver.collocation_points(self.conductors)[0]
+        with self.assertRaises(ValueError):
+            self.solver.solve(self.conductors, [Particle(*target, 1e-9, "proton")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+
+from electromagnetism import EditJournal
+
+
+def particle(x, y, charge=1e-9):
+    return {'x': x, 'y': y, 'charge': charge, 'particle_type': "proton"}
+
+
+class EditJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "journal")
+        self.config = {'particles': [], 'distributions': [], 'conductors': []}
+        self.journal = EditJournal(self.path, lambda: json.loads(json.dumps(self.config)))
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def edit(self, *record):
+        """Apply an edit to the live configuration, then journal it."""
+        EditJournal.apply(self.config, list(record))
+        self.journal.append(list(record))
+
+    def recovered(self):
+        self.journal.close()
+        return EditJournal(self.path, dict).recover()
+
+    def test_replays_records(self):
+        self.edit("add", particle(0, 0))
+        self.edit("add", particle(1, 2))
+        self.edit("move", 0, 3, 4)
+        self.edit("charge", 1, 5e-9)
+        self.edit("remove", 0)
+        self.edit("add_distribution", {'kind': "line"})
+
+        config, replayed = self.recovered()
+        self.assertEqual(config, self.config)
+        self.assertEqual(replayed, 6)
+
+    def test_checkpoint_during_append_keeps_edit(self):
+        self.journal.CHECKPOINT_INTERVAL = 3
+        for i in range(4):
+            self.edit("add", particle(i, 0))
+        # The fifth record triggers a checkpoint; it must already hold the removal
+        self.edit("remove", 1)
+        self.assertTrue(os.path.exists(self.journal.checkpoint_path))
+
+        config, _ = self.recovered()
+        self.assertEqual([p['x'] for p in config['particles']], [0, 2, 3])
+
+    def test_explicit_checkpoint_replaces_journal(self):
+        self.edit("add", particle(0, 0))
+        self.config['particles'] = [particle(5, 5), particle(6, 6)]
+        self.journal.checkpoint()
+        self.edit("move", 1, 7, 7)
+
+        config, replayed = self.recovered()
+        self.assertEqual(config, self.config)
+        self.assertEqual(replayed, 1)
+
+    def test_torn_final_line_is_ignored(self):
+        self.edit("add", particle(0, 0))
+        self.edit("add", particle(1, 0))
+        self.journal.close()
+        with open(self.path, 'a') as f:
+            f.write('["add",{"x":2,')
+
+        config, replayed = EditJournal(self.path, dict).recover()
+        self.assertEqual(len(config['particles']), 2)
+        self.assertEqual(replayed, 2)
+
+    def test_stale_journal_generation_is_skipped(self):
+        # A crash after writing a checkpoint but before truncating the journal
+        self.edit("add", particle(0, 0))
+        self.journal.close()
+        with open(self.journal.checkpoint_path, 'w') as f:
+            json.dump({'generation': 1, 'configuration': {'particles': [particle(9, 9)]}}, f)
+
+        config, replayed = EditJournal(self.path, dict).recover()
+        self.assertEqual(config['particles'], [particle(9, 9)])
+        self.assertEqual(replayed, 0)
+
+    def test_discard_removes_session(self):
+        self.edit("add", particle(0, 0))
+        self.journal.checkpoint()
+        self.assertTrue(self.journal.has_session())
+        self.journal.discard()
+        self.assertFalse(EditJournal(self.path, dict).has_session())
+
+
+if __name__ == "__main__":
+    unittest.main()
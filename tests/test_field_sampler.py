@@ -0,0 +1,91 @@
+import math
+import unittest
+
+from electromagnetism import AdaptiveFieldSampler, Particle, PhysicsEngine
+
+
+class CountingEngine(PhysicsEngine):
+    """Records the size of every batched evaluation."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def calc_potential_and_field_at_points(self, particles, points):
+        self.batches.append(len(points))
+        return super().calc_potential_and_field_at_points(particles, points)
+
+
+class AdaptiveFieldSamplerTest(unittest.TestCase):
+    bounds = (-8, -6, 8, 6)
+
+    def setUp(self):
+        self.engine = CountingEngine()
+        self.dipole = [Particle(-2, 0.3, 1e-9, "proton"), Particle(2, -0.3, 1e-9, "electron")]
+
+    def test_one_batched_call_per_level(self):
+        tree = AdaptiveFieldSampler(self.engine, max_level=4).sample(self.dipole, self.bounds)
+        self.assertEqual(tree.calls, len(self.engine.batches))
+        self.assertLessEqual(tree.calls, 5)
+        self.assertEqual(tree.evaluations, sum(self.engine.batches))
+        self.assertEqual(tree.evaluations, len(tree.values))
+
+    def test_lookup_interpolates_the_field(self):
+        tree = AdaptiveFieldSampler(self.engine, tolerance=0.01).sample(self.dipole, self.bounds)
+        for x, y in [(0, 3), (-5, -4), (6, 1), (0.5, 0.5)]:
+            v, e_x, e_y = tree.lookup(x, y)
+            ref_v, ref_x, ref_y = self.engine.calc_potential_and_field_at_points(self.dipole, [(x, y)])[0]
+            self.assertAlmostEqual(v, ref_v, delta=0.02 * abs(ref_v) + 1e-3)
+            self.assertAlmostEqual(math.hypot(e_x, e_y), math.hypot(ref_x, ref_y),
+                                   delta=0.05 * math.hypot(ref_x, ref_y))
+        self.assertIsNone(tree.lookup(20, 0))
+
+    def test_smooth_field_is_not_refined(self):
+        far = [Particle(500, 400, 1e-9, "proton")]
+        tree = AdaptiveFieldSampler(self.engine, coarse_cells=8).sample(far, self.bounds)
+        self.assertEqual(tree.calls, 1)
+        self.assertTrue(all(cell.level == 0 for cell in tree.leaves()))
+        self.assertEqual(tree.uniform_evaluations, 9 * 7)  # Corners of the coarse grid
+
+    def test_refinement_stops_at_the_level_cap(self):
+        tree = AdaptiveFieldSampler(self.engine, max_level=3).sample(self.dipole, self.bounds)
+        levels = [cell.level for cell in tree.leaves()]
+        self.assertEqual(max(levels), 3)
+        self.assertGreater(tree.savings, 0.5)
+
+    def test_charge_count_does_not_force_refinement(self):
+        # A tight cluster looks like one charge from a distance, so it
+        # should cost about the same as a single charge
+        cluster = [Particle(0.01 * i, 0.01 * j, 1e-11, "proton") for i in range(10) for j in range(10)]
+        single = [Particle(0.045, 0.045, 1e-9, "proton")]
+        sampler = AdaptiveFieldSampler(PhysicsEngine())
+        many = sampler.sample(cluster, self.bounds)
+        one = sampler.sample(single, self.bounds)
+        self.assertLess(many.evaluations, 1.2 * one.evaluations)
+
+    def test_term_budget(self):
+        budget = 2000 * len(self.dipole)
+        tree = AdaptiveFieldSampler(self.engine, max_terms=budget).sample(self.dipole, self.bounds)
+        self.assertTrue(tree.budget_reached)
+        self.assertLessEqual(tree.evaluations * len(self.dipole), budget)
+        unbounded = AdaptiveFieldSampler(self.engine).sample(self.dipole, self.bounds)
+        self.assertFalse(unbounded.budget_reached)
+        self.assertGreater(unbounded.evaluations, tree.evaluations)
+
+    def test_coarse_grid_shrinks_to_fit_the_budget(self):
+        tree = AdaptiveFieldSampler(self.engine, max_terms=100).sample(self.dipole, self.bounds)
+        self.assertLess(tree.columns, 16)
+        self.assertLessEqual(tree.evaluations, 50)
+
+    def test_contours_follow_equipotentials(self):
+        single = [Particle(0, 0, 1e-9, "proton")]
+        tree = AdaptiveFieldSampler(self.engine, tolerance=0.01).sample(single, self.bounds)
+        level = 8.99e9 * 1e-9 / 3  # The circle r = 3
+        segments = tree.contour_segments(level)
+        self.assertTrue(segments)
+        for end in (p for segment in segments for p in segment):
+            self.assertAlmostEqual(math.hypot(*end), 3, delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from electromagnetism import NullPointFinder, Particle, PhysicsEngine
+
+
+class NullPointFinderTest(unittest.TestCase):
+    def setUp(self):
+        self.finder = NullPointFinder(PhysicsEngine())
+        self.bounds = (-10, -10, 10, 10)
+
+    def test_equal_charges_have_saddle_at_midpoint(self):
+        particles = [Particle(-3, 0, 1e-9, "proton"), Particle(3, 0, 1e-9, "proton")]
+        null_points = self.finder.find(particles, self.bounds)
+
+        self.assertEqual(len(null_points), 1)
+        point = null_points[0]
+        self.assertAlmostEqual(point['x'], 0, delta=1e-9)
+        self.assertAlmostEqual(point['y'], 0, delta=1e-9)
+        self.assertEqual(point['kind'], "saddle")
+
+    def test_unequal_opposite_charges(self):
+        # E vanishes where q / r1^2 == 4q / r2^2, i.e. 3 units outside the smaller charge
+        particles = [Particle(0, 0, 1e-9, "proton"), Particle(3, 0, 4e-9, "electron")]
+        null_points = self.finder.find(particles, self.bounds)
+
+        self.assertEqual(len(null_points), 1)
+        point = null_points[0]
+        self.assertAlmostEqual(point['x'], -3, delta=1e-8)
+        self.assertAlmostEqual(point['y'], 0, delta=1e-8)
+        e_x, e_y = point['field']
+        self.assertLess(abs(e_x) + abs(e_y), 1e-6)
+
+    def test_single_charge_has_no_null_point(self):
+        particles = [Particle(1, 1, 1e-9, "proton")]
+        self.assertEqual(self.finder.find(particles, self.bounds), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from electromagnetism import ParticleArrayFile
+from workload_generator import WORKLOADS, generate, write_json
+
+
+class ParticleArrayFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "particles.epa")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_across_chunks(self):
+        triples = list(generate("random", 250, seed=4))
+        with mock.patch.object(ParticleArrayFile, "CHUNK", 64):
+            self.assertEqual(ParticleArrayFile.write(self.filename, triples), 250)
+
+        self.assertTrue(ParticleArrayFile.is_array_file(self.filename))
+        values = ParticleArrayFile.read(self.filename)
+        self.assertEqual([tuple(values[i:i + 3]) for i in range(0, len(values), 3)], triples)
+
+    def test_read_configuration(self):
+        ParticleArrayFile.write(self.filename, [(1.5, -2.0, 3e-9), (0.0, 4.0, -2e-9)])
+        config = ParticleArrayFile.read_configuration(self.filename)
+        self.assertEqual(config['particles'], [
+            {'x': 1.5, 'y': -2.0, 'charge': 3e-9, 'particle_type': "proton"},
+            {'x': 0.0, 'y': 4.0, 'charge': 2e-9, 'particle_type': "electron"},
+        ])
+        self.assertEqual(config['distributions'], [])
+
+    def test_empty_file(self):
+        self.assertEqual(ParticleArrayFile.write(self.filename, []), 0)
+        self.assertEqual(len(ParticleArrayFile.read(self.filename)), 0)
+
+    def test_truncated_file(self):
+        ParticleArrayFile.write(self.filename, [(1.0, 2.0, 3e-9)] * 10)
+        with open(self.filename, 'r+b') as f:
+            f.truncate(os.path.getsize(self.filename) - 5)
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            ParticleArrayFile.read(self.filename)
+
+    def test_bad_magic(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'{"particles": []}    ')
+        self.assertFalse(ParticleArrayFile.is_array_file(self.filename))
+        with self.assertRaisesRegex(ValueError, "Not a particle array file"):
+            ParticleArrayFile.read(self.filename)
+
+
+class WorkloadGeneratorTest(unittest.TestCase):
+    def test_deterministic(self):
+        for kind in WORKLOADS:
+            first = list(generate(kind, 100, seed=7))
+            self.assertEqual(len(first), 100, kind)
+            self.assertEqual(first, list(generate(kind, 100, seed=7)), kind)
+            if kind != "lattice":  # The lattice does not depend on the seed
+                self.assertNotEqual(first, list(generate(kind, 100, seed=8)), kind)
+
+    def test_pairs_are_neutral(self):
+        triples = list(generate("pairs", 100, charge=1e-9))
+        self.assertAlmostEqual(sum(q for _, _, q in triples), 0, delta=1e-20)
+
+    def test_unknown_workload(self):
+        with self.assertRaises(ValueError):
+            list(generate("spiral", 10))
+
+    def test_streamed_json_loads(self):
+        triples = list(generate("lattice", 45, seed=1))
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "lattice.json")
+            self.assertEqual(write_json(filename, iter(triples), {'workload': "lattice"}, chunk=10), 45)
+            with open(filename) as f:
+                config = json.load(f)
+
+        self.assertEqual(config['metadata']['workload'], "lattice")
+        self.assertEqual(len(config['particles']), 45)
+        for particle, (x, y, q) in zip(config['particles'], triples):
+            self.assertEqual((particle['x'], particle['y']), (x, y))
+            self.assertEqual(particle['charge'], abs(q))
+            self.assertEqual(particle['particle_type'], "proton" if q > 0 else "electron")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import cmath
+import math
+import random
+import unittest
+
+from electromagnetism import Particle, ParticleMeshSolver, PhysicsEngine
+
+
+def rms_errors(mesh, direct):
+    """RMS relative error of a list of values or (x, y) tuples."""
+    num = den = 0.0
+    for value, ref in zip(mesh, direct):
+        if not isinstance(ref, tuple):
+            value, ref = (value,), (ref,)
+        num += sum((a - b) ** 2 for a, b in zip(value, ref))
+        den += sum(b * b for b in ref)
+    return math.sqrt(num / den)
+
+
+class ParticleMeshSolverTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        rng = random.Random(11)
+        self.particles = [
+            Particle(rng.uniform(-10, 10), rng.uniform(-8, 8), rng.uniform(1e-9, 5e-9),
+                     rng.choice(("proton", "electron")))
+            for _ in range(300)
+        ]
+        self.points = [(rng.uniform(-10, 10), rng.uniform(-8, 8)) for _ in range(60)]
+
+    def test_fft_round_trip(self):
+        solver = ParticleMeshSolver(self.engine)
+        rng = random.Random(2)
+        grid = [[complex(rng.random(), rng.random()) for _ in range(16)] for _ in range(16)]
+        data = [row[:] for row in grid]
+        solver._fft2(data, inverse=False)
+        solver._fft2(data, inverse=True)
+        for row, original in zip(data, grid):
+            for a, b in zip(row, original):
+                self.assertAlmostEqual(abs(a - b), 0, delta=1e-12)
+
+    def test_fft_matches_dft(self):
+        solver = ParticleMeshSolver(self.engine)
+        values = [complex(i % 3, -i) for i in range(8)]
+        data = values[:]
+        solver._fft(data, inverse=False)
+        for m in range(8):
+            expected = sum(v * cmath.exp(-2j * math.pi * m * t / 8) for t, v in enumerate(values))
+            self.assertAlmostEqual(abs(data[m] - expected), 0, delta=1e-12)
+
+    def test_assignment_conserves_charge_and_dipole(self):
+        for assignment in ParticleMeshSolver.ASSIGNMENTS:
+            solver = ParticleMeshSolver(self.engine, assignment=assignment)
+            solver.solve(self.particles, self.points)
+            for x, y in self.points:
+                stencil = solver._stencil(x, y)
+                self.assertAlmostEqual(sum(w for _, _, w in stencil), 1, delta=1e-12)
+                # The weighted node position is the point itself
+                u = (x - solver.origin[0]) / solver.spacing
+                v = (y - solver.origin[1]) / solver.spacing
+                self.assertAlmostEqual(sum(w * i for i, _, w in stencil), u, delta=1e-9)
+                self.assertAlmostEqual(sum(w * j for _, j, w in stencil), v, delta=1e-9)
+
+    def test_pm_far_field(self):
+        cluster = [Particle(0.3 * math.cos(a), 0.3 * math.sin(a), 1e-9, "proton") for a in range(6)]
+        cluster.append(Particle(0.1, -0.2, 2e-9, "electron"))
+        far = [(15 * math.cos(a / 3), 15 * math.sin(a / 3)) for a in range(18)]
+        for assignment in ParticleMeshSolver.ASSIGNMENTS:
+            solver = ParticleMeshSolver(self.engine, assignment=assignment)
+            mesh = solver.calc_potential_and_field_at_points(cluster, far)
+            direct = self.engine.calc_potential_and_field_at_points(cluster, far)
+            self.assertLess(rms_errors([m[0] for m in mesh], [d[0] for d in direct]), 1e-2)
+            self.assertLess(rms_errors([m[1:] for m in mesh], [d[1:] for d in direct]), 2e-2)
+
+    def test_p3m_near_field(self):
+        solver = ParticleMeshSolver(self.engine, p3m=True)
+        potentials = solver.calc_potential_at_points(self.particles, self.points)
+        fields = solver.field_at_points(self.points)
+        self.assertLess(rms_errors(potentials, self.engine.calc_potential_at_points(self.particles, self.points)), 2e-3)
+        self.assertLess(rms_errors(fields, self.engine.calc_field_at_points(self.particles, self.points)), 1e-3)
+
+    def test_accuracy_report(self):
+        report = ParticleMeshSolver(self.engine, p3m=True).accuracy_report(self.particles, self.points)
+        self.assertEqual(report['points_compared'], len(self.points))
+        self.assertLess(report['field_rms_rel_error'], 1e-3)
+
+    def test_probe_on_charge(self):
+        solver = ParticleMeshSolver(self.engine, p3m=True)
+        target = (self.particles[0].x, self.particles[0].y)
+        self.assertIsNone(solver.calc_potential_at_points(self.particles, [target])[0])
+
+    def test_preferred_only_for_large_problems(self):
+        self.assertFalse(ParticleMeshSolver.is_preferred(300, 300))
+        self.assertTrue(ParticleMeshSolver.is_preferred(20000, 200))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ParticleMeshSolver(self.engine, assignment="ngp")
+        with self.assertRaises(ValueError):
+            ParticleMeshSolver(self.engine, grid_size=48)
+
+
+if __name__ == "__main__":
+    unittest.main()
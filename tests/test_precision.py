@@ -0,0 +1,80 @@
+import math
+import sys
+import unittest
+
+from electromagnetism import Particle, PhysicsEngine
+from workload_generator import generate
+
+
+def particles_for(kind, n, seed=1):
+    return [Particle(x, y, abs(q), "proton" if q > 0 else "electron")
+            for x, y, q in generate(kind, n, seed=seed)]
+
+
+class PrecisionModeTest(unittest.TestCase):
+    POINTS = [(0.3, 0.7), (5.1, -2.2), (-11.0, 4.0)]
+
+    def setUp(self):
+        self.engines = {p: PhysicsEngine(precision=p) for p in PhysicsEngine.PRECISIONS}
+
+    def potential_terms(self, particles, x, y):
+        k = self.engines["double"].k
+        return [k * p.charge * p.sign / math.sqrt((x - p.x)**2 + (y - p.y)**2) for p in particles]
+
+    def test_compensated_is_correctly_rounded(self):
+        particles = particles_for("pairs", 2000)
+        for x, y in self.POINTS:
+            v, _ = self.engines["compensated"].calc_electric_potential(particles, x, y)
+            self.assertEqual(v, math.fsum(self.potential_terms(particles, x, y)))
+
+    def test_double_within_summation_bound(self):
+        # Recursive summation error is at most (n - 1) * eps * sum(|terms|)
+        particles = particles_for("pairs", 2000)
+        eps = sys.float_info.epsilon / 2
+        for x, y in self.POINTS:
+            terms = self.potential_terms(particles, x, y)
+            v, _ = self.engines["double"].calc_electric_potential(particles, x, y)
+            exact = math.fsum(terms)
+            bound = (len(terms) - 1) * eps * math.fsum(abs(t) for t in terms)
+            self.assertLessEqual(abs(v - exact), bound)
+            self.assertEqual(v, sum(terms))
+
+    def test_single_point_modes_agree_on_benign_workload(self):
+        particles = particles_for("random", 500)
+        for x, y in self.POINTS:
+            (e_x, e_y, _, _), _ = self.engines["compensated"].calc_electric_field(particles, x, y)
+            (f_x, f_y, _, _), _ = self.engines["compensated"].calc_force_on_charge(particles, 2e-9, x, y)
+            for precision in ("float32", "double"):
+                (d_x, d_y, _, _), _ = self.engines[precision].calc_electric_field(particles, x, y)
+                self.assertLess(math.hypot(d_x - e_x, d_y - e_y), 1e-12 * math.hypot(e_x, e_y))
+                (g_x, g_y, _, _), _ = self.engines[precision].calc_force_on_charge(particles, 2e-9, x, y)
+                self.assertLess(math.hypot(g_x - f_x, g_y - f_y), 1e-12 * math.hypot(f_x, f_y))
+
+    def test_float32_batched_error(self):
+        particles = particles_for("random", 2000)
+        reference = self.engines["compensated"].calc_potential_and_field_at_points(particles, self.POINTS)
+        rounded = self.engines["float32"].calc_potential_and_field_at_points(particles, self.POINTS)
+        v_scale = max(abs(r[0]) for r in reference)
+        e_scale = max(math.hypot(r[1], r[2]) for r in reference)
+        for value, ref in zip(rounded, reference):
+            self.assertLess(abs(value[0] - ref[0]), 1e-4 * v_scale)
+            self.assertLess(math.hypot(value[1] - ref[1], value[2] - ref[2]), 1e-4 * e_scale)
+        # Float32 storage rounds the positions, so it must differ from double
+        self.assertNotEqual(rounded, self.engines["double"].calc_potential_and_field_at_points(particles, self.POINTS))
+
+    def test_unknown_precision(self):
+        with self.assertRaises(ValueError):
+            PhysicsEngine(precision="half")
+
+    def test_every_mode_has_a_label(self):
+        self.assertEqual(set(PhysicsEngine.PRECISION_LABELS), set(PhysicsEngine.PRECISIONS))
+
+    def test_float32_is_limited_to_overlays(self):
+        self.assertNotIn("float32", PhysicsEngine.CALCULATION_PRECISIONS)
+        self.assertIn("float32", PhysicsEngine.OVERLAY_PRECISIONS)
+        for modes in (PhysicsEngine.CALCULATION_PRECISIONS, PhysicsEngine.OVERLAY_PRECISIONS):
+            self.assertLessEqual(set(modes), set(PhysicsEngine.PRECISIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
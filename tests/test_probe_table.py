@@ -0,0 +1,86 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from electromagnetism import Particle, PhysicsEngine, ProbeTable
+
+
+class ParsePointsTest(unittest.TestCase):
+    def test_separators_header_and_extra_columns(self):
+        text = "x,y,V (V)\n1,2,3.5\n3 4\n5\t6\n\n7;8\n-1e-3 , 2.5e2\n"
+        self.assertEqual(
+            ProbeTable.parse_points(text),
+            [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0), (7.0, 8.0), (-0.001, 250.0)],
+        )
+
+    def test_malformed_line_names_the_line(self):
+        with self.assertRaises(ValueError) as caught:
+            ProbeTable.parse_points("1,2\n3\n")
+        self.assertIn("Line 2", str(caught.exception))
+        with self.assertRaises(ValueError):
+            ProbeTable.parse_points("1,2\na,b\n")
+
+    def test_sweeps(self):
+        self.assertEqual(ProbeTable.line_sweep(0, 0, 3, -3, 4), [(0, 0), (1, -1), (2, -2), (3, -3)])
+        self.assertEqual(ProbeTable.line_sweep(1, 2, 5, 5, 1), [(1, 2)])
+        grid = ProbeTable.grid_sweep(0, 0, 2, 1, 3, 2)
+        self.assertEqual(grid, [(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)])
+
+
+class ProbeTableTest(unittest.TestCase):
+    def setUp(self):
+        particles = [Particle(0, 0, 1e-9, "proton"), Particle(4, 0, 2e-9, "electron")]
+        self.points = [(0, 0), (1, 1), (2, 0), (-3, 2), (4, 5)]
+        results = PhysicsEngine().calc_potential_and_field_at_points(particles, self.points)
+        self.table = ProbeTable(self.points, results)
+
+    def test_rows(self):
+        self.assertEqual(self.table.rows[0][2:], (None,) * 5)  # On a charge
+        x, y, v, e_x, e_y, magnitude, angle = self.table.rows[2]
+        self.assertEqual((x, y), (2, 0))
+        self.assertAlmostEqual(magnitude, abs(e_x))
+        self.assertAlmostEqual(angle, 0.0)  # Pushed from + toward -
+
+    def test_sort_puts_undefined_last(self):
+        self.table.sort(5)
+        magnitudes = [self.table.rows[i][5] for i in self.table.order]
+        self.assertIsNone(magnitudes[-1])
+        self.assertEqual(magnitudes[:-1], sorted(magnitudes[:-1]))
+
+        self.table.sort(5, descending=True)
+        magnitudes = [self.table.rows[i][5] for i in self.table.order]
+        self.assertIsNone(magnitudes[-1])
+        self.assertEqual(magnitudes[:-1], sorted(magnitudes[:-1], reverse=True))
+        self.assertEqual((self.table.sort_column, self.table.descending), (5, True))
+
+    def test_pages_follow_the_sort_order(self):
+        table = ProbeTable([(i, 0) for i in range(5)], [(float(i), 0.0, 0.0) for i in range(5)])
+        table.PAGE_SIZE = 2
+        table.sort(2, descending=True)
+        self.assertEqual(table.page_count(), 3)
+        self.assertEqual([number for number, _ in table.page(0)], [5, 4])
+        self.assertEqual([number for number, _ in table.page(2)], [1])
+
+    def test_csv_export_round_trips(self):
+        self.table.sort(2)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "probes.csv")
+            self.table.write_csv(filename)
+            with open(filename, newline='') as f:
+                rows = list(csv.reader(f))
+            with open(filename) as f:
+                reimported = ProbeTable.parse_points(f.read())
+
+        self.assertEqual(tuple(rows[0]), ProbeTable.COLUMNS)
+        self.assertEqual(len(rows), len(self.points) + 1)
+        self.assertEqual(rows[-1][2:], [""] * 5)  # Undefined row, sorted last
+        for row, i in zip(rows[1:], self.table.order):
+            expected = self.table.rows[i]
+            if expected[2] is not None:
+                self.assertEqual(float(row[2]), expected[2])
+        self.assertEqual(reimported, [self.points[i] for i in self.table.order])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from electromagnetism import Profiler, env_flag
+
+
+class EnvFlagTest(unittest.TestCase):
+    def test_enabled_values(self):
+        for value in ("1", "true", "YES", " yes "):
+            with mock.patch.dict(os.environ, {"ELECTROSTATICS_PROFILE": value}):
+                self.assertTrue(env_flag("ELECTROSTATICS_PROFILE"), value)
+
+    def test_disabled_values(self):
+        for value in ("", "0", "false", "no", "off"):
+            with mock.patch.dict(os.environ, {"ELECTROSTATICS_PROFILE": value}):
+                self.assertFalse(env_flag("ELECTROSTATICS_PROFILE"), value)
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(env_flag("ELECTROSTATICS_PROFILE"))
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_snapshot_aggregates_calls(self):
+        profiler = Profiler(enabled=True)
+        profiler.record("f", "engine", 0.002, 10, 1)
+        profiler.record("f", "engine", 0.004, 10, 1)
+        profiler.record("g", "canvas", 0.001, 0, 0)
+
+        rows = profiler.snapshot()
+        self.assertEqual([row['name'] for row in rows], ["f", "g"])
+        self.assertEqual(rows[0]['calls'], 2)
+        self.assertAlmostEqual(rows[0]['mean_seconds'], 0.003)
+        self.assertAlmostEqual(rows[0]['max_seconds'], 0.004)
+        self.assertEqual(rows[0]['particles'], 20)
+
+    def test_prometheus_export(self):
+        profiler = Profiler(enabled=True)
+        profiler.record("f", "engine", 0.5, 3, 2)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "stats.prom")
+            profiler.export_prometheus(filename)
+            with open(filename) as f:
+                text = f.read()
+        self.assertIn('electrostatics_calls_total{category="engine",name="f"} 1', text)
+        self.assertIn("# TYPE electrostatics_seconds_total counter", text)
+
+    def test_concurrent_records_are_not_lost(self):
+        profiler = Profiler(enabled=True)
+        threads_count, calls = 8, 2000
+
+        def work(index):
+            for i in range(calls):
+                profiler.record(f"f{i % 5}", "engine", 0.001, 1, 2)
+                if i % 100 == 0:
+                    profiler.snapshot()  # Reading while others write
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        rows = profiler.snapshot()
+        self.assertEqual(sum(row['calls'] for row in rows), threads_count * calls)
+        self.assertEqual(sum(row['points'] for row in rows), 2 * threads_count * calls)
+
+        profiler.reset()
+        self.assertEqual(profiler.snapshot(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+
+from electromagnetism import (
+    Conductor,
+    ConductorSolver,
+    LineCharge,
+    Particle,
+    PhysicsEngine,
+    SuperpositionCache,
+)
+
+
+class SuperpositionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = PhysicsEngine()
+        self.particles = [
+            Particle(-2, 0, 1e-9, "proton"),
+            Particle(2, 1, 3e-9, "electron"),
+            Particle(0, -3, 2e-9, "proton"),
+        ]
+        self.points = [(0, 0), (1, 1), (-3, 2), (-2, 0)]
+
+    def assertMatchesEngine(self, cache, particles):
+        potentials, fields = cache.values()
+        expected = self.engine.calc_potential_and_field_at_points(particles, self.points)
+        for v, e, ref in zip(potentials, fields, expected):
+            if ref is None:
+                self.assertIsNone(v)
+                continue
+            self.assertAlmostEqual(v, ref[0], delta=1e-9 * abs(ref[0]))
+            self.assertAlmostEqual(e[0], ref[1], delta=1e-9 * abs(ref[1]) + 1e-12)
+            self.assertAlmostEqual(e[1], ref[2], delta=1e-9 * abs(ref[2]) + 1e-12)
+        self.assertAlmostEqual(
+            cache.energy, self.engine.calc_potential_energy(particles),
+            delta=1e-9 * abs(cache.energy)
+        )
+
+    def test_set_charge_matches_full_sum(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        self.particles[1].charge = 5e-9
+        cache.set_charge(1, -5e-9)
+        self.assertMatchesEngine(cache, self.particles)
+
+    def test_move_source_matches_full_sum(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        cache.move_source(0, 1.5, -0.5)
+        self.assertMatchesEngine(cache, self.particles)
+
+    def test_sweep_matches_full_sum(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        sweep = cache.sweep(2, [1e-9, 4e-9])
+        for i, q in enumerate((1e-9, 4e-9)):
+            self.particles[2].charge = q
+            expected = self.engine.calc_potential_at_points(self.particles, self.points)
+            for v, ref in zip(sweep['potential'][i], expected):
+                if ref is None:
+                    self.assertIsNone(v)
+                else:
+                    self.assertAlmostEqual(v, ref, delta=1e-9 * abs(ref))
+            self.assertAlmostEqual(
+                sweep['energy'][i], self.engine.calc_potential_energy(self.particles),
+                delta=1e-9 * abs(sweep['energy'][i])
+            )
+
+    def test_move_without_energy_tracking(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points, track_energy=False)
+        self.assertIsNone(cache.energy)
+        cache.move_source(1, -1, -1)
+        _, fields = cache.values()
+        expected = self.engine.calc_field_at_points(self.particles, self.points)
+        for e, ref in zip(fields, expected):
+            if ref is None:
+                self.assertIsNone(e)
+                continue
+            self.assertAlmostEqual(e[0], ref[0], delta=1e-9 * abs(ref[0]) + 1e-12)
+            self.assertAlmostEqual(e[1], ref[1], delta=1e-9 * abs(ref[1]) + 1e-12)
+        self.assertIsNone(cache.energy)
+
+    def test_sweep_refuses_induced_charges(self):
+        induced = ConductorSolver(self.engine).solve(
+            [Conductor("circle", [(0, 5)], 0.0, radius=1)], self.particles
+        )
+        cache = SuperpositionCache(self.engine, self.particles + induced, self.points)
+        with self.assertRaises(ValueError):
+            cache.sweep(0, [2e-9])
+
+    def test_totals_only_cache_matches_full_sum(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points, keep_basis=False)
+        self.assertEqual(cache.potential_basis, [])
+        self.particles[2].charge = 6e-9
+        cache.set_charge(2, 6e-9)
+        cache.move_source(0, 1, 1)  # Onto a probe
+        self.assertMatchesEngine(cache, self.particles)
+        cache.move_source(0, 0.5, 2)  # And off it again
+        self.assertMatchesEngine(cache, self.particles)
+
+    def test_sync_applies_moves_and_charge_changes(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        self.particles[0].x, self.particles[0].y = 3, 3
+        self.particles[1].charge = 1e-9
+        self.assertTrue(cache.sync(self.particles))
+        self.assertMatchesEngine(cache, self.particles)
+
+    def test_sync_rejects_a_different_source_list(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        added = self.particles + [Particle(4, 4, 1e-9, "proton")]
+        self.assertFalse(cache.sync(added))
+        self.assertFalse(cache.sync(self.particles[1:]))
+        self.assertFalse(cache.sync(self.particles[::-1]))
+        self.particles[0].x = 5
+        self.particles[1].x = 5
+        self.assertFalse(cache.sync(self.particles, max_changes=1))
+        self.engine.precision = "compensated"
+        self.assertFalse(cache.sync(self.particles))
+
+    def test_touching_distribution_gives_infinite_energy(self):
+        line = LineCharge(-1, 0, 1, 0, 1e-9, "proton")
+        sources = [line, Particle(0, 2, 1e-9, "proton")]
+        cache = SuperpositionCache(self.engine, sources, self.points)
+        cache.move_source(1, 0, 0)  # Onto the line
+        self.assertEqual(cache.energy, self.engine.calc_potential_energy(sources))
+        self.assertEqual(cache.energy, float("inf"))
+        sweep = cache.sweep(1, [1e-9, -1e-9])
+        self.assertEqual(sweep['energy'], [float("inf"), float("-inf")])
+        cache.move_source(1, 0, 2)
+        self.assertAlmostEqual(
+            cache.energy, self.engine.calc_potential_energy(sources),
+            delta=1e-9 * abs(cache.energy)
+        )
+
+    def test_drag_energy_delta_after_external_edits(self):
+        cache = SuperpositionCache(self.engine, self.particles, self.points)
+        # Edits made without going through the cache
+        self.particles[1].charge = 7e-9
+        self.particles[2].x = 1
+        self.assertTrue(cache.sync(self.particles))
+        before = self.engine.calc_potential_energy(self.particles)
+        energy = cache.energy
+        cache.move_source(0, -1, 2)
+        self.assertAlmostEqual(
+            cache.energy - energy, self.engine.calc_potential_energy(self.particles) - before,
+            delta=1e-9 * abs(before)
+        )
+
+        # A source added behind the cache's back cannot be synced
+        self.particles.append(Particle(0, 2, 1e-9, "electron"))
+        self.assertFalse(cache.sync(self.particles))
+
+
+if __name__ == "__main__":
+    unittest.main()